@@ -5,6 +5,9 @@
 
 set -e  # Exit on any error
 
+# Parsers are silent by default; keep their console summaries for this CLI
+export PARSER_VERBOSE="${PARSER_VERBOSE:-1}"
+
 # Colors for output
 RED='\033[0;31m'
 GREEN='\033[0;32m'
@@ -25,6 +28,7 @@ show_help() {
     echo "Available API Types:"
     echo "  prizepicks-nfl    - PrizePicks NFL projections"
     echo "  prizepicks-cfb    - PrizePicks College Football projections"
+    echo "  lines             - PrizePicks NFL/CFB + Underdog lines, fetched concurrently"
     echo "  nfl-stats         - NFL Game IDs (requires: year week type)"
     echo "  nfl-boxscore      - NFL Player Stats (requires: event_id)"
     echo "  nfl-week-boxscores - ALL NFL Player Stats for a week (requires: year week type)"
@@ -34,6 +38,7 @@ show_help() {
     echo "Examples:"
     echo "  ./generate_api_data.sh prizepicks-nfl"
     echo "  ./generate_api_data.sh prizepicks-cfb"
+    echo "  ./generate_api_data.sh lines"
     echo "  ./generate_api_data.sh nfl-stats 2023 1 2"
     echo "  ./generate_api_data.sh nfl-boxscore 401220225"
     echo "  ./generate_api_data.sh nfl-week-boxscores 2023 1 2"
@@ -64,32 +69,14 @@ show_help() {
 run_prizepicks_nfl() {
     echo -e "${BLUE}🏈 Fetching PrizePicks NFL data...${NC}"
     python3 -c "
-from src.api_client import fetch_prizepicks_data
-result = fetch_prizepicks_data('nfl')
-print(f'✅ Success: {result[\"success\"]}, Records: {result.get(\"record_count\", 0)}')
-"
-    
-    echo -e "${BLUE}📊 Parsing PrizePicks NFL data...${NC}"
-    python3 -c "
-import json
-import os
-from pathlib import Path
-from parsers.parse_prizepicks import parse_prizepicks_data
-
-# Create parsed_data directory
-Path('parsed_data/prizepicks').mkdir(parents=True, exist_ok=True)
+from src.pipeline import DataPipeline
 
-# Parse the raw data
-try:
-    parsed_data = parse_prizepicks_data('api_data/prizepicks/nfl_projections.json')
-    
-    # Save parsed data to file
-    with open('parsed_data/prizepicks/nfl_parsed.json', 'w') as f:
-        json.dump(parsed_data, f, indent=2, ensure_ascii=False)
-    
-    print(f'📊 Parsed {len(parsed_data)} NFL projections → parsed_data/prizepicks/nfl_parsed.json')
-except Exception as e:
-    print(f'❌ Parsing error: {e}')
+# Fetch, parse and archive in one process (raw/parsed JSON written in the background)
+with DataPipeline(route=False) as pipeline:
+    result = pipeline.run_prizepicks('nfl')
+print(f'✅ Success: {result[\"success\"]}, Records: {result[\"record_count\"]}')
+if not result['success']:
+    print(f'❌ Error: {result[\"error\"]}')
 "
 }
 
@@ -97,35 +84,23 @@ except Exception as e:
 run_prizepicks_cfb() {
     echo -e "${BLUE}🏈 Fetching PrizePicks College Football data...${NC}"
     python3 -c "
-from src.api_client import fetch_prizepicks_data
-result = fetch_prizepicks_data('cfb')
-print(f'✅ Success: {result[\"success\"]}, Records: {result.get(\"record_count\", 0)}')
-"
-    
-    echo -e "${BLUE}📊 Parsing PrizePicks CFB data...${NC}"
-    python3 -c "
-import json
-import os
-from pathlib import Path
-from parsers.parse_prizepicks import parse_prizepicks_data
-
-# Create parsed_data directory
-Path('parsed_data/prizepicks').mkdir(parents=True, exist_ok=True)
+from src.pipeline import DataPipeline
 
-# Parse the raw data
-try:
-    parsed_data = parse_prizepicks_data('api_data/prizepicks/cfb_projections.json')
-    
-    # Save parsed data to file
-    with open('parsed_data/prizepicks/cfb_parsed.json', 'w') as f:
-        json.dump(parsed_data, f, indent=2, ensure_ascii=False)
-    
-    print(f'📊 Parsed {len(parsed_data)} CFB projections → parsed_data/prizepicks/cfb_parsed.json')
-except Exception as e:
-    print(f'❌ Parsing error: {e}')
+# Fetch, parse and archive in one process (raw/parsed JSON written in the background)
+with DataPipeline(route=False) as pipeline:
+    result = pipeline.run_prizepicks('cfb')
+print(f'✅ Success: {result[\"success\"]}, Records: {result[\"record_count\"]}')
+if not result['success']:
+    print(f'❌ Error: {result[\"error\"]}')
 "
 }
 
+# Function to poll every line source at once
+run_lines() {
+    echo -e "${BLUE}🏈 Fetching PrizePicks NFL/CFB and Underdog lines concurrently...${NC}"
+    python3 src/line_poller.py --once --no-route
+}
+
 # Function to run NFL Stats
 run_nfl_stats() {
     local year=${1:-2023}
@@ -134,34 +109,14 @@ run_nfl_stats() {
     
     echo -e "${BLUE}🏈 Fetching NFL Stats data (Year: $year, Week: $week, Type: $type)...${NC}"
     python3 -c "
-from src.api_client import fetch_nfl_game_ids
-result = fetch_nfl_game_ids($year, $week, $type)
-print(f'✅ Success: {result[\"success\"]}, Games: {result.get(\"game_count\", 0)}')
-"
-    
-    echo -e "${BLUE}📊 Parsing NFL Game IDs data...${NC}"
-    python3 -c "
-import json
-import os
-from pathlib import Path
-from parsers.parse_nfl_game_ids import parse_nfl_game_ids
-
-# Create parsed_data directory
-Path('parsed_data/nfl_stats').mkdir(parents=True, exist_ok=True)
+from src.pipeline import DataPipeline
 
-# Parse the raw data
-try:
-    input_file = f'api_data/nfl_stats/games_{$year}_week{$week}_type{$type}.json'
-    parsed_data = parse_nfl_game_ids(input_file)
-    
-    # Save parsed data to file
-    output_file = f'parsed_data/nfl_stats/games_{$year}_week{$week}_type{$type}_parsed.json'
-    with open(output_file, 'w') as f:
-        json.dump(parsed_data, f, indent=2, ensure_ascii=False)
-    
-    print(f'📊 Parsed {len(parsed_data[\"game_ids\"])} game IDs → {output_file}')
-except Exception as e:
-    print(f'❌ Parsing error: {e}')
+# Fetch, parse and archive in one process (raw/parsed JSON written in the background)
+with DataPipeline(route=False) as pipeline:
+    result = pipeline.run_nfl_game_ids($year, $week, $type)
+print(f'✅ Success: {result[\"success\"]}, Records: {result[\"record_count\"]}')
+if not result['success']:
+    print(f'❌ Error: {result[\"error\"]}')
 "
 }
 
@@ -178,34 +133,14 @@ run_nfl_boxscore() {
     
     echo -e "${BLUE}🏈 Fetching NFL Boxscore Data (Event ID: $event_id)...${NC}"
     python3 -c "
-from src.api_client import fetch_nfl_boxscore
-result = fetch_nfl_boxscore('$event_id')
-print(f'✅ Success: {result[\"success\"]}, Players: {result.get(\"players_count\", 0)}')
-"
-    
-    echo -e "${BLUE}📊 Parsing NFL Boxscore data...${NC}"
-    python3 -c "
-import json
-import os
-from pathlib import Path
-from parsers.parse_nfl_boxscore import parse_nfl_boxscore
-
-# Create parsed_data directory
-Path('parsed_data/nfl_boxscore').mkdir(parents=True, exist_ok=True)
+from src.pipeline import DataPipeline
 
-# Parse the raw data
-try:
-    input_file = 'api_data/nfl_boxscore/boxscore_$event_id.json'
-    parsed_data = parse_nfl_boxscore(input_file)
-    
-    # Save parsed data to file
-    output_file = 'parsed_data/nfl_boxscore/boxscore_${event_id}_parsed.json'
-    with open(output_file, 'w') as f:
-        json.dump(parsed_data, f, indent=2, ensure_ascii=False)
-    
-    print(f'📊 Parsed {len(parsed_data)} player records → {output_file}')
-except Exception as e:
-    print(f'❌ Parsing error: {e}')
+# Fetch, parse and archive in one process (raw/parsed JSON written in the background)
+with DataPipeline(route=False) as pipeline:
+    result = pipeline.run_nfl_boxscore('$event_id')
+print(f'✅ Success: {result[\"success\"]}, Records: {result[\"record_count\"]}')
+if not result['success']:
+    print(f'❌ Error: {result[\"error\"]}')
 "
 }
 
@@ -235,42 +170,39 @@ print(f'✅ Week Success: {result[\"success\"]}, Games Processed: {result.get(\"
     
     echo -e "${BLUE}📊 Parsing NFL Week Boxscores data...${NC}"
     python3 -c "
-import json
 import os
 import glob
 from pathlib import Path
-from parsers.parse_nfl_boxscore import parse_nfl_boxscore
+from parsers.parse_nfl_boxscore import parse_boxscore_directory
+from parsers.json_backend import ARCHIVE_COMPRESSION, dump_json_file
 
 # Create parsed_data directory
 Path('parsed_data/nfl_boxscore').mkdir(parents=True, exist_ok=True)
 
-# Find all boxscore files for this week and parse them
+# Parse all boxscore files in parallel (BOXSCORE_WORKERS overrides the CPU count)
 try:
-    boxscore_pattern = 'api_data/nfl_boxscore/boxscore_*.json'
-    boxscore_files = glob.glob(boxscore_pattern)
+    workers = int(os.getenv('BOXSCORE_WORKERS', '0')) or None
     
     all_parsed_data = []
     files_parsed = 0
+    parse_errors = []
     
-    for boxscore_file in boxscore_files:
-        try:
-            parsed_data = parse_nfl_boxscore(boxscore_file)
-            all_parsed_data.extend(parsed_data)
-            files_parsed += 1
-            
-            # Also save individual parsed file
-            filename = os.path.basename(boxscore_file).replace('.json', '_parsed.json')
-            output_file = f'parsed_data/nfl_boxscore/{filename}'
-            with open(output_file, 'w') as f:
-                json.dump(parsed_data, f, indent=2, ensure_ascii=False)
-                
-        except Exception as e:
-            print(f'⚠️ Error parsing {boxscore_file}: {e}')
+    for boxscore_file, parsed_data in parse_boxscore_directory('api_data/nfl_boxscore', workers=workers,
+                                                              ordered=True, errors=parse_errors):
+        all_parsed_data.extend(parsed_data)
+        files_parsed += 1
+        
+        # Also save individual parsed file
+        filename = os.path.basename(boxscore_file).replace('.json', '_parsed.json')
+        output_file = f'parsed_data/nfl_boxscore/{filename}'
+        dump_json_file(output_file, parsed_data, compression=ARCHIVE_COMPRESSION)
+    
+    for parse_error in parse_errors:
+        print(f'⚠️ Error parsing {parse_error}')
     
     # Save combined week data
     week_output_file = f'parsed_data/nfl_boxscore/week_{$year}_week{$week}_type{$type}_all_parsed.json'
-    with open(week_output_file, 'w') as f:
-        json.dump(all_parsed_data, f, indent=2, ensure_ascii=False)
+    week_output_file = dump_json_file(week_output_file, all_parsed_data, compression=ARCHIVE_COMPRESSION)
     
     print(f'📊 Parsed {len(all_parsed_data)} total player records from {files_parsed} games')
     print(f'📊 Combined data → {week_output_file}')
@@ -288,34 +220,14 @@ run_cfb_stats() {
     
     echo -e "${BLUE}🏈 Fetching College Football Data (Year: $year, Week: $week, Season: $season_type)...${NC}"
     python3 -c "
-from src.api_client import fetch_cfb_player_data
-result = fetch_cfb_player_data($year, $week, '$season_type')
-print(f'✅ Success: {result[\"success\"]}, Games: {result.get(\"game_count\", 0)}')
-"
-    
-    echo -e "${BLUE}📊 Parsing CFB Stats data...${NC}"
-    python3 -c "
-import json
-import os
-from pathlib import Path
-from parsers.parse_cfb_stats import parse_cfb_player_stats
+from src.pipeline import DataPipeline
 
-# Create parsed_data directory
-Path('parsed_data/cfb_stats').mkdir(parents=True, exist_ok=True)
-
-# Parse the raw data
-try:
-    input_file = 'api_data/cfb_stats/players_${year}_week${week}_${season_type}.json'
-    parsed_data = parse_cfb_player_stats(input_file)
-    
-    # Save parsed data to file
-    output_file = 'parsed_data/cfb_stats/players_${year}_week${week}_${season_type}_parsed.json'
-    with open(output_file, 'w') as f:
-        json.dump(parsed_data, f, indent=2, ensure_ascii=False)
-    
-    print(f'📊 Parsed {len(parsed_data)} player records → {output_file}')
-except Exception as e:
-    print(f'❌ Parsing error: {e}')
+# Fetch, parse and archive in one process (raw/parsed JSON written in the background)
+with DataPipeline(route=False) as pipeline:
+    result = pipeline.run_cfb_stats($year, $week, '$season_type')
+print(f'✅ Success: {result[\"success\"]}, Records: {result[\"record_count\"]}')
+if not result['success']:
+    print(f'❌ Error: {result[\"error\"]}')
 "
 }
 
@@ -360,6 +272,9 @@ case "$1" in
     "prizepicks-cfb")
         run_prizepicks_cfb
         ;;
+    "lines")
+        run_lines
+        ;;
     "nfl-stats")
         if [ $# -lt 4 ]; then
             echo -e "${RED}❌ Error: nfl-stats requires 3 parameters: year week type${NC}"
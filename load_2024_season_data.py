@@ -21,6 +21,7 @@ sys.path.append('.')
 
 from src.database.parser_integration import bulk_load_parsed_directory
 from src.database.connection import cursor_context
+from src.backfill import BackfillEngine
 
 
 class Season2024Loader:
@@ -28,9 +29,8 @@ class Season2024Loader:
     
     def __init__(self):
         self.progress_file = 'data_loading_progress.json'
+        self.checkpoint_file = 'backfill_progress.json'  # job-level backfill checkpoint
         self.delay_between_calls = 2  # seconds between API calls
-        self.delay_between_weeks = 5  # seconds between weeks
-        self.max_retries = 3
         
         # 2024 season parameters
         self.nfl_weeks = list(range(1, 19))  # Weeks 1-18
@@ -208,7 +208,7 @@ class Season2024Loader:
         print(f"📅 NFL Weeks: {len(self.nfl_weeks)} weeks (1-18) - Player boxscore stats")
         print(f"📅 CFB Weeks: {len(self.cfb_weeks)} weeks (1-15) - Player game stats")
         print(f"🚫 PrizePicks: EXCLUDED (betting lines not needed for historical analysis)")
-        print(f"⏱️  Estimated time: ~45-60 minutes")
+        print(f"⏱️  Estimated time: bounded by API rate budgets (weeks and games are fetched concurrently)")
         print()
         
         # Get initial database stats
@@ -219,51 +219,22 @@ class Season2024Loader:
         print()
         
         start_time = time.time()
-        total_weeks = len(self.nfl_weeks) + len(self.cfb_weeks)
-        completed_weeks = len(self.progress['nfl_completed']) + len(self.progress['cfb_completed'])
         
         try:
-            # Process NFL weeks
-            print("🏈 Processing NFL weeks...")
-            for week in self.nfl_weeks:
-                print(f"\n📅 NFL Week {week}/{max(self.nfl_weeks)} ({completed_weeks + 1}/{total_weeks} total)")
-                
-                retry_count = 0
-                while retry_count < self.max_retries:
-                    if self.fetch_nfl_week_data(week):
-                        completed_weeks += 1
-                        break
-                    else:
-                        retry_count += 1
-                        if retry_count < self.max_retries:
-                            print(f"🔄 Retrying NFL Week {week} (attempt {retry_count + 1}/{self.max_retries})")
-                            time.sleep(self.delay_between_calls * 2)
-                        else:
-                            print(f"❌ Failed to fetch NFL Week {week} after {self.max_retries} attempts")
-                
-                self.save_progress()
-                time.sleep(self.delay_between_weeks)
+            # Every week and game is its own job; providers run side by side within their rate budgets
+            engine = BackfillEngine(self.checkpoint_file, route=False)
+            engine.add_nfl_season(self.year, [w for w in self.nfl_weeks if w not in self.progress['nfl_completed']])
+            engine.add_cfb_season(self.year, [w for w in self.cfb_weeks if w not in self.progress['cfb_completed']])
+            backfill_result = engine.run()
+            self.progress['total_api_calls'] += backfill_result['completed'] + backfill_result['failed']
             
-            # Process CFB weeks
-            print(f"\n🎓 Processing CFB weeks...")
+            for week in self.nfl_weeks:
+                if week not in self.progress['nfl_completed'] and engine.is_week_complete('nfl_week', self.year, week, 2):
+                    self.progress['nfl_completed'].append(week)
             for week in self.cfb_weeks:
-                print(f"\n📅 CFB Week {week}/{max(self.cfb_weeks)} ({completed_weeks + 1}/{total_weeks} total)")
-                
-                retry_count = 0
-                while retry_count < self.max_retries:
-                    if self.fetch_cfb_week_data(week):
-                        completed_weeks += 1
-                        break
-                    else:
-                        retry_count += 1
-                        if retry_count < self.max_retries:
-                            print(f"🔄 Retrying CFB Week {week} (attempt {retry_count + 1}/{self.max_retries})")
-                            time.sleep(self.delay_between_calls * 2)
-                        else:
-                            print(f"❌ Failed to fetch CFB Week {week} after {self.max_retries} attempts")
-                
-                self.save_progress()
-                time.sleep(self.delay_between_weeks)
+                if week not in self.progress['cfb_completed'] and engine.is_week_complete('cfb_week', self.year, week, 'regular'):
+                    self.progress['cfb_completed'].append(week)
+            self.save_progress()
             
             # Load all data into database
             print(f"\n" + "=" * 60)
@@ -317,6 +288,7 @@ def main():
         response = input("Continue from where you left off? (y/n): ").lower().strip()
         if response != 'y':
             print("Starting fresh...")
+            Path(loader.checkpoint_file).unlink(missing_ok=True)
             loader.progress = {
                 'nfl_completed': [],
                 'cfb_completed': [],
@@ -3,11 +3,15 @@ Football Prop Insights - Data Parsing Module
 
 This module contains parsers for extracting structured data from various football APIs:
 - PrizePicks NFL projections
+- Underdog Fantasy over/under lines
 - College Football player statistics  
 - NFL game IDs and boxscore data
 
 Each parser accepts JSON data and returns standardized Python dictionaries
-ready for database insertion and analysis.
+ready for database insertion and analysis. Parsers are silent by default and
+record counters, timings and error codes in a ParseStats object; pass
+verbose=True, call set_parser_verbose(True) or set PARSER_VERBOSE=1 for
+console summaries.
 
 ## Testing
 
@@ -17,10 +21,40 @@ Use `test_all_parsers.py` for comprehensive manual validation:
 Or run individual parser test scripts in each module.
 """
 
-from .parse_prizepicks import parse_prizepicks_data
-from .parse_cfb_stats import parse_cfb_player_stats
+from .parse_prizepicks import (
+    parse_prizepicks_data,
+    iter_prizepicks_records,
+    build_prizepicks_snapshot,
+    diff_prizepicks_board,
+    load_prizepicks_snapshot,
+    save_prizepicks_snapshot
+)
+from .parse_underdog import parse_underdog_data, diff_underdog_board
+from .parse_cfb_stats import parse_cfb_player_stats, iter_cfb_player_records
 from .parse_nfl_game_ids import parse_nfl_game_ids
-from .parse_nfl_boxscore import parse_nfl_boxscore
+from .parse_nfl_boxscore import parse_nfl_boxscore, parse_boxscore_directory, is_boxscore_final
+from .json_backend import (
+    JSON_BACKEND,
+    json_loads,
+    json_dumps,
+    load_json_file,
+    dump_json_file,
+    open_json_file,
+    glob_json_files,
+    resolve_json_file,
+    ARCHIVE_COMPRESSION
+)
+from .game_catalog import (
+    GameCatalog,
+    get_game_catalog,
+    set_game_catalog
+)
+from .player_registry import (
+    PlayerRegistry,
+    get_player_registry,
+    set_player_registry,
+    normalize_player_name
+)
 from .common import (
     ParserError,
     JSONParseError,
@@ -33,6 +67,10 @@ from .common import (
     validate_required_fields,
     safe_get_list,
     print_parser_summary,
+    format_parse_error,
+    ParseStats,
+    set_parser_verbose,
+    is_parser_verbose,
     validate_metadata_fields,
     validate_no_placeholder_values,
     create_player_id,
@@ -42,6 +80,8 @@ from .common import (
     derive_opponent_from_prizepicks,
     derive_position_from_prizepicks,
     derive_game_time_from_prizepicks,
+    build_included_index,
+    resolve_prizepicks_player,
     validate_no_placeholders,
     require_valid_data,
     detect_placeholder_values,
@@ -50,9 +90,35 @@ from .common import (
 
 __all__ = [
     'parse_prizepicks_data',
+    'iter_prizepicks_records',
+    'build_prizepicks_snapshot',
+    'diff_prizepicks_board',
+    'load_prizepicks_snapshot',
+    'save_prizepicks_snapshot',
+    'parse_underdog_data',
+    'diff_underdog_board',
     'parse_cfb_player_stats', 
+    'iter_cfb_player_records',
     'parse_nfl_game_ids',
     'parse_nfl_boxscore',
+    'parse_boxscore_directory',
+    'is_boxscore_final',
+    'JSON_BACKEND',
+    'json_loads',
+    'json_dumps',
+    'load_json_file',
+    'dump_json_file',
+    'open_json_file',
+    'glob_json_files',
+    'resolve_json_file',
+    'ARCHIVE_COMPRESSION',
+    'GameCatalog',
+    'get_game_catalog',
+    'set_game_catalog',
+    'PlayerRegistry',
+    'get_player_registry',
+    'set_player_registry',
+    'normalize_player_name',
     'ParserError',
     'JSONParseError',
     'FileNotFoundError', 
@@ -64,6 +130,10 @@ __all__ = [
     'validate_required_fields',
     'safe_get_list',
     'print_parser_summary',
+    'format_parse_error',
+    'ParseStats',
+    'set_parser_verbose',
+    'is_parser_verbose',
     'validate_metadata_fields',
     'validate_no_placeholder_values',
     'create_player_id',
@@ -73,6 +143,8 @@ __all__ = [
     'derive_opponent_from_prizepicks',
     'derive_position_from_prizepicks',
     'derive_game_time_from_prizepicks',
+    'build_included_index',
+    'resolve_prizepicks_player',
     'validate_no_placeholders',
     'require_valid_data',
     'detect_placeholder_values',
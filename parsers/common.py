@@ -5,11 +5,17 @@ This module provides standardized error handling patterns and utility functions
 that are used across all parsers in the football prop insights system.
 """
 
-import json
 import os
+import time
 import hashlib
+from collections import Counter
+from contextlib import contextmanager
+from functools import lru_cache
 from datetime import datetime
-from typing import Any, Dict, List, Union, Optional
+from typing import Any, Dict, List, Union, Optional, Tuple, Iterator
+
+from .json_backend import JSON_DECODE_ERRORS, load_json_file, resolve_json_file
+from .player_registry import get_player_registry
 
 
 class ParserError(Exception):
@@ -46,6 +52,9 @@ def safe_load_json(file_path_or_data: Union[str, Dict, List]) -> Any:
     """
     Safely load JSON data from file path or pre-loaded data.
     
+    Compressed archives (.json.gz / .json.zst) are decompressed
+    transparently, and a missing .json path falls back to its compressed copy.
+    
     Args:
         file_path_or_data: Either a file path string or pre-loaded JSON data
         
@@ -62,13 +71,12 @@ def safe_load_json(file_path_or_data: Union[str, Dict, List]) -> Any:
     
     # If it's a string, treat as file path
     if isinstance(file_path_or_data, str):
-        if not os.path.exists(file_path_or_data):
+        if not resolve_json_file(file_path_or_data).exists():
             raise FileNotFoundError(f"Input file not found: {file_path_or_data}")
         
         try:
-            with open(file_path_or_data, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except json.JSONDecodeError as e:
+            return load_json_file(file_path_or_data)
+        except JSON_DECODE_ERRORS as e:
             raise JSONParseError(f"Failed to parse JSON from {file_path_or_data}: {e}")
         except Exception as e:
             raise ParserError(f"Unexpected error loading {file_path_or_data}: {e}")
@@ -165,6 +173,152 @@ def print_parser_summary(parser_name: str, total_records: int, success_count: in
     print()
 
 
+# ============================================================================
+# PARSE METRICS
+# ============================================================================
+
+# Console output from parsers is opt-in; PARSER_VERBOSE=1 enables it globally
+_parser_verbose = os.getenv('PARSER_VERBOSE', '').lower() in ('1', 'true', 'yes')
+
+
+def set_parser_verbose(enabled: bool) -> None:
+    """
+    Enable or disable console summaries for all parsers in this process.
+    
+    Args:
+        enabled: True to print summaries, False for silent parsing
+    """
+    global _parser_verbose
+    _parser_verbose = bool(enabled)
+
+
+def is_parser_verbose() -> bool:
+    """Return whether parser console output is enabled."""
+    return _parser_verbose
+
+
+def format_parse_error(code: str, *details: Any) -> str:
+    """Format an error code and its detail values as a single message."""
+    if not details:
+        return code
+    return f"{code}: {', '.join(str(detail) for detail in details)}"
+
+
+class ParseStats:
+    """
+    Counters, timings and an error-code histogram for one parser run.
+    
+    Parsers record errors as a code plus raw detail values; messages are only
+    formatted for the first few samples and only when someone asks for them,
+    so failures cost a counter increment rather than an f-string.
+    """
+    
+    max_error_samples = 5
+    
+    def __init__(self, parser_name: str, verbose: Optional[bool] = None):
+        """
+        Initialize stats for a parser run.
+        
+        Args:
+            parser_name: Name of the parser (e.g., "PrizePicks")
+            verbose: Print a summary on report() (None uses set_parser_verbose/PARSER_VERBOSE)
+        """
+        self.parser_name = parser_name
+        self.verbose = is_parser_verbose() if verbose is None else verbose
+        self.total_records = 0
+        self.success_count = 0
+        self.counters: Counter = Counter()
+        self.error_codes: Counter = Counter()
+        self.error_samples: List[Tuple[str, tuple]] = []
+        self.timings: Dict[str, float] = {}
+        self._start = time.perf_counter()
+    
+    def count(self, name: str, amount: int = 1) -> None:
+        """Increment a named counter."""
+        self.counters[name] += amount
+    
+    def error(self, code: str, *details: Any) -> None:
+        """
+        Record an error under a short code, keeping raw details for a few samples.
+        
+        Args:
+            code: Error code used for the histogram (e.g. "invalid_team")
+            *details: Values describing the failure, formatted lazily
+        """
+        self.error_codes[code] += 1
+        if len(self.error_samples) < self.max_error_samples:
+            self.error_samples.append((code, details))
+    
+    @contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        """Accumulate wall time for a named phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = self.timings.get(name, 0.0) + time.perf_counter() - start
+    
+    def finish(self) -> 'ParseStats':
+        """Record total elapsed time for the run."""
+        self.timings['total'] = time.perf_counter() - self._start
+        return self
+    
+    @property
+    def error_count(self) -> int:
+        """Total number of recorded errors."""
+        return sum(self.error_codes.values())
+    
+    @property
+    def errors(self) -> List[str]:
+        """Formatted messages for the sampled errors."""
+        return [format_parse_error(code, *details) for code, details in self.error_samples]
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the stats as a plain dictionary."""
+        return {
+            'parser': self.parser_name,
+            'total_records': self.total_records,
+            'success_count': self.success_count,
+            'error_count': self.error_count,
+            'error_codes': dict(self.error_codes),
+            'counters': dict(self.counters),
+            'timings': dict(self.timings)
+        }
+    
+    def report(self) -> None:
+        """Print the standard summary, histogram and timings when verbose."""
+        if not self.verbose:
+            return
+        
+        print(f"\n{self.parser_name} Parser Results:")
+        print(f"  📊 Total Records Found: {self.total_records}")
+        print(f"  ✅ Successfully Parsed: {self.success_count}")
+        
+        if self.total_records > 0:
+            success_rate = (self.success_count / self.total_records) * 100
+            print(f"  📈 Success Rate: {success_rate:.1f}%")
+        
+        if self.error_codes:
+            print(f"  ❌ Errors: {self.error_count}")
+            for error in self.errors[:3]:  # Show first 3 errors
+                print(f"    - {error}")
+            print("  🧾 Error codes:")
+            for code, count in self.error_codes.most_common():
+                print(f"    {code}: {count}")
+        
+        if self.counters:
+            print("  🔢 Counters:")
+            for name, count in sorted(self.counters.items()):
+                print(f"    {name}: {count}")
+        
+        if self.timings:
+            print("  ⏱️ Timings:")
+            for name, seconds in self.timings.items():
+                print(f"    {name}: {seconds * 1000:.1f} ms")
+        
+        print()
+
+
 # ============================================================================
 # METADATA VALIDATION FUNCTIONS (Task 1.1)
 # ============================================================================
@@ -197,7 +351,7 @@ def validate_metadata_fields(record: Dict[str, Any], parser_name: str = "Unknown
         raise MetadataValidationError(f"{parser_name}: Invalid season '{record['season']}'. Must be integer between 2000-2030")
     
     # Validate source field
-    valid_sources = ['PrizePicks', 'CollegeFootballData', 'RapidAPI']
+    valid_sources = ['PrizePicks', 'Underdog', 'CollegeFootballData', 'RapidAPI']
     if record['source'] not in valid_sources:
         raise MetadataValidationError(f"{parser_name}: Invalid source '{record['source']}'. Must be one of: {valid_sources}")
     
@@ -268,6 +422,9 @@ def extract_season_from_datetime(date_string: str, default_season: int = 2023) -
     """
     Extract season year from various datetime string formats.
     
+    Results are LRU-cached per (date_string, default_season), so records that
+    share a kickoff time resolve their season with a dict lookup.
+    
     Args:
         date_string: Date/time string in various formats
         default_season: Default season if parsing fails
@@ -275,6 +432,19 @@ def extract_season_from_datetime(date_string: str, default_season: int = 2023) -
     Returns:
         Integer year representing the season
     """
+    if isinstance(date_string, str):
+        return _extract_season_cached(date_string, default_season)
+    return _extract_season_uncached(date_string, default_season)
+
+
+@lru_cache(maxsize=4096)
+def _extract_season_cached(date_string: str, default_season: int) -> int:
+    """Cached wrapper around _extract_season_uncached for string inputs."""
+    return _extract_season_uncached(date_string, default_season)
+
+
+def _extract_season_uncached(date_string: str, default_season: int) -> int:
+    """Season extraction without caching (see extract_season_from_datetime)."""
     if not date_string or date_string == 'null':
         return default_season
     
@@ -304,18 +474,23 @@ def extract_season_from_datetime(date_string: str, default_season: int = 2023) -
 
 def add_standard_metadata(record: Dict[str, Any], league: str, source: str, 
                          game_time: str = None, player_name: str = None, 
-                         team: str = None, game_id: str = None) -> Dict[str, Any]:
+                         team: str = None, game_id: str = None,
+                         source_id: str = None) -> Dict[str, Any]:
     """
     Add standard metadata fields to a parsed record.
     
+    player_id is the player's stable key from the shared PlayerRegistry, so
+    the same player keeps one player_id across games and sources.
+    
     Args:
         record: Existing parsed record dictionary
         league: League identifier ("nfl" or "college")
         source: Data source identifier
         game_time: Game time string for season extraction (optional)
-        player_name: Player name for ID generation (optional)
-        team: Team name for ID generation (optional)  
-        game_id: Game ID for player ID generation (optional)
+        player_name: Player name for ID resolution (optional)
+        team: Team name for ID resolution (optional)  
+        game_id: Game ID (optional, no longer part of player_id)
+        source_id: Source-specific player id for registry aliasing (optional)
         
     Returns:
         Updated record dictionary with metadata fields
@@ -332,13 +507,17 @@ def add_standard_metadata(record: Dict[str, Any], league: str, source: str,
     else:
         record['season'] = 2023  # Default for current data
     
-    # Add player_id
+    # Add player_id from the shared registry
+    registry = get_player_registry()
+    position = record.get('position')
     if player_name and team:
-        record['player_id'] = create_player_id(player_name, team, game_id, league)
+        record['player_id'] = registry.resolve(player_name, team, league, source, source_id, position)
     elif 'player_name' in record and 'team' in record:
-        record['player_id'] = create_player_id(record['player_name'], record['team'], game_id, league)
+        record['player_id'] = registry.resolve(record['player_name'], record['team'], league,
+                                               source, source_id, position)
     elif 'player' in record and 'team' in record:
-        record['player_id'] = create_player_id(record['player'], record['team'], game_id, league)
+        record['player_id'] = registry.resolve(record['player'], record['team'], league,
+                                               source, source_id, position)
     else:
         record['player_id'] = "missing_data_" + str(hash(str(record)))[:8]
     
@@ -349,12 +528,37 @@ def add_standard_metadata(record: Dict[str, Any], league: str, source: str,
 # TEAM/OPPONENT DERIVATION HELPER FUNCTIONS (Task 1.2)
 # ============================================================================
 
-def find_included_item_by_type_and_id(included_data: List[Dict], item_type: str, item_id: str) -> Optional[Dict]:
+def build_included_index(included_data: List[Dict]) -> Dict[Tuple[str, str], Dict]:
     """
-    Find an item in PrizePicks included[] array by type and id.
+    Build a (type, id) -> item index over a PrizePicks included[] array.
+    
+    The index is built in a single pass so every relationship lookup for the
+    payload becomes a dict hit instead of a scan over included[].
     
     Args:
         included_data: List of included items from PrizePicks API
+        
+    Returns:
+        Dictionary keyed by (item_type, item_id); first occurrence wins
+    """
+    index = {}
+    
+    for item in included_data or []:
+        key = (item.get('type'), str(item.get('id')))
+        if key not in index:
+            index[key] = item
+    
+    return index
+
+
+def find_included_item_by_type_and_id(included_data: Union[List[Dict], Dict[Tuple[str, str], Dict]],
+                                      item_type: str, item_id: str) -> Optional[Dict]:
+    """
+    Find an item in PrizePicks included[] array by type and id.
+    
+    Args:
+        included_data: List of included items from PrizePicks API, or an index
+                       built with build_included_index()
         item_type: Type to search for (e.g., "team", "market", "new_player")
         item_id: ID to match
         
@@ -364,6 +568,10 @@ def find_included_item_by_type_and_id(included_data: List[Dict], item_type: str,
     if not included_data or not item_id:
         return None
     
+    # Indexed lookup (preferred path for full payloads)
+    if isinstance(included_data, dict):
+        return included_data.get((item_type, str(item_id)))
+    
     for item in included_data:
         if (item.get('type') == item_type and 
             item.get('id') == str(item_id)):
@@ -372,25 +580,52 @@ def find_included_item_by_type_and_id(included_data: List[Dict], item_type: str,
     return None
 
 
-def derive_team_from_prizepicks(projection: Dict, included_data: List[Dict]) -> str:
+def resolve_prizepicks_player(projection: Dict, included_data: Union[List[Dict], Dict],
+                              player_cache: Optional[Dict[str, Optional[Dict]]] = None) -> Optional[Dict]:
+    """
+    Resolve the new_player item referenced by a projection.
+    
+    Args:
+        projection: Individual projection from PrizePicks API
+        included_data: Included array or index from build_included_index()
+        player_cache: Optional dict of already-resolved players keyed by player ID,
+                      shared across all projections of a payload
+        
+    Returns:
+        Player item dictionary or None if not found
+    """
+    player_id = safe_get_nested(projection, ['relationships', 'new_player', 'data', 'id'])
+    if not player_id:
+        return None
+    
+    if player_cache is not None and player_id in player_cache:
+        return player_cache[player_id]
+    
+    player_item = find_included_item_by_type_and_id(included_data, 'new_player', player_id)
+    
+    if player_cache is not None:
+        player_cache[player_id] = player_item
+    
+    return player_item
+
+
+def derive_team_from_prizepicks(projection: Dict, included_data: Union[List[Dict], Dict],
+                                player_item: Optional[Dict] = None) -> str:
     """
     Derive team name from PrizePicks projection using player data in included[] lookup.
     
     Args:
         projection: Individual projection from PrizePicks API
-        included_data: Included array from PrizePicks API response
+        included_data: Included array or index from build_included_index()
+        player_item: Pre-resolved player item (skips the included[] lookup)
         
     Returns:
         Team abbreviation or "Unknown Team" if derivation fails
     """
     try:
-        # Get player ID from projection relationships  
-        player_id = safe_get_nested(projection, ['relationships', 'new_player', 'data', 'id'])
-        if not player_id:
-            return "Unknown Team"
-        
         # Find player in included data
-        player_item = find_included_item_by_type_and_id(included_data, 'new_player', player_id)
+        if player_item is None:
+            player_item = resolve_prizepicks_player(projection, included_data)
         if not player_item:
             return "Unknown Team"
         
@@ -407,7 +642,7 @@ def derive_team_from_prizepicks(projection: Dict, included_data: List[Dict]) ->
         return "Unknown Team"
 
 
-def derive_opponent_from_prizepicks(projection: Dict, included_data: List[Dict]) -> str:
+def derive_opponent_from_prizepicks(projection: Dict, included_data: Union[List[Dict], Dict]) -> str:
     """
     Derive opponent name from PrizePicks projection. 
     Note: PrizePicks data structure doesn't include market objects with opponent info.
@@ -415,7 +650,7 @@ def derive_opponent_from_prizepicks(projection: Dict, included_data: List[Dict])
     
     Args:
         projection: Individual projection from PrizePicks API
-        included_data: Included array from PrizePicks API response
+        included_data: Included array or index from build_included_index()
         
     Returns:
         Opponent name or "TBD" if derivation not possible
@@ -433,25 +668,23 @@ def derive_opponent_from_prizepicks(projection: Dict, included_data: List[Dict])
         return "TBD"
 
 
-def derive_position_from_prizepicks(projection: Dict, included_data: List[Dict]) -> str:
+def derive_position_from_prizepicks(projection: Dict, included_data: Union[List[Dict], Dict],
+                                    player_item: Optional[Dict] = None) -> str:
     """
     Derive player position from PrizePicks projection using player lookup.
     
     Args:
         projection: Individual projection from PrizePicks API
-        included_data: Included array from PrizePicks API response
+        included_data: Included array or index from build_included_index()
+        player_item: Pre-resolved player item (skips the included[] lookup)
         
     Returns:
         Player position or "Unknown Position" if derivation fails
     """
     try:
-        # Get player ID from projection relationships
-        player_id = safe_get_nested(projection, ['relationships', 'new_player', 'data', 'id'])
-        if not player_id:
-            return "Unknown Position"
-        
         # Find player in included data
-        player_item = find_included_item_by_type_and_id(included_data, 'new_player', player_id)
+        if player_item is None:
+            player_item = resolve_prizepicks_player(projection, included_data)
         if not player_item:
             return "Unknown Position"
         
@@ -464,13 +697,13 @@ def derive_position_from_prizepicks(projection: Dict, included_data: List[Dict])
         return "Unknown Position"
 
 
-def derive_game_time_from_prizepicks(projection: Dict, included_data: List[Dict]) -> Optional[str]:
+def derive_game_time_from_prizepicks(projection: Dict, included_data: Union[List[Dict], Dict]) -> Optional[str]:
     """
     Derive game time from PrizePicks projection, trying multiple sources.
     
     Args:
         projection: Individual projection from PrizePicks API
-        included_data: Included array from PrizePicks API response
+        included_data: Included array or index from build_included_index()
         
     Returns:
         Game time string or None if not found
@@ -580,10 +813,58 @@ def find_player_team_in_cfb_game(game_data: Dict, player_id: str) -> Optional[st
 # DATETIME PARSING UTILITIES (Task 1.3)
 # ============================================================================
 
+# Formats tried in order when a string's shape has no memoized format yet
+_DATETIME_FORMATS = [
+    # ISO formats
+    '%Y-%m-%dT%H:%M:%S.%fZ',      # 2023-09-10T20:20:00.000Z
+    '%Y-%m-%dT%H:%M:%SZ',         # 2023-09-10T20:20:00Z
+    '%Y-%m-%dT%H:%M:%S.%f',       # 2023-09-10T20:20:00.000
+    '%Y-%m-%dT%H:%M:%S',          # 2023-09-10T20:20:00
+    '%Y-%m-%dT%H:%M',             # 2023-09-10T20:20
+    
+    # Date only formats
+    '%Y-%m-%d',                   # 2023-09-10
+    '%m/%d/%Y',                   # 09/10/2023
+    '%m-%d-%Y',                   # 09-10-2023
+    '%d/%m/%Y',                   # 10/09/2023 (European)
+    '%d-%m-%Y',                   # 10-09-2023 (European)
+    
+    # US formats with time
+    '%m/%d/%Y %H:%M:%S',          # 09/10/2023 20:20:00
+    '%m/%d/%Y %I:%M:%S %p',       # 09/10/2023 8:20:00 PM
+    
+    # Other common formats
+    '%Y%m%d',                     # 20230910
+    '%B %d, %Y',                  # September 10, 2023
+    '%b %d, %Y',                  # Sep 10, 2023
+]
+
+# Formats retried after stripping a trailing timezone
+_TZ_STRIPPED_FORMATS = ['%Y-%m-%dT%H:%M:%S.%f', '%Y-%m-%dT%H:%M:%S']
+
+# European day-first formats share a shape with the US month-first ones and
+# only win when the US format fails, so they are never memoized
+_AMBIGUOUS_DATETIME_FORMATS = {'%d/%m/%Y', '%d-%m-%Y'}
+
+# Shape = digits -> 'd', letters -> 'a' (T and Z kept literal), punctuation as-is
+_DATETIME_SHAPE_TABLE = str.maketrans(
+    '0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSUVWXY',
+    'd' * 10 + 'a' * 50
+)
+
+# shape -> (strip_timezone, format) that last parsed a string of that shape
+_datetime_format_by_shape: Dict[str, Tuple[bool, str]] = {}
+
+
 def parse_datetime_flexible(date_string: str) -> Optional[datetime]:
     """
     Parse datetime from various string formats commonly used in football APIs.
     
+    The string's shape (digit/letter layout) selects the format that last
+    parsed a string of the same shape, so the common case is one strptime
+    call; unknown shapes fall back to trying each format in order. Results
+    are LRU-cached per string since a slate shares a few dozen kickoff times.
+    
     Args:
         date_string: Date/time string in various formats
         
@@ -600,57 +881,53 @@ def parse_datetime_flexible(date_string: str) -> Optional[datetime]:
         return None
     
     # Clean the input string
-    clean_string = str(date_string).strip()
-    
-    # Common datetime formats found in football APIs
-    formats_to_try = [
-        # ISO formats
-        '%Y-%m-%dT%H:%M:%S.%fZ',      # 2023-09-10T20:20:00.000Z
-        '%Y-%m-%dT%H:%M:%SZ',         # 2023-09-10T20:20:00Z
-        '%Y-%m-%dT%H:%M:%S.%f',       # 2023-09-10T20:20:00.000
-        '%Y-%m-%dT%H:%M:%S',          # 2023-09-10T20:20:00
-        '%Y-%m-%dT%H:%M',             # 2023-09-10T20:20
-        
-        # Date only formats
-        '%Y-%m-%d',                   # 2023-09-10
-        '%m/%d/%Y',                   # 09/10/2023
-        '%m-%d-%Y',                   # 09-10-2023
-        '%d/%m/%Y',                   # 10/09/2023 (European)
-        '%d-%m-%Y',                   # 10-09-2023 (European)
-        
-        # US formats with time
-        '%m/%d/%Y %H:%M:%S',          # 09/10/2023 20:20:00
-        '%m/%d/%Y %I:%M:%S %p',       # 09/10/2023 8:20:00 PM
-        
-        # Other common formats
-        '%Y%m%d',                     # 20230910
-        '%B %d, %Y',                  # September 10, 2023
-        '%b %d, %Y',                  # Sep 10, 2023
-    ]
+    return _parse_datetime_cached(str(date_string).strip())
+
+
+@lru_cache(maxsize=4096)
+def _parse_datetime_cached(clean_string: str) -> Optional[datetime]:
+    """Parse a cleaned datetime string via the shape-memoized format table."""
+    shape = clean_string.translate(_DATETIME_SHAPE_TABLE)
+    
+    # Fast path: reuse the format that won for this shape before
+    memoized = _datetime_format_by_shape.get(shape)
+    if memoized:
+        strip_timezone, fmt = memoized
+        try:
+            return datetime.strptime(
+                _strip_timezone(clean_string) if strip_timezone else clean_string, fmt)
+        except ValueError:
+            pass
     
     # Try parsing with each format
-    for fmt in formats_to_try:
+    for fmt in _DATETIME_FORMATS:
         try:
-            return datetime.strptime(clean_string, fmt)
+            parsed = datetime.strptime(clean_string, fmt)
         except ValueError:
             continue
+        if fmt not in _AMBIGUOUS_DATETIME_FORMATS:
+            _datetime_format_by_shape[shape] = (False, fmt)
+        return parsed
     
     # Try handling timezone info manually
     if '+' in clean_string or 'T' in clean_string:
-        try:
-            # Remove timezone info and try again
-            base_string = clean_string.split('+')[0].split('Z')[0]
-            for fmt in ['%Y-%m-%dT%H:%M:%S.%f', '%Y-%m-%dT%H:%M:%S']:
-                try:
-                    return datetime.strptime(base_string, fmt)
-                except ValueError:
-                    continue
-        except:
-            pass
+        base_string = _strip_timezone(clean_string)
+        for fmt in _TZ_STRIPPED_FORMATS:
+            try:
+                parsed = datetime.strptime(base_string, fmt)
+            except ValueError:
+                continue
+            _datetime_format_by_shape[shape] = (True, fmt)
+            return parsed
     
     return None
 
 
+def _strip_timezone(date_string: str) -> str:
+    """Remove a trailing '+hh:mm' offset or 'Z' suffix."""
+    return date_string.split('+')[0].split('Z')[0]
+
+
 def extract_season_year_robust(date_input: Union[str, datetime, int], default_year: int = 2023) -> int:
     """
     Robustly extract season year from various input types and formats.
@@ -14,6 +14,7 @@ from typing import Dict, Any, List, Union, Optional
 from collections import defaultdict
 
 # Import all parsers and validation functions
+from .json_backend import glob_json_files
 from .parse_prizepicks import parse_prizepicks_data
 from .parse_cfb_stats import parse_cfb_player_stats
 from .parse_nfl_game_ids import parse_nfl_game_ids
@@ -520,7 +521,7 @@ class ComprehensiveValidator:
         """Find available NFL boxscore files."""
         boxscore_dir = Path("api_data/nfl_boxscore")
         if boxscore_dir.exists():
-            return [str(f) for f in boxscore_dir.glob("boxscore_*.json")]
+            return [str(f) for f in glob_json_files(boxscore_dir, "boxscore_*.json")]
         return []
 
 
@@ -292,7 +292,7 @@ def enhanced_parse_prizepicks_data(data_source: Union[str, Dict]) -> List[Dict[s
     - league: "nfl" or "college"
     - season: Integer year (2023, 2024, etc.)
     - source: "PrizePicks"
-    - player_id: Unique player identifier hash
+    - player_id: Stable player key from the player registry
     - odds_type: Odds type from projection or "standard"
     """
     pass
@@ -313,7 +313,7 @@ def enhanced_parse_cfb_player_stats(data_source: Union[str, List]) -> List[Dict[
     - league: "college"
     - season: Integer year from start_time
     - source: "CollegeFootballData"
-    - player_id: Unique player identifier hash
+    - player_id: Stable player key from the player registry
     - [position-specific stats]: passYards, receivingYards, etc.
     """
     pass
@@ -333,7 +333,7 @@ def enhanced_parse_nfl_boxscore(data_source: Union[str, Dict]) -> List[Dict[str,
     - league: "nfl"
     - season: Integer year from game context
     - source: "RapidAPI"
-    - player_id: Unique player identifier hash
+    - player_id: Stable player key from the player registry
     - [position-specific stats]: yards, touchdowns, etc.
     """
     pass
@@ -0,0 +1,246 @@
+"""
+NFL Game Catalog
+
+Persistent game_id -> {year, week, type, kickoff} index used by the boxscore
+parser. The catalog is loaded once per process and kept in sync with the
+parsed game-id files (parsed_data/nfl_stats/games_*_parsed.json): on load,
+only files that are new or modified since they were last indexed are read.
+parse_nfl_game_ids() writes new games straight into the catalog.
+"""
+
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Dict, Any, Iterable, Optional
+
+from .json_backend import load_json_file, dump_json_file, glob_json_files
+
+DEFAULT_GAMES_DIR = 'parsed_data/nfl_stats'
+DEFAULT_CATALOG_PATH = os.getenv('GAME_CATALOG_PATH', os.path.join(DEFAULT_GAMES_DIR, 'game_catalog.json'))
+
+_GAMES_FILE_PATTERN = re.compile(r'games_(\d{4})_week(\d+)_type(\d+)')
+
+
+class GameCatalog:
+    """In-memory game_id metadata index with JSON persistence."""
+
+    def __init__(self, catalog_path: Optional[str] = None, games_dir: Optional[str] = DEFAULT_GAMES_DIR):
+        """
+        Initialize the catalog, loading catalog_path and indexing new files in games_dir.
+
+        Args:
+            catalog_path: JSON file used for persistence (None for memory only)
+            games_dir: Directory of games_*_parsed.json files to sync from (None to skip)
+        """
+        self.catalog_path = catalog_path
+        self._lock = threading.Lock()
+        # Serializes save() so concurrent jobs never interleave snapshots and writes
+        self._save_lock = threading.Lock()
+        self._games: Dict[str, Dict[str, Any]] = {}
+        self._sources: Dict[str, float] = {}
+        self._dirty = False
+
+        if catalog_path and os.path.exists(catalog_path):
+            self.load(catalog_path)
+
+        if games_dir:
+            self.sync_from_parsed_files(games_dir)
+            self.save()
+
+    def __len__(self) -> int:
+        return len(self._games)
+
+    def __contains__(self, game_id: Any) -> bool:
+        return str(game_id) in self._games
+
+    def get(self, game_id: Any) -> Optional[Dict[str, Any]]:
+        """
+        Look up metadata for a game.
+
+        Args:
+            game_id: NFL game event ID
+
+        Returns:
+            Dict with year, week, type and kickoff, or None if unknown
+        """
+        return self._games.get(str(game_id))
+
+    def add_games(self, game_ids: Iterable[Any], year: Optional[int], week: Optional[int],
+                  game_type: Optional[int] = None) -> int:
+        """
+        Record year/week/type for a list of games, keeping any known kickoff.
+
+        Args:
+            game_ids: NFL game event IDs
+            year: Season year
+            week: Week number
+            game_type: Season type (1=preseason, 2=regular, 3=postseason)
+
+        Returns:
+            Number of games added or changed
+        """
+        changed = 0
+        with self._lock:
+            for game_id in game_ids:
+                game_id = str(game_id)
+                existing = self._games.get(game_id, {})
+                entry = {
+                    'year': year,
+                    'week': week,
+                    'type': game_type if game_type is not None else existing.get('type'),
+                    'kickoff': existing.get('kickoff')
+                }
+                if entry != existing:
+                    self._games[game_id] = entry
+                    changed += 1
+            if changed:
+                self._dirty = True
+        return changed
+
+    def set_kickoff(self, game_id: Any, kickoff: str) -> None:
+        """
+        Record the kickoff time for a known game.
+
+        Args:
+            game_id: NFL game event ID
+            kickoff: Kickoff date/time string
+        """
+        with self._lock:
+            entry = self._games.get(str(game_id))
+            if entry is not None and entry.get('kickoff') != kickoff:
+                entry['kickoff'] = kickoff
+                self._dirty = True
+
+    def sync_from_parsed_files(self, games_dir: str = DEFAULT_GAMES_DIR) -> int:
+        """
+        Index games_*_parsed.json files that are new or modified since last indexed.
+
+        Args:
+            games_dir: Directory containing parsed game-id files
+
+        Returns:
+            Number of files read
+        """
+        games_path = Path(games_dir)
+        if not games_path.exists():
+            return 0
+
+        files_read = 0
+        for games_file in glob_json_files(games_path, 'games_*_parsed.json'):
+            try:
+                mtime = games_file.stat().st_mtime
+                if self._sources.get(games_file.name) == mtime:
+                    continue
+
+                games_data = load_json_file(games_file)
+
+                type_match = _GAMES_FILE_PATTERN.search(games_file.name)
+                game_type = int(type_match.group(3)) if type_match else None
+
+                self.add_games(games_data.get('game_ids', []), games_data.get('year'),
+                               games_data.get('week'), game_type)
+                with self._lock:
+                    self._sources[games_file.name] = mtime
+                    self._dirty = True
+                files_read += 1
+
+            except Exception:
+                # Skip files that can't be parsed
+                continue
+
+        return files_read
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the catalog state as a JSON-serializable dictionary."""
+        with self._lock:
+            return {'games': {game_id: dict(entry) for game_id, entry in self._games.items()},
+                    'sources': dict(self._sources)}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'GameCatalog':
+        """
+        Build a memory-only catalog from to_dict() output (e.g. in a worker process).
+
+        Args:
+            data: Catalog state
+
+        Returns:
+            GameCatalog instance
+        """
+        catalog = cls(catalog_path=None, games_dir=None)
+        catalog._games.update(data.get('games', {}))
+        catalog._sources.update(data.get('sources', {}))
+        return catalog
+
+    def load(self, catalog_path: Optional[str] = None) -> None:
+        """
+        Load games and indexed-file state from a JSON file written by save().
+
+        Args:
+            catalog_path: File to load (defaults to self.catalog_path)
+        """
+        catalog_path = catalog_path or self.catalog_path
+        data = load_json_file(catalog_path)
+
+        with self._lock:
+            self._games.update(data.get('games', {}))
+            self._sources.update(data.get('sources', {}))
+
+    def save(self, catalog_path: Optional[str] = None) -> None:
+        """
+        Write the catalog to JSON if anything changed since the last save.
+
+        Args:
+            catalog_path: Destination file (defaults to self.catalog_path)
+        """
+        catalog_path = catalog_path or self.catalog_path
+        if not catalog_path:
+            return
+
+        with self._save_lock:
+            # Snapshot and clear the flag together; changes made during the write mark it again
+            with self._lock:
+                if not self._dirty:
+                    return
+                data = {'games': {game_id: dict(entry) for game_id, entry in self._games.items()},
+                        'sources': dict(self._sources)}
+                self._dirty = False
+
+            try:
+                dump_json_file(catalog_path, data)
+            except BaseException:
+                with self._lock:
+                    self._dirty = True
+                raise
+
+
+_default_catalog: Optional[GameCatalog] = None
+_default_catalog_lock = threading.Lock()
+
+
+def get_game_catalog() -> GameCatalog:
+    """
+    Get the process-wide game catalog, loading and syncing it on first use.
+
+    Returns:
+        Shared GameCatalog instance
+    """
+    global _default_catalog
+    if _default_catalog is None:
+        # Concurrent backfill jobs may race here on first use
+        with _default_catalog_lock:
+            if _default_catalog is None:
+                _default_catalog = GameCatalog(DEFAULT_CATALOG_PATH)
+    return _default_catalog
+
+
+def set_game_catalog(catalog: GameCatalog) -> None:
+    """
+    Replace the process-wide game catalog.
+
+    Args:
+        catalog: Catalog to use for subsequent parser calls
+    """
+    global _default_catalog
+    _default_catalog = catalog
@@ -0,0 +1,312 @@
+"""
+JSON Serialization Layer
+
+Single entry point for JSON reads and writes in parsers/ and src/. The
+fastest installed backend is used: orjson, then msgspec, then the stdlib
+json module. Set JSON_BACKEND=orjson|msgspec|json to force one.
+
+Files are written compact by default. Pass pretty=True (or set
+JSON_PRETTY=1) for 2-space indented, human-readable output.
+
+Archives can be stored compressed: files ending in .json.gz (gzip) or
+.json.zst (zstd, needs the optional zstandard package) are compressed on
+write and stream-decompressed on read. ARCHIVE_COMPRESSION=gzip|zstd sets
+the default for the raw and parsed archive writers; readers detect the
+format from the file suffix or magic bytes and fall back to the compressed
+variants of a plain .json path that does not exist.
+"""
+
+import gzip
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, BinaryIO, List, Optional, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    msgspec = None
+    MSGSPEC_AVAILABLE = False
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None
+    ZSTD_AVAILABLE = False
+
+
+def _select_backend(requested: Optional[str]) -> str:
+    """Pick the requested backend if installed, else the fastest available."""
+    available = {'orjson': ORJSON_AVAILABLE, 'msgspec': MSGSPEC_AVAILABLE, 'json': True}
+    if requested and available.get(requested.lower()):
+        return requested.lower()
+    for backend in ('orjson', 'msgspec', 'json'):
+        if available[backend]:
+            return backend
+
+
+JSON_BACKEND = _select_backend(os.getenv('JSON_BACKEND'))
+
+# Compact output unless JSON_PRETTY is set
+JSON_PRETTY_DEFAULT = os.getenv('JSON_PRETTY', '').lower() in ('1', 'true', 'yes')
+
+# Exceptions raised for malformed input by any backend
+# (orjson.JSONDecodeError subclasses json.JSONDecodeError)
+JSON_DECODE_ERRORS = (json.JSONDecodeError,) + ((msgspec.DecodeError,) if MSGSPEC_AVAILABLE else ())
+
+# Compression -> file suffix appended after .json
+COMPRESSION_SUFFIXES = {'gzip': '.gz', 'zstd': '.zst'}
+
+# Leading bytes of each compressed format
+_COMPRESSION_MAGIC = {b'\x1f\x8b': 'gzip', b'\x28\xb5\x2f\xfd': 'zstd'}
+
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 3
+
+
+def _select_compression(requested: Optional[str]) -> Optional[str]:
+    """Validate a compression name, falling back to gzip when zstandard is missing."""
+    requested = (requested or '').lower()
+    if requested in ('', 'none', 'off', '0'):
+        return None
+    if requested not in COMPRESSION_SUFFIXES:
+        raise ValueError(f"Unknown compression: {requested} (expected gzip or zstd)")
+    if requested == 'zstd' and not ZSTD_AVAILABLE:
+        return 'gzip'
+    return requested
+
+
+# Compression used by the archive writers (uncompressed unless set)
+ARCHIVE_COMPRESSION = _select_compression(os.getenv('ARCHIVE_COMPRESSION'))
+
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """
+    Deserialize JSON text or bytes.
+
+    Args:
+        data: JSON document
+
+    Returns:
+        Parsed Python object
+
+    Raises:
+        One of JSON_DECODE_ERRORS: If the document is malformed
+    """
+    if JSON_BACKEND == 'orjson':
+        return orjson.loads(data)
+    if JSON_BACKEND == 'msgspec':
+        return msgspec.json.decode(data)
+    return json.loads(data)
+
+
+def json_dumps(data: Any, pretty: Optional[bool] = None) -> bytes:
+    """
+    Serialize data to UTF-8 JSON bytes.
+
+    Args:
+        data: JSON-serializable data
+        pretty: Indent with 2 spaces (None uses JSON_PRETTY)
+
+    Returns:
+        Encoded JSON document
+    """
+    pretty = JSON_PRETTY_DEFAULT if pretty is None else pretty
+
+    if JSON_BACKEND == 'orjson':
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        return orjson.dumps(data, option=option)
+    if JSON_BACKEND == 'msgspec':
+        encoded = msgspec.json.encode(data)
+        return msgspec.json.format(encoded, indent=2) if pretty else encoded
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def compression_for_path(file_path: Union[str, Path]) -> Optional[str]:
+    """Get the compression implied by a file suffix ('gzip', 'zstd' or None)."""
+    suffix = Path(file_path).suffix.lower()
+    for compression, compressed_suffix in COMPRESSION_SUFFIXES.items():
+        if suffix == compressed_suffix:
+            return compression
+    return None
+
+
+def detect_compression(file_path: Union[str, Path]) -> Optional[str]:
+    """
+    Detect how a file is compressed, by suffix first and then by magic bytes.
+
+    Args:
+        file_path: Existing file
+
+    Returns:
+        'gzip', 'zstd' or None for plain JSON
+    """
+    compression = compression_for_path(file_path)
+    if compression:
+        return compression
+    with open(file_path, 'rb') as f:
+        head = f.read(4)
+    for magic, compression in _COMPRESSION_MAGIC.items():
+        if head.startswith(magic):
+            return compression
+    return None
+
+
+def compressed_path(file_path: Union[str, Path], compression: Optional[str]) -> Path:
+    """Append the suffix for compression to file_path unless it already ends in one."""
+    file_path = Path(file_path)
+    compression = _select_compression(compression)
+    if compression is None or compression_for_path(file_path):
+        return file_path
+    return file_path.with_name(file_path.name + COMPRESSION_SUFFIXES[compression])
+
+
+def json_file_variants(file_path: Union[str, Path]) -> List[Path]:
+    """List file_path and its compressed variants (file.json, file.json.gz, file.json.zst)."""
+    file_path = Path(file_path)
+    if compression_for_path(file_path):
+        return [file_path]
+    return [file_path] + [file_path.with_name(file_path.name + suffix)
+                          for suffix in COMPRESSION_SUFFIXES.values()]
+
+
+def resolve_json_file(file_path: Union[str, Path]) -> Path:
+    """
+    Find the file to read for a JSON path, allowing for compressed archives.
+
+    Args:
+        file_path: Path as written by callers, e.g. api_data/prizepicks/nfl_projections.json
+
+    Returns:
+        The most recently modified existing variant, or file_path itself if none exist
+    """
+    existing = [path for path in json_file_variants(file_path) if path.exists()]
+    if not existing:
+        return Path(file_path)
+    return max(existing, key=lambda path: path.stat().st_mtime)
+
+
+def glob_json_files(directory: Union[str, Path], pattern: str) -> List[Path]:
+    """
+    Glob JSON files in a directory, including compressed variants.
+
+    When the same file exists both plain and compressed, only the most
+    recently modified copy is returned.
+
+    Args:
+        directory: Directory to search
+        pattern: Glob pattern for the plain files, e.g. '*_parsed.json'
+
+    Returns:
+        Sorted list of matching paths
+    """
+    directory = Path(directory)
+    newest = {}
+    for suffix in [''] + list(COMPRESSION_SUFFIXES.values()):
+        for path in directory.glob(pattern + suffix):
+            base = path.name[:-len(suffix)] if suffix else path.name
+            current = newest.get(base)
+            if current is None or path.stat().st_mtime > current.stat().st_mtime:
+                newest[base] = path
+    return [newest[base] for base in sorted(newest)]
+
+
+def open_json_file(file_path: Union[str, Path]) -> BinaryIO:
+    """
+    Open a JSON file for binary reading, decompressing gzip/zstd transparently.
+
+    The returned stream decompresses incrementally, so it can be handed to
+    ijson without inflating the whole file first.
+
+    Args:
+        file_path: File to read (plain or compressed); a missing plain .json
+            path falls back to its compressed variants
+
+    Returns:
+        Readable binary file object (use as a context manager)
+
+    Raises:
+        ImportError: If the file is zstd-compressed and zstandard is not installed
+    """
+    file_path = resolve_json_file(file_path)
+    compression = detect_compression(file_path)
+    if compression == 'gzip':
+        return gzip.open(file_path, 'rb')
+    if compression == 'zstd':
+        if not ZSTD_AVAILABLE:
+            raise ImportError(f"zstandard is required to read {file_path}")
+        return zstandard.open(file_path, 'rb')
+    return open(file_path, 'rb')
+
+
+def load_json_file(file_path: Union[str, Path]) -> Any:
+    """
+    Read and deserialize a JSON file, decompressing it if needed.
+
+    Args:
+        file_path: File to read
+
+    Returns:
+        Parsed Python object
+    """
+    with open_json_file(file_path) as f:
+        return json_loads(f.read())
+
+
+def dump_json_file(file_path: Union[str, Path], data: Any, pretty: Optional[bool] = None,
+                   compression: Optional[str] = None) -> Path:
+    """
+    Atomically write data to a JSON file, creating parent directories.
+
+    Args:
+        file_path: Destination file; a .gz or .zst suffix selects that compression
+        data: JSON-serializable data
+        pretty: Indent with 2 spaces (None uses JSON_PRETTY)
+        compression: 'gzip' or 'zstd' to compress a plain .json path, appending
+            the matching suffix (zstd falls back to gzip without zstandard)
+
+    Returns:
+        Path of the written file
+    """
+    file_path = compressed_path(file_path, compression)
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    compression = compression_for_path(file_path)
+    if compression == 'zstd' and not ZSTD_AVAILABLE:
+        raise ImportError(f"zstandard is required to write {file_path}")
+
+    encoded = json_dumps(data, pretty)
+    # A unique temp file per call, so concurrent writers of one target never share it
+    fd, temp_path = tempfile.mkstemp(dir=file_path.parent, prefix=f"{file_path.name}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as raw:
+            if compression == 'gzip':
+                with gzip.open(raw, 'wb', compresslevel=GZIP_LEVEL) as f:
+                    f.write(encoded)
+            elif compression == 'zstd':
+                with zstandard.open(raw, 'wb', cctx=zstandard.ZstdCompressor(level=ZSTD_LEVEL), closefd=False) as f:
+                    f.write(encoded)
+            else:
+                raw.write(encoded)
+        # mkstemp creates the file owner-only; keep archives readable like a normal write
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+    return file_path
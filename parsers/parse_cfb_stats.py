@@ -5,14 +5,18 @@ This module parses College Football player statistics from the CollegeFootballDa
 It filters for QB, WR, and RB positions and extracts relevant statistics for prop betting analysis.
 """
 
-from typing import Dict, List, Any, Union
+import os
+from typing import Dict, List, Any, Union, Optional, Tuple, Iterable, Iterator
+from .json_backend import open_json_file, resolve_json_file
+from .player_registry import get_player_registry
 from .common import (
     safe_load_json,
     safe_get_list,
     safe_get_nested,
-    print_parser_summary,
+    ParseStats,
     ParserError,
     DataStructureError,
+    JSONParseError,
     add_standard_metadata,
     validate_metadata_fields,
     validate_no_placeholder_values,
@@ -21,13 +25,29 @@ from .common import (
     find_player_team_in_cfb_game
 )
 
+# Optional incremental JSON reader for streaming full-season payloads
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+    ijson_errors = (ijson.JSONError, ijson.IncompleteJSONError)
+except ImportError:
+    ijson = None
+    IJSON_AVAILABLE = False
+    ijson_errors = ()
 
-def parse_cfb_player_stats(data_source: Union[str, List]) -> List[Dict[str, Any]]:
+# Valid positions we want to track
+VALID_POSITIONS = ['QB', 'WR', 'RB']
+
+
+def parse_cfb_player_stats(data_source: Union[str, List], stats: Optional[ParseStats] = None,
+                           verbose: Optional[bool] = None) -> List[Dict[str, Any]]:
     """
     Enhanced College Football player statistics parser with comprehensive validation.
     
     Args:
         data_source: File path to players_YYYY_weekN_regular.json or pre-loaded JSON data
+        stats: Optional ParseStats to fill with counters, timings and error codes
+        verbose: Print a console summary (None uses set_parser_verbose/PARSER_VERBOSE)
         
     Returns:
         List of dictionaries with enhanced fields:
@@ -41,7 +61,7 @@ def parse_cfb_player_stats(data_source: Union[str, List]) -> List[Dict[str, Any]
         - league: "college"
         - season: Integer year from start_time
         - source: "CollegeFootballData"
-        - player_id: Unique player identifier hash
+        - player_id: Stable player key from the player registry
         - [position-specific stats]: passYards, receivingYards, etc.
         
     Raises:
@@ -53,15 +73,14 @@ def parse_cfb_player_stats(data_source: Union[str, List]) -> List[Dict[str, Any]
         ParserError: For other parsing-related errors
     """
     parser_name = "College Football"
-    parsed_records = []
-    errors = []
-    
-    # Valid positions we want to track
-    VALID_POSITIONS = ['QB', 'WR', 'RB']
+    # Player records keyed by (game_id, team, player); category stats merge in place
+    player_records: Dict[Tuple[Any, str, str], Dict[str, Any]] = {}
+    stats = stats or ParseStats(parser_name, verbose)
     
     try:
         # Step 1: Load and validate input data
-        data = safe_load_json(data_source)
+        with stats.timer('load'):
+            data = safe_load_json(data_source)
         
         # CFB API returns a list of games
         if not isinstance(data, list):
@@ -73,203 +92,300 @@ def parse_cfb_player_stats(data_source: Union[str, List]) -> List[Dict[str, Any]
         for game in data:
             try:
                 total_games_processed += 1
-                
-                # Extract game-level information
-                game_id = game.get('id')
-                week = game.get('week')
-                start_time = game.get('start_time')
-                
-                # Extract teams information
-                teams_data = safe_get_list(game, 'teams', [])
-                
-                if len(teams_data) < 2:
-                    errors.append(f"Game {game_id}: Insufficient team data")
-                    continue
-                
-                # Task 4.1 & 4.2: Enhanced team/opponent derivation
-                for team_data in teams_data:
-                    try:
-                        team_name_raw = team_data.get('team')  # CFB API uses 'team' not 'school'
-                        if not team_name_raw:
-                            continue
-                        
-                        # Derive team and opponent using helper function
-                        team_name, opponent_name = derive_team_and_opponent_from_cfb_game(game, team_name_raw)
-                        
-                        # Task 4.6: Validate team/opponent relationships
-                        if team_name == opponent_name or team_name == "Unknown Team" or opponent_name == "Unknown Opponent":
-                            errors.append(f"Invalid team/opponent relationship for {team_name_raw} in game {game_id}")
-                            continue
-                        
-                        # Extract player statistics
-                        categories = safe_get_list(team_data, 'categories', [])
-                        
-                        for category in categories:
-                            category_name = category.get('name', '')
-                            types = safe_get_list(category, 'types', [])
-                            
-                            for stat_type in types:
-                                stat_name = stat_type.get('name', '')
-                                athletes = safe_get_list(stat_type, 'athletes', [])
-                                
-                                for athlete in athletes:
-                                    try:
-                                        player_name = athlete.get('name')
-                                        if not player_name or player_name.strip() in [' Team', 'Team', '']:
-                                            continue  # Skip team-level stats
-                                            
-                                        stat_value = athlete.get('stat', '0')
-                                        
-                                        # Convert stat value to appropriate type
-                                        try:
-                                            if '/' in str(stat_value):
-                                                stat_value = str(stat_value)
-                                            else:
-                                                stat_value = float(stat_value) if '.' in str(stat_value) else int(stat_value)
-                                        except (ValueError, TypeError):
-                                            stat_value = str(stat_value)
-                                        
-                                        # Determine position from stat category
-                                        position = None
-                                        if category_name == 'passing' or stat_name in ['C/ATT', 'YDS', 'AVG', 'TD', 'INT', 'QBR']:
-                                            position = 'QB'
-                                        elif category_name == 'receiving' or stat_name in ['REC', 'YDS', 'AVG', 'TD', 'LONG']:
-                                            position = 'WR'  # Could also be RB receiving
-                                        elif category_name == 'rushing':
-                                            continue  # We only track receiving stats for RBs
-                                        
-                                        if not position or position not in VALID_POSITIONS:
-                                            continue
-                                        
-                                        # Create or find existing player record
-                                        player_record = None
-                                        for record in parsed_records:
-                                            if (record.get('player') == player_name and 
-                                                record.get('team') == team_name and 
-                                                record.get('game_id') == game_id):
-                                                player_record = record
-                                                break
-                                        
-                                        # Create new record if not found
-                                        if not player_record:
-                                            base_record = {
-                                                'player': player_name,
-                                                'team': team_name,
-                                                'opponent': opponent_name,
-                                                'position': position,
-                                                'week': week,
-                                                'game_id': game_id,
-                                                'start_time': start_time
-                                            }
-                                            
-                                            # Task 4.3, 4.4, 4.5: Add metadata fields
-                                            enhanced_record = add_standard_metadata(
-                                                base_record,
-                                                league="college",
-                                                source="CollegeFootballData",
-                                                game_time=start_time,
-                                                player_name=player_name,
-                                                team=team_name,
-                                                game_id=game_id
-                                            )
-                                            
-                                            parsed_records.append(enhanced_record)
-                                            player_record = enhanced_record
-                                        
-                                        # Add stat to record
-                                        if category_name == 'passing' and stat_name == 'YDS':
-                                            player_record['passYards'] = stat_value
-                                        elif category_name == 'receiving' and stat_name == 'YDS':
-                                            player_record['receivingYards'] = stat_value
-                                        elif category_name == 'passing' and stat_name == 'C/ATT':
-                                            if '/' in str(stat_value):
-                                                parts = str(stat_value).split('/')
-                                                if len(parts) == 2:
-                                                    try:
-                                                        player_record['completions'] = int(parts[0])
-                                                        player_record['attempts'] = int(parts[1])
-                                                    except ValueError:
-                                                        player_record['completions_attempts'] = stat_value
-                                            else:
-                                                player_record['completions'] = stat_value
-                                        elif stat_name == 'TD':
-                                            if position == 'QB':
-                                                player_record['passTD'] = stat_value
-                                            else:
-                                                player_record['receivingTD'] = stat_value
-                                        elif stat_name == 'REC':
-                                            player_record['receptions'] = stat_value
-                                        elif stat_name == 'INT' and position == 'QB':
-                                            player_record['interceptions'] = stat_value
-                                        
-                                    except Exception as e:
-                                        errors.append(f"Error processing athlete {athlete.get('name', 'unknown')}: {e}")
-                                        continue
-                        
-                    except Exception as e:
-                        errors.append(f"Error processing team {team_data.get('team', 'unknown')}: {e}")
-                        continue
-                        
+                _accumulate_cfb_game(game, player_records, stats)
             except Exception as e:
-                errors.append(f"Error processing game {game.get('id', 'unknown')}: {e}")
+                stats.error('game_error', game.get('id', 'unknown'), e)
                 continue
         
         # Step 3: Filter, validate and clean records
-        validated_records = []
-        for record in parsed_records:
-            try:
-                position = record.get('position')
-                
-                # Ensure minimum required stats for each position
-                has_relevant_stats = False
-                if position == 'QB':
-                    has_relevant_stats = (record.get('passYards') is not None or 
-                                        record.get('completions') is not None)
-                elif position == 'WR':
-                    has_relevant_stats = (record.get('receivingYards') is not None or 
-                                        record.get('receptions') is not None)
-                elif position == 'RB':
-                    has_relevant_stats = record.get('receivingYards') is not None
-                
-                if not has_relevant_stats:
-                    continue
-                
-                # Task 4.6: Validate all required fields and relationships
-                validate_metadata_fields(record, parser_name)
-                validate_no_placeholder_values(record, parser_name)
-                
-                # Additional validation for team/opponent
-                if record.get('team') == record.get('opponent'):
-                    errors.append(f"Team and opponent are the same for {record.get('player')}")
-                    continue
-                
-                validated_records.append(record)
-                
-            except Exception as validation_error:
-                errors.append(f"Validation failed for {record.get('player', 'unknown')}: {validation_error}")
-                continue
+        validated_records = _validate_cfb_records(player_records.values(), stats, parser_name)
         
-        # Step 4: Final quality check
-        if validated_records:
-            placeholder_summary = detect_placeholder_values(validated_records, return_summary=True)
-            if placeholder_summary['has_placeholders']:
-                print(f"⚠️ {parser_name}: {placeholder_summary['records_with_issues']} records have placeholder values")
+        stats.total_records = total_games_processed
+        stats.success_count = len(validated_records)
         
-        # Step 5: Print summary and return results
-        print_parser_summary(parser_name, total_games_processed, len(validated_records), errors if errors else None)
+        # Step 4: Persist any newly assigned player keys for other runs
+        get_player_registry().save()
         
-        if validated_records:
-            print(f"📊 Enhanced Fields Added:")
-            print(f"   • Team/opponent derivation from game structure")
-            print(f"   • Metadata fields (league, season, source, player_id)")
-            print(f"   • Enhanced validation and quality checking")
+        # Step 5: Quality check and summary (verbose only)
+        if stats.verbose and validated_records:
+            placeholder_summary = detect_placeholder_values(validated_records, return_summary=True)
+            stats.count('placeholder_records', placeholder_summary['records_with_issues'])
+        
+        stats.finish().report()
         
         return validated_records
         
     except Exception as e:
-        error_msg = f"Failed to parse {parser_name} data: {e}"
-        print_parser_summary(parser_name, 0, 0, [error_msg])
-        raise ParserError(error_msg) from e
+        stats.error('fatal', e)
+        stats.finish().report()
+        raise ParserError(f"Failed to parse {parser_name} data: {e}") from e
+
+
+def iter_cfb_player_records(data_source: Union[str, List],
+                            stats: Optional[ParseStats] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Streaming variant of parse_cfb_player_stats that yields records game by game.
+    
+    When given a file path and ijson is installed, the top-level games array
+    is read one game at a time, so memory stays bounded by a single game.
+    Without ijson the file is loaded with safe_load_json and iterated lazily.
+    Each game's records are validated and yielded as soon as the game is
+    finished, ready for DataRouter.route_cfb_stats_stream.
+    
+    Records are identical to those returned by parse_cfb_player_stats. No
+    summary is printed unless a verbose ParseStats is passed.
+    
+    Args:
+        data_source: File path to players_YYYY_weekN_regular.json or pre-loaded JSON data
+        stats: Optional ParseStats to fill with counters and error codes
+        
+    Yields:
+        Parsed player stat dictionaries (same fields as parse_cfb_player_stats)
+        
+    Raises:
+        FileNotFoundError: If file path doesn't exist
+        JSONParseError: If JSON parsing fails
+        DataStructureError: If the payload is not a list of games
+    """
+    parser_name = "College Football"
+    stats = stats or ParseStats(parser_name, verbose=False)
+    
+    if isinstance(data_source, str) and IJSON_AVAILABLE:
+        games = _stream_cfb_games(data_source)
+    else:
+        data = safe_load_json(data_source)
+        if not isinstance(data, list):
+            raise DataStructureError(f"{parser_name} data should be a list of games")
+        games = iter(data)
+    
+    try:
+        for game in games:
+            stats.total_records += 1
+            game_records: Dict[Tuple[Any, str, str], Dict[str, Any]] = {}
+            try:
+                _accumulate_cfb_game(game, game_records, stats)
+            except Exception as e:
+                stats.error('game_error', game.get('id', 'unknown'), e)
+                continue
+            
+            for record in _validate_cfb_records(game_records.values(), stats, parser_name):
+                stats.success_count += 1
+                yield record
+    except ijson_errors as e:
+        raise JSONParseError(f"Failed to parse JSON from {data_source}: {e}") from e
+    
+    get_player_registry().save()
+    stats.finish().report()
+
+
+def _stream_cfb_games(file_path: str) -> Iterator[Dict]:
+    """
+    Lazily iterate the top-level games array of a CFB file using ijson.
+    
+    Args:
+        file_path: Path to a CFB players JSON file
+        
+    Yields:
+        One game dictionary at a time
+    """
+    if not resolve_json_file(file_path).exists():
+        raise FileNotFoundError(f"Input file not found: {file_path}")
+    
+    with open_json_file(file_path) as f:
+        yield from ijson.items(f, 'item', use_float=True)
+
+
+def _accumulate_cfb_game(game: Dict[str, Any], player_records: Dict[Tuple[Any, str, str], Dict[str, Any]],
+                         stats: ParseStats) -> None:
+    """
+    Merge one game's athlete stat lines into player_records.
+    
+    Args:
+        game: Game dictionary from the CFB API
+        player_records: Accumulator keyed by (game_id, team, player), updated in place
+        stats: ParseStats receiving error codes
+    """
+    # Extract game-level information
+    game_id = game.get('id')
+    week = game.get('week')
+    start_time = game.get('start_time')
+    
+    # Extract teams information
+    teams_data = safe_get_list(game, 'teams', [])
+    
+    if len(teams_data) < 2:
+        stats.error('insufficient_team_data', game_id)
+        return
+    
+    # Task 4.1 & 4.2: Enhanced team/opponent derivation
+    for team_data in teams_data:
+        try:
+            team_name_raw = team_data.get('team')  # CFB API uses 'team' not 'school'
+            if not team_name_raw:
+                continue
+            
+            # Derive team and opponent using helper function
+            team_name, opponent_name = derive_team_and_opponent_from_cfb_game(game, team_name_raw)
+            
+            # Task 4.6: Validate team/opponent relationships
+            if team_name == opponent_name or team_name == "Unknown Team" or opponent_name == "Unknown Opponent":
+                stats.error('invalid_team_opponent', team_name_raw, game_id)
+                continue
+            
+            # Extract player statistics
+            categories = safe_get_list(team_data, 'categories', [])
+            
+            for category in categories:
+                category_name = category.get('name', '')
+                types = safe_get_list(category, 'types', [])
+                
+                for stat_type in types:
+                    stat_name = stat_type.get('name', '')
+                    athletes = safe_get_list(stat_type, 'athletes', [])
+                    
+                    for athlete in athletes:
+                        try:
+                            player_name = athlete.get('name')
+                            if not player_name or player_name.strip() in [' Team', 'Team', '']:
+                                continue  # Skip team-level stats
+                                
+                            stat_value = athlete.get('stat', '0')
+                            
+                            # Convert stat value to appropriate type
+                            try:
+                                if '/' in str(stat_value):
+                                    stat_value = str(stat_value)
+                                else:
+                                    stat_value = float(stat_value) if '.' in str(stat_value) else int(stat_value)
+                            except (ValueError, TypeError):
+                                stat_value = str(stat_value)
+                            
+                            # Determine position from stat category
+                            position = None
+                            if category_name == 'passing' or stat_name in ['C/ATT', 'YDS', 'AVG', 'TD', 'INT', 'QBR']:
+                                position = 'QB'
+                            elif category_name == 'receiving' or stat_name in ['REC', 'YDS', 'AVG', 'TD', 'LONG']:
+                                position = 'WR'  # Could also be RB receiving
+                            elif category_name == 'rushing':
+                                continue  # We only track receiving stats for RBs
+                            
+                            if not position or position not in VALID_POSITIONS:
+                                continue
+                            
+                            # Create or find existing player record
+                            record_key = (game_id, team_name, player_name)
+                            player_record = player_records.get(record_key)
+                            
+                            # Create new record if not found
+                            if not player_record:
+                                base_record = {
+                                    'player': player_name,
+                                    'team': team_name,
+                                    'opponent': opponent_name,
+                                    'position': position,
+                                    'week': week,
+                                    'game_id': game_id,
+                                    'start_time': start_time
+                                }
+                                
+                                # Task 4.3, 4.4, 4.5: Add metadata fields
+                                enhanced_record = add_standard_metadata(
+                                    base_record,
+                                    league="college",
+                                    source="CollegeFootballData",
+                                    game_time=start_time,
+                                    player_name=player_name,
+                                    team=team_name,
+                                    game_id=game_id,
+                                    source_id=athlete.get('id')
+                                )
+                                
+                                player_records[record_key] = enhanced_record
+                                player_record = enhanced_record
+                            
+                            # Add stat to record
+                            if category_name == 'passing' and stat_name == 'YDS':
+                                player_record['passYards'] = stat_value
+                            elif category_name == 'receiving' and stat_name == 'YDS':
+                                player_record['receivingYards'] = stat_value
+                            elif category_name == 'passing' and stat_name == 'C/ATT':
+                                if '/' in str(stat_value):
+                                    parts = str(stat_value).split('/')
+                                    if len(parts) == 2:
+                                        try:
+                                            player_record['completions'] = int(parts[0])
+                                            player_record['attempts'] = int(parts[1])
+                                        except ValueError:
+                                            player_record['completions_attempts'] = stat_value
+                                else:
+                                    player_record['completions'] = stat_value
+                            elif stat_name == 'TD':
+                                if position == 'QB':
+                                    player_record['passTD'] = stat_value
+                                else:
+                                    player_record['receivingTD'] = stat_value
+                            elif stat_name == 'REC':
+                                player_record['receptions'] = stat_value
+                            elif stat_name == 'INT' and position == 'QB':
+                                player_record['interceptions'] = stat_value
+                            
+                        except Exception as e:
+                            stats.error('athlete_error', athlete.get('name', 'unknown'), e)
+                            continue
+            
+        except Exception as e:
+            stats.error('team_error', team_data.get('team', 'unknown'), e)
+            continue
+
+
+def _validate_cfb_records(records: Iterable[Dict[str, Any]], stats: ParseStats,
+                          parser_name: str) -> List[Dict[str, Any]]:
+    """
+    Keep records with relevant stats that pass metadata and placeholder validation.
+    
+    Args:
+        records: Accumulated player records
+        stats: ParseStats receiving error codes
+        parser_name: Parser name for validation messages
+        
+    Returns:
+        List of validated records
+    """
+    validated_records = []
+    for record in records:
+        try:
+            position = record.get('position')
+            
+            # Ensure minimum required stats for each position
+            has_relevant_stats = False
+            if position == 'QB':
+                has_relevant_stats = (record.get('passYards') is not None or 
+                                    record.get('completions') is not None)
+            elif position == 'WR':
+                has_relevant_stats = (record.get('receivingYards') is not None or 
+                                    record.get('receptions') is not None)
+            elif position == 'RB':
+                has_relevant_stats = record.get('receivingYards') is not None
+            
+            if not has_relevant_stats:
+                continue
+            
+            # Task 4.6: Validate all required fields and relationships
+            validate_metadata_fields(record, parser_name)
+            validate_no_placeholder_values(record, parser_name)
+            
+            # Additional validation for team/opponent
+            if record.get('team') == record.get('opponent'):
+                stats.error('team_equals_opponent', record.get('player'))
+                continue
+            
+            validated_records.append(record)
+            
+        except Exception as validation_error:
+            stats.error('validation_failed', record.get('player', 'unknown'), validation_error)
+            continue
+    
+    return validated_records
 
 
 if __name__ == "__main__":
@@ -297,7 +413,7 @@ if __name__ == "__main__":
             print(f"\n🧪 Testing with {test_file}")
             
             try:
-                results = parse_cfb_player_stats(test_file)
+                results = parse_cfb_player_stats(test_file, verbose=True)
                 print(f"📊 Successfully parsed {len(results)} player records")
                 
                 if results:
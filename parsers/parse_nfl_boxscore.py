@@ -9,14 +9,18 @@ for prop betting analysis.
 import re
 import os
 import json
-from pathlib import Path
-from typing import Dict, List, Any, Union
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
+from typing import Dict, List, Any, Union, Optional, Iterator, Tuple, Callable, NamedTuple
+from .player_registry import PlayerRegistry, get_player_registry, set_player_registry
+from .game_catalog import GameCatalog, get_game_catalog, set_game_catalog
+from .json_backend import glob_json_files
 from .common import (
     safe_load_json,
     safe_get_list,
     safe_get_nested,
     validate_required_fields,
-    print_parser_summary,
+    ParseStats,
     ParserError,
     DataStructureError,
     add_standard_metadata,
@@ -26,13 +30,17 @@ from .common import (
 )
 
 
-def parse_nfl_boxscore(data_source: Union[str, Dict], game_id: str = None) -> List[Dict[str, Any]]:
+def parse_nfl_boxscore(data_source: Union[str, Dict], game_id: str = None,
+                       stats: Optional[ParseStats] = None,
+                       verbose: Optional[bool] = None) -> List[Dict[str, Any]]:
     """
     Enhanced NFL boxscore player statistics parser with comprehensive validation.
     
     Args:
         data_source: File path to boxscore_<eventid>.json or pre-loaded JSON data
         game_id: Game ID (optional, can be parsed from filename)
+        stats: Optional ParseStats to fill with counters, timings and error codes
+        verbose: Print a console summary (None uses set_parser_verbose/PARSER_VERBOSE)
         
     Returns:
         List of dictionaries with enhanced fields:
@@ -45,7 +53,7 @@ def parse_nfl_boxscore(data_source: Union[str, Dict], game_id: str = None) -> Li
         - league: "nfl"
         - season: Integer year from game context (2023)
         - source: "RapidAPI"
-        - player_id: Unique player identifier hash
+        - player_id: Stable player key from the player registry
         - [position-specific stats]: yards, touchdowns, etc.
         
     Raises:
@@ -58,14 +66,15 @@ def parse_nfl_boxscore(data_source: Union[str, Dict], game_id: str = None) -> Li
     """
     parser_name = "NFL Boxscore"
     parsed_records = []
-    errors = []
+    stats = stats or ParseStats(parser_name, verbose)
     
     # Valid positions we want to track (PATCH 1: Added TE and UNK)
     VALID_POSITIONS = ['QB', 'WR', 'RB', 'TE', 'UNK']
     
     try:
         # Step 1: Load and validate input data
-        data = safe_load_json(data_source)
+        with stats.timer('load'):
+            data = safe_load_json(data_source)
         
         # Step 2: Extract game_id from filename if not provided
         parsed_game_id = game_id
@@ -84,7 +93,7 @@ def parse_nfl_boxscore(data_source: Union[str, Dict], game_id: str = None) -> Li
         
         if parsed_game_id is None:
             parsed_game_id = "unknown_game"
-            errors.append("Game ID not found in filename, using 'unknown_game'")
+            stats.error('game_id_not_in_filename')
         
         # Step 3: Validate required structure
         validate_required_fields(data, ['boxscore'], f"{parser_name} JSON structure")
@@ -95,8 +104,8 @@ def parse_nfl_boxscore(data_source: Union[str, Dict], game_id: str = None) -> Li
         players_data = safe_get_list(boxscore, 'players', [])
         
         if not players_data:
-            errors.append("No players data found in boxscore")
-            print_parser_summary(parser_name, 0, 0, errors)
+            stats.error('no_players_data')
+            stats.finish().report()
             return []
         
         # PATCH 2 & 4: Enhanced team/opponent derivation with game metadata
@@ -147,6 +156,7 @@ def parse_nfl_boxscore(data_source: Union[str, Dict], game_id: str = None) -> Li
                         
                         stat_labels = safe_get_list(stat_category, 'labels', [])
                         stat_keys = safe_get_list(stat_category, 'keys', [])
+                        schema = compile_category_schema(category_name, stat_labels)
                         
                         # Process each athlete
                         for athlete_data in athletes:
@@ -165,7 +175,8 @@ def parse_nfl_boxscore(data_source: Union[str, Dict], game_id: str = None) -> Li
                                 
                                 # Task 5.1 & 5.5: Enhanced position classification
                                 actual_position = determine_accurate_position(
-                                    inferred_position, category_name, player_name, stats_array, stat_labels
+                                    inferred_position, category_name, player_name, stats_array, stat_labels,
+                                    schema
                                 )
                                 
                                 if actual_position not in VALID_POSITIONS:
@@ -183,11 +194,11 @@ def parse_nfl_boxscore(data_source: Union[str, Dict], game_id: str = None) -> Li
                                 
                                 # Extract position-specific stats
                                 if actual_position == 'QB' and category_name == 'passing':
-                                    qb_stats = extract_qb_passing_stats(stats_array, stat_labels, stat_keys)
+                                    qb_stats = extract_qb_passing_stats(stats_array, stat_labels, stat_keys, schema)
                                     base_record.update(qb_stats)
                                     
                                 elif actual_position in ['WR', 'RB'] and category_name == 'receiving':
-                                    receiving_stats = extract_receiving_stats(stats_array, stat_labels, stat_keys)
+                                    receiving_stats = extract_receiving_stats(stats_array, stat_labels, stat_keys, schema)
                                     base_record.update(receiving_stats)
                                 
                                 # Task 5.6: Validate meaningful stats
@@ -202,7 +213,8 @@ def parse_nfl_boxscore(data_source: Union[str, Dict], game_id: str = None) -> Li
                                     game_time=game_metadata.get('game_date'),
                                     player_name=player_name,
                                     team=team_name,
-                                    game_id=parsed_game_id
+                                    game_id=parsed_game_id,
+                                    source_id=athlete_info.get('id')
                                 )
                                 
                                 # PATCH 4: Add additional metadata fields
@@ -218,55 +230,326 @@ def parse_nfl_boxscore(data_source: Union[str, Dict], game_id: str = None) -> Li
                                     validate_no_placeholder_values(enhanced_record, parser_name)
                                     parsed_records.append(enhanced_record)
                                 except Exception as validation_error:
-                                    errors.append(f"Validation failed for {player_name}: {validation_error}")
+                                    stats.error('validation_failed', player_name, validation_error)
                                 
                             except Exception as e:
-                                errors.append(f"Error processing athlete {athlete_data.get('athlete', {}).get('displayName', 'unknown')}: {e}")
+                                stats.error('athlete_error', athlete_data.get('athlete', {}).get('displayName', 'unknown'), e)
                                 continue
                         
                     except Exception as e:
-                        errors.append(f"Error processing stat category {stat_category.get('name', 'unknown')}: {e}")
+                        stats.error('stat_category_error', stat_category.get('name', 'unknown'), e)
                         continue
                 
             except Exception as e:
-                errors.append(f"Error processing team {team_index}: {e}")
+                stats.error('team_error', team_index, e)
                 continue
         
-        # Step 6: Final quality check and summary
-        if parsed_records:
-            placeholder_summary = detect_placeholder_values(parsed_records, return_summary=True)
-            if placeholder_summary['has_placeholders']:
-                print(f"⚠️ {parser_name}: {placeholder_summary['records_with_issues']} records have placeholder values")
+        stats.total_records = total_players_processed
+        stats.success_count = len(parsed_records)
         
-        print_parser_summary(parser_name, total_players_processed, len(parsed_records), errors if errors else None)
+        # Step 6: Persist any newly assigned player keys and kickoff times for other runs
+        get_player_registry().save()
+        get_game_catalog().save()
         
-        # Enhanced reporting
-        if parsed_records:
-            positions = {}
-            for record in parsed_records:
-                pos = record.get('position', 'Unknown')
-                positions[pos] = positions.get(pos, 0) + 1
-            
-            print("📋 Position breakdown:")
-            for pos, count in positions.items():
-                print(f"  {pos}: {count} players")
+        # Step 7: Quality check, position breakdown and summary (verbose only)
+        if stats.verbose and parsed_records:
+            placeholder_summary = detect_placeholder_values(parsed_records, return_summary=True)
+            stats.count('placeholder_records', placeholder_summary['records_with_issues'])
             
-            print(f"📊 Enhanced Fields Added:")
-            print(f"   • Improved position accuracy (RB vs WR distinction)")
-            print(f"   • Opponent field derivation from game data")
-            print(f"   • Metadata fields (league, season, source, player_id)")
-            print(f"   • Enhanced validation and quality checking")
+            for record in parsed_records:
+                stats.count(f"position_{record.get('position', 'Unknown')}")
+        
+        stats.finish().report()
         
         return parsed_records
         
     except Exception as e:
-        error_msg = f"Failed to parse {parser_name} data: {e}"
-        print_parser_summary(parser_name, 0, 0, [error_msg])
-        raise ParserError(error_msg) from e
+        stats.error('fatal', e)
+        stats.finish().report()
+        raise ParserError(f"Failed to parse {parser_name} data: {e}") from e
+
+
+# Registry state each worker process starts every file from (set by _init_boxscore_worker)
+_worker_registry_state: Optional[Dict[str, Any]] = None
+
+
+def _init_boxscore_worker(registry_state: Dict[str, Any], catalog_state: Dict[str, Any]) -> None:
+    """
+    Seed a worker process with the parent's player registry and game catalog.
+    
+    Both are memory-only in the worker; nothing is written to disk there.
+    """
+    global _worker_registry_state
+    _worker_registry_state = registry_state
+    set_game_catalog(GameCatalog.from_dict(catalog_state))
+
+
+def _parse_boxscore_worker(file_path: str) -> Tuple[str, Optional[List[Dict[str, Any]]], Dict[int, Dict[str, Any]], Optional[str]]:
+    """
+    Parse one boxscore file in a worker process.
+    
+    Each file starts from a fresh copy of the seeded registry so the keys a
+    worker assigns to new players only ever refer to players from that file.
+    
+    Returns:
+        Tuple of (file_path, records or None, new players by worker key, error message or None)
+    """
+    if _worker_registry_state is not None:
+        set_player_registry(PlayerRegistry.from_dict(_worker_registry_state))
+    registry = get_player_registry()
+    first_key = registry.next_key
+    
+    try:
+        records = parse_nfl_boxscore(file_path, verbose=False)
+    except Exception as e:
+        return file_path, None, {}, str(e)
+    
+    return file_path, records, registry.new_players_since(first_key), None
+
+
+def _merge_worker_players(records: List[Dict[str, Any]], new_players: Dict[int, Dict[str, Any]],
+                          registry: PlayerRegistry) -> None:
+    """
+    Re-key players first seen in a worker against the parent registry.
+    
+    Args:
+        records: Parsed records from the worker (player_id rewritten in place)
+        new_players: Worker key -> player info from new_players_since()
+        registry: Parent process registry
+    """
+    if not new_players:
+        return
+    
+    key_map = {}
+    for worker_key, info in new_players.items():
+        aliases = info.get('aliases') or [(info.get('source'), None)]
+        for source, source_id in aliases:
+            parent_key = registry.resolve(info['name'], info['team'], info['league'],
+                                          source, source_id, info.get('position'))
+        key_map[str(worker_key)] = parent_key
+    
+    for record in records:
+        parent_key = key_map.get(record.get('player_id'))
+        if parent_key is not None:
+            record['player_id'] = parent_key
+
+
+def parse_boxscore_directory(path: str, workers: Optional[int] = None, ordered: bool = False,
+                             pattern: str = 'boxscore_*.json',
+                             errors: Optional[List[str]] = None) -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
+    """
+    Parse every boxscore file in a directory using a pool of worker processes.
+    
+    Workers are seeded once with the current player registry and game catalog
+    (team tables are module constants and shared with the pool). Player keys
+    assigned in workers are re-keyed against this process's registry as
+    results arrive, so player_id values stay consistent with serial parsing.
+    With ordered=True, newly assigned keys are also deterministic.
+    
+    Args:
+        path: Directory containing boxscore_<eventid>.json files (.json.gz / .json.zst also match)
+        workers: Number of worker processes (None uses os.cpu_count(), 1 parses in-process)
+        ordered: Yield results in sorted filename order instead of completion order
+        pattern: Glob pattern for boxscore files
+        errors: Optional list that receives "<file>: <message>" for files that failed
+        
+    Yields:
+        Tuples of (file_path, parsed records) for each successfully parsed file
+    """
+    file_paths = [str(file_path) for file_path in glob_json_files(path, pattern)]
+    if not file_paths:
+        return
+    
+    workers = min(workers or os.cpu_count() or 1, len(file_paths))
+    registry = get_player_registry()
+    
+    # Step 1: Small jobs (or workers=1) are cheaper to parse in-process
+    if workers <= 1:
+        for file_path in file_paths:
+            try:
+                yield file_path, parse_nfl_boxscore(file_path, verbose=False)
+            except Exception as e:
+                if errors is not None:
+                    errors.append(f"{file_path}: {e}")
+        return
+    
+    # Step 2: Fan out, seeding each worker with the shared registry and catalog
+    initargs = (registry.to_dict(), get_game_catalog().to_dict())
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_boxscore_worker,
+                             initargs=initargs) as executor:
+        if ordered:
+            results = executor.map(_parse_boxscore_worker, file_paths)
+        else:
+            futures = [executor.submit(_parse_boxscore_worker, file_path) for file_path in file_paths]
+            results = (future.result() for future in as_completed(futures))
+        
+        # Step 3: Merge new players into the parent registry as results arrive
+        for file_path, records, new_players, error in results:
+            if error is not None:
+                if errors is not None:
+                    errors.append(f"{file_path}: {error}")
+                continue
+            _merge_worker_players(records, new_players, registry)
+            yield file_path, records
+    
+    registry.save()
+
+
+# Known player position mappings (can be expanded)
+KNOWN_PLAYER_POSITIONS = {
+    'Travis Kelce': 'TE',
+    'Tyreek Hill': 'WR', 
+    'Derrick Henry': 'RB',
+    'Aaron Rodgers': 'QB',
+    'Josh Allen': 'QB',
+    'Cooper Kupp': 'WR',
+    'Alvin Kamara': 'RB',
+    'Davante Adams': 'WR',
+    'Rob Gronkowski': 'TE',
+    'Christian McCaffrey': 'RB'
+}
+
+
+class CategorySchema(NamedTuple):
+    """
+    Compiled column layout for one boxscore stat category.
+    
+    columns holds (index, handler) pairs applied to each athlete's stats array
+    positionally; volume_columns holds (index, name) pairs read by the
+    receiving position heuristics.
+    """
+    category_name: str
+    columns: Tuple[Tuple[int, Callable[[Dict[str, Any], Any], None]], ...]
+    volume_columns: Tuple[Tuple[int, str], ...]
+
+
+def _field_handler(field_name: str) -> Callable[[Dict[str, Any], Any], None]:
+    """Build a handler that stores the converted stat value under field_name."""
+    def handler(stats: Dict[str, Any], stat_value: Any) -> None:
+        stats[field_name] = convert_stat_value(stat_value)
+    return handler
+
+
+def _completions_attempts_handler(stats: Dict[str, Any], stat_value: Any) -> None:
+    """Split "20/30" into completions and attempts."""
+    if '/' not in str(stat_value):
+        stats['completions_attempts'] = convert_stat_value(stat_value)
+        return
+    
+    parts = str(stat_value).split('/')
+    if len(parts) == 2:
+        try:
+            stats['completions'] = int(parts[0])
+            stats['attempts'] = int(parts[1])
+        except ValueError:
+            stats['completions_attempts'] = stat_value
+
+
+def _sacks_handler(stats: Dict[str, Any], stat_value: Any) -> None:
+    """PATCH 3: Split sacks field "4-11" into sacks: 4, sack_yards_lost: 11."""
+    stats.update(parse_sacks_field(stat_value))
+
+
+# Label -> field mappings per category; unlisted labels use label.lower()
+PASSING_LABEL_FIELDS = {
+    'C/ATT': 'completions_attempts',
+    'YDS': 'passing_yards',
+    'AVG': 'yards_per_attempt',
+    'TD': 'passing_touchdowns',
+    'INT': 'interceptions',
+    'SACKS': 'sacks',
+    'QBR': 'qbr',
+    'RTG': 'rating'
+}
+
+RECEIVING_LABEL_FIELDS = {
+    'REC': 'receptions',
+    'YDS': 'receiving_yards',
+    'AVG': 'yards_per_reception',
+    'TD': 'receiving_touchdowns',
+    'LONG': 'longest_reception',
+    'TARGETS': 'targets'
+}
+
+_SPECIAL_LABEL_HANDLERS = {
+    'passing': {'C/ATT': _completions_attempts_handler, 'SACKS': _sacks_handler},
+    'receiving': {}
+}
+
+_CATEGORY_LABEL_FIELDS = {
+    'passing': PASSING_LABEL_FIELDS,
+    'receiving': RECEIVING_LABEL_FIELDS
+}
+
+# Labels read by the receiving RB/WR/TE volume heuristics
+_VOLUME_LABELS = {
+    'REC': 'receptions',
+    'YDS': 'receiving_yards',
+    'TARGETS': 'targets'
+}
+
+
+def compile_category_schema(category_name: str, labels: List) -> CategorySchema:
+    """
+    Compile a stat category's labels into a positional column mapping.
+    
+    Schemas are cached by (category, labels), so each distinct layout is
+    compiled once per process and every athlete is then handled with plain
+    index lookups.
+    
+    Args:
+        category_name: Statistics category (e.g., "passing", "receiving")
+        labels: Category stat labels (e.g., ["C/ATT", "YDS", ...])
+        
+    Returns:
+        CategorySchema for the category
+    """
+    return _compile_category_schema_cached(category_name, tuple(labels))
+
+
+@lru_cache(maxsize=64)
+def _compile_category_schema_cached(category_name: str, labels: Tuple) -> CategorySchema:
+    label_fields = _CATEGORY_LABEL_FIELDS.get(category_name)
+    special_handlers = _SPECIAL_LABEL_HANDLERS.get(category_name, {})
+    
+    columns = []
+    if label_fields is not None:
+        for index, label in enumerate(labels):
+            handler = special_handlers.get(label)
+            if handler is None:
+                handler = _field_handler(label_fields.get(label, label.lower()))
+            columns.append((index, handler))
+    
+    volume_columns = ()
+    if category_name == 'receiving':
+        volume_columns = tuple((index, _VOLUME_LABELS[label]) for index, label in enumerate(labels)
+                               if label in _VOLUME_LABELS)
+    
+    return CategorySchema(category_name, tuple(columns), volume_columns)
+
+
+def apply_category_schema(schema: CategorySchema, stats_array: List) -> Dict[str, Any]:
+    """
+    Map an athlete's stats array to named fields using a compiled schema.
+    
+    Args:
+        schema: CategorySchema from compile_category_schema()
+        stats_array: Array of stat values
+        
+    Returns:
+        Dictionary of stat fields
+    """
+    stats = {}
+    stats_count = len(stats_array)
+    for index, handler in schema.columns:
+        if index < stats_count:
+            handler(stats, stats_array[index])
+    return stats
 
 
 def determine_accurate_position(inferred_position: str, category_name: str, 
-                               player_name: str, stats_array: List, stat_labels: List) -> str:
+                               player_name: str, stats_array: List, stat_labels: List,
+                               schema: Optional[CategorySchema] = None) -> str:
     """
     PATCH 1: Enhanced position classification with external metadata fallback hierarchy.
     
@@ -281,6 +564,7 @@ def determine_accurate_position(inferred_position: str, category_name: str,
         player_name: Player's name for metadata lookup
         stats_array: Array of stat values
         stat_labels: Array of stat labels
+        schema: Precompiled schema for the category (compiled from stat_labels if omitted)
         
     Returns:
         Refined position (QB, WR, RB, TE, UNK)
@@ -296,25 +580,19 @@ def determine_accurate_position(inferred_position: str, category_name: str,
     
     # For receiving, use enhanced RB/WR/TE distinction
     if category_name == 'receiving':
-        receptions = 0
-        receiving_yards = 0
-        targets = 0
+        if schema is None:
+            schema = compile_category_schema(category_name, stat_labels)
         
         # Extract receiving stats for analysis
-        for i, stat_value in enumerate(stats_array):
-            if i < len(stat_labels):
-                label = stat_labels[i]
-                try:
-                    numeric_value = convert_stat_value(stat_value)
-                    if isinstance(numeric_value, (int, float)):
-                        if label == 'REC':
-                            receptions = numeric_value
-                        elif label == 'YDS':
-                            receiving_yards = numeric_value
-                        elif label == 'TARGETS':
-                            targets = numeric_value
-                except:
-                    pass
+        volume = {'receptions': 0, 'receiving_yards': 0, 'targets': 0}
+        stats_count = len(stats_array)
+        for index, name in schema.volume_columns:
+            if index < stats_count:
+                numeric_value = convert_stat_value(stats_array[index])
+                if isinstance(numeric_value, (int, float)):
+                    volume[name] = numeric_value
+        receptions = volume['receptions']
+        receiving_yards = volume['receiving_yards']
         
         # Enhanced heuristics for RB vs WR vs TE
         if receptions <= 2 and receiving_yards <= 30:
@@ -353,73 +631,22 @@ def get_player_position_from_metadata(player_name: str) -> str:
     Returns:
         Position from external source or None
     """
-    # Known player position mappings (can be expanded)
-    known_positions = {
-        'Travis Kelce': 'TE',
-        'Tyreek Hill': 'WR', 
-        'Derrick Henry': 'RB',
-        'Aaron Rodgers': 'QB',
-        'Josh Allen': 'QB',
-        'Cooper Kupp': 'WR',
-        'Alvin Kamara': 'RB',
-        'Davante Adams': 'WR',
-        'Rob Gronkowski': 'TE',
-        'Christian McCaffrey': 'RB'
-    }
-    
-    return known_positions.get(player_name, None)
+    return KNOWN_PLAYER_POSITIONS.get(player_name, None)
 
 
-def extract_qb_passing_stats(stats_array: List, labels: List, keys: List) -> Dict[str, Any]:
+def extract_qb_passing_stats(stats_array: List, labels: List, keys: List,
+                             schema: Optional[CategorySchema] = None) -> Dict[str, Any]:
     """
     Extract QB passing statistics from stats array.
     
+    Pass a schema from compile_category_schema('passing', labels) to skip
+    the label lookup for each athlete.
+    
     Returns dict with: yards, completions, attempts, touchdowns, interceptions
     """
-    qb_stats = {}
-    
-    # Common label mappings for QB stats
-    label_mappings = {
-        'C/ATT': 'completions_attempts',
-        'YDS': 'yards',
-        'AVG': 'yards_per_attempt',
-        'TD': 'touchdowns',
-        'INT': 'interceptions',
-        'SACKS': 'sacks',
-        'QBR': 'qbr',
-        'RTG': 'rating'
-    }
-    
-    # Map stats to labels
-    for i, stat_value in enumerate(stats_array):
-        if i < len(labels):
-            label = labels[i]
-            field_name = label_mappings.get(label, label.lower())
-            
-            # Handle special cases
-            if label == 'C/ATT' and '/' in str(stat_value):
-                # Split completions/attempts
-                parts = str(stat_value).split('/')
-                if len(parts) == 2:
-                    try:
-                        qb_stats['completions'] = int(parts[0])
-                        qb_stats['attempts'] = int(parts[1])
-                    except ValueError:
-                        qb_stats['completions_attempts'] = stat_value
-            elif label == 'YDS':
-                qb_stats['passing_yards'] = convert_stat_value(stat_value)
-            elif label == 'TD':
-                qb_stats['passing_touchdowns'] = convert_stat_value(stat_value)
-            elif label == 'INT':
-                qb_stats['interceptions'] = convert_stat_value(stat_value)
-            elif label == 'SACKS':
-                # PATCH 3: Split sacks field "4-11" into sacks: 4, sack_yards_lost: 11
-                sacks_info = parse_sacks_field(stat_value)
-                qb_stats.update(sacks_info)
-            else:
-                qb_stats[field_name] = convert_stat_value(stat_value)
-    
-    return qb_stats
+    if schema is None:
+        schema = compile_category_schema('passing', labels)
+    return apply_category_schema(schema, stats_array)
 
 
 def parse_sacks_field(sacks_value: Any) -> Dict[str, Any]:
@@ -463,41 +690,19 @@ def parse_sacks_field(sacks_value: Any) -> Dict[str, Any]:
     return sacks_info
 
 
-def extract_receiving_stats(stats_array: List, labels: List, keys: List) -> Dict[str, Any]:
+def extract_receiving_stats(stats_array: List, labels: List, keys: List,
+                            schema: Optional[CategorySchema] = None) -> Dict[str, Any]:
     """
     Extract receiving statistics from stats array.
     
+    Pass a schema from compile_category_schema('receiving', labels) to skip
+    the label lookup for each athlete.
+    
     Returns dict with: yards, receptions, targets, touchdowns
     """
-    receiving_stats = {}
-    
-    # Common label mappings for receiving stats
-    label_mappings = {
-        'REC': 'receptions',
-        'YDS': 'yards',
-        'AVG': 'yards_per_reception',
-        'TD': 'touchdowns',
-        'LONG': 'longest_reception',
-        'TARGETS': 'targets'
-    }
-    
-    # Map stats to labels
-    for i, stat_value in enumerate(stats_array):
-        if i < len(labels):
-            label = labels[i]
-            field_name = label_mappings.get(label, label.lower())
-            
-            # Handle special cases
-            if label == 'YDS':
-                receiving_stats['receiving_yards'] = convert_stat_value(stat_value)
-            elif label == 'TD':
-                receiving_stats['receiving_touchdowns'] = convert_stat_value(stat_value)
-            elif label == 'REC':
-                receiving_stats['receptions'] = convert_stat_value(stat_value)
-            else:
-                receiving_stats[field_name] = convert_stat_value(stat_value)
-    
-    return receiving_stats
+    if schema is None:
+        schema = compile_category_schema('receiving', labels)
+    return apply_category_schema(schema, stats_array)
 
 
 def convert_stat_value(value: Any) -> Any:
@@ -540,59 +745,45 @@ def has_meaningful_stats(record: Dict, position: str) -> bool:
 
 def lookup_game_metadata_from_files(game_id: str) -> Dict[str, Any]:
     """
-    Look up week and year information for a game ID from parsed NFL games files.
+    Look up week and year information for a game ID from the game catalog.
+    
+    The catalog is built from the parsed NFL games files once per process
+    (see parsers.game_catalog), so each lookup is a dict hit.
     
     Args:
         game_id: NFL game event ID (e.g., "401547353")
         
     Returns:
-        Dict with game metadata: {'week': int, 'year': int, 'type': int}
+        Dict with game metadata: {'week': int, 'year': int, 'type': int, 'kickoff': str}
         Returns None values if not found.
     """
-    metadata = {
-        'week': None,
-        'year': None,
-        'type': None
+    entry = get_game_catalog().get(game_id) or {}
+    
+    return {
+        'week': entry.get('week'),
+        'year': entry.get('year'),
+        'type': entry.get('type'),
+        'kickoff': entry.get('kickoff')
     }
+
+
+def is_boxscore_final(boxscore_data: Dict) -> bool:
+    """
+    Check whether a boxscore payload is for a finished game.
     
-    try:
-        # Look for parsed NFL games files in parsed_data/nfl_stats/
-        parsed_data_dir = Path("parsed_data/nfl_stats")
-        if not parsed_data_dir.exists():
-            return metadata
-            
-        # Find games_*_parsed.json files
-        games_files = list(parsed_data_dir.glob("games_*_parsed.json"))
-        
-        for games_file in games_files:
-            try:
-                with open(games_file, 'r') as f:
-                    games_data = json.load(f)
-                
-                # Check if our game_id is in this file's game_ids list
-                game_ids = games_data.get('game_ids', [])
-                if game_id in game_ids:
-                    # Extract metadata from filename and content
-                    metadata['week'] = games_data.get('week')
-                    metadata['year'] = games_data.get('year')
-                    
-                    # Try to extract type from filename (e.g., games_2023_week1_type2_parsed.json)
-                    filename = games_file.name
-                    if 'type' in filename:
-                        type_match = re.search(r'type(\d+)', filename)
-                        if type_match:
-                            metadata['type'] = int(type_match.group(1))
-                    
-                    return metadata
-                    
-            except Exception as e:
-                # Skip files that can't be parsed
-                continue
-                
-    except Exception:
-        pass  # Return default metadata if lookup fails
+    Reads header.competitions[0].status.type (top-level or under 'boxscore');
+    a game is final when it is marked completed or its state is 'post'.
     
-    return metadata
+    Args:
+        boxscore_data: Raw boxscore JSON data
+        
+    Returns:
+        True if the game is over and its stats will not change
+    """
+    header = boxscore_data.get('header') or boxscore_data.get('boxscore', {}).get('header') or {}
+    competitions = header.get('competitions') or [{}]
+    status_type = (competitions[0].get('status') or {}).get('type') or {}
+    return bool(status_type.get('completed')) or status_type.get('state') == 'post'
 
 
 def extract_game_metadata(boxscore_data: Dict, game_id: str) -> Dict[str, Any]:
@@ -633,6 +824,11 @@ def extract_game_metadata(boxscore_data: Dict, game_id: str) -> Dict[str, Any]:
             game_date = header.get('gameDate') or header.get('date')
             if game_date:
                 metadata['game_date'] = game_date
+                get_game_catalog().set_kickoff(game_id, game_date)
+        
+        # Fall back to a kickoff recorded in the catalog
+        if metadata['game_date'] is None and games_metadata['kickoff']:
+            metadata['game_date'] = games_metadata['kickoff']
                 
         # If we have week but no game_date, try to derive from season context
         if metadata['week'] is not None and metadata['game_date'] is None:
@@ -681,6 +877,26 @@ def derive_opponent_with_cross_reference(team_name: str, team_names: List[str],
     return "TBD"
 
 
+# Common team abbreviation mappings
+TEAM_ABBREVIATION_MAP = {
+    'LAS VEGAS': 'LV',
+    'LAS VEGAS RAIDERS': 'LV',
+    'RAIDERS': 'LV',
+    'LOS ANGELES RAMS': 'LAR',
+    'LOS ANGELES CHARGERS': 'LAC',
+    'NEW ENGLAND': 'NE',
+    'NEW ENGLAND PATRIOTS': 'NE',
+    'NEW YORK GIANTS': 'NYG',
+    'NEW YORK JETS': 'NYJ',
+    'TAMPA BAY': 'TB',
+    'TAMPA BAY BUCCANEERS': 'TB',
+    'GREEN BAY': 'GB',
+    'GREEN BAY PACKERS': 'GB',
+    'SAN FRANCISCO': 'SF',
+    'SAN FRANCISCO 49ERS': 'SF'
+}
+
+
 def normalize_team_abbreviation(team_name: str) -> str:
     """
     PATCH 5: Standardize team abbreviations to match dataset conventions.
@@ -691,30 +907,11 @@ def normalize_team_abbreviation(team_name: str) -> str:
     Returns:
         Normalized team abbreviation
     """
-    # Common team abbreviation mappings
-    abbreviation_map = {
-        'LAS VEGAS': 'LV',
-        'LAS VEGAS RAIDERS': 'LV',
-        'RAIDERS': 'LV',
-        'LOS ANGELES RAMS': 'LAR',
-        'LOS ANGELES CHARGERS': 'LAC',
-        'NEW ENGLAND': 'NE',
-        'NEW ENGLAND PATRIOTS': 'NE',
-        'NEW YORK GIANTS': 'NYG',
-        'NEW YORK JETS': 'NYJ',
-        'TAMPA BAY': 'TB',
-        'TAMPA BAY BUCCANEERS': 'TB',
-        'GREEN BAY': 'GB',
-        'GREEN BAY PACKERS': 'GB',
-        'SAN FRANCISCO': 'SF',
-        'SAN FRANCISCO 49ERS': 'SF'
-    }
-    
     # Normalize to uppercase for consistent matching
     normalized = team_name.upper().strip()
     
     # Return mapped abbreviation or original if not found
-    return abbreviation_map.get(normalized, team_name.upper()[:3])
+    return TEAM_ABBREVIATION_MAP.get(normalized, team_name.upper()[:3])
 
 
 def normalize_position_casing(position: str) -> str:
@@ -792,7 +989,7 @@ if __name__ == "__main__":
             print(f"\n🧪 Testing with {os.path.basename(test_file)}")
             
             try:
-                results = parse_nfl_boxscore(test_file)
+                results = parse_nfl_boxscore(test_file, verbose=True)
                 print(f"📊 Successfully parsed {len(results)} player records")
                 
                 if results:
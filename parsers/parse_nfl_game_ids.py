@@ -7,18 +7,22 @@ It extracts event IDs and provides structured output for downstream processing.
 
 import re
 import os
-from typing import Dict, List, Any, Union
+from typing import Dict, List, Any, Union, Optional
+from .game_catalog import get_game_catalog
 from .common import (
     safe_load_json,
     safe_get_list,
     validate_required_fields,
-    print_parser_summary,
+    ParseStats,
     ParserError,
     DataStructureError
 )
 
 
-def parse_nfl_game_ids(data_source: Union[str, Dict], week: int = None, year: int = None) -> Dict[str, Any]:
+def parse_nfl_game_ids(data_source: Union[str, Dict], week: int = None, year: int = None,
+                       stats: Optional[ParseStats] = None,
+                       verbose: Optional[bool] = None,
+                       game_type: int = None) -> Dict[str, Any]:
     """
     Parse NFL game IDs from weekly game data.
     
@@ -26,6 +30,9 @@ def parse_nfl_game_ids(data_source: Union[str, Dict], week: int = None, year: in
         data_source: File path to games_YYYY_weekN_typeT.json or pre-loaded JSON data
         week: Week number (optional, can be parsed from filename)
         year: Year (optional, can be parsed from filename)
+        stats: Optional ParseStats to fill with counters, timings and error codes
+        verbose: Print a console summary (None uses set_parser_verbose/PARSER_VERBOSE)
+        game_type: Season type for the game catalog (optional, can be parsed from filename)
         
     Returns:
         Dictionary with keys: week, year, game_ids (list of event IDs)
@@ -37,15 +44,17 @@ def parse_nfl_game_ids(data_source: Union[str, Dict], week: int = None, year: in
         ParserError: For other parsing-related errors
     """
     parser_name = "NFL Game IDs"
-    errors = []
+    stats = stats or ParseStats(parser_name, verbose)
     
     try:
         # Step 1: Load and validate input data
-        data = safe_load_json(data_source)
+        with stats.timer('load'):
+            data = safe_load_json(data_source)
         
         # Step 2: Extract week and year from filename if not provided
         parsed_week = week
         parsed_year = year
+        parsed_type = game_type
         
         if isinstance(data_source, str) and (parsed_week is None or parsed_year is None):
             # Try to parse filename: games_YYYY_weekN_typeT.json
@@ -60,7 +69,9 @@ def parse_nfl_game_ids(data_source: Union[str, Dict], week: int = None, year: in
                     parsed_year = int(match.group(1))
                 if parsed_week is None:
                     parsed_week = int(match.group(2))
-                # Note: type is match.group(3) but we don't need it for output
+                # Type is not part of the output but is recorded in the game catalog
+                if parsed_type is None:
+                    parsed_type = int(match.group(3))
             else:
                 # Fallback: try simpler patterns
                 year_match = re.search(r'(\d{4})', filename)
@@ -74,11 +85,11 @@ def parse_nfl_game_ids(data_source: Union[str, Dict], week: int = None, year: in
         # Set defaults if still not found
         if parsed_year is None:
             parsed_year = 2023  # Default year
-            errors.append("Year not found in filename, defaulting to 2023")
+            stats.error('year_not_in_filename')
         
         if parsed_week is None:
             parsed_week = 1  # Default week
-            errors.append("Week not found in filename, defaulting to 1")
+            stats.error('week_not_in_filename')
         
         # Step 3: Validate required fields
         validate_required_fields(data, ['items'], f"{parser_name} JSON structure")
@@ -87,7 +98,7 @@ def parse_nfl_game_ids(data_source: Union[str, Dict], week: int = None, year: in
         items = safe_get_list(data, 'items', [])
         
         if not items:
-            errors.append("No items found in data - empty game list")
+            stats.error('no_items')
             game_ids = []
         else:
             game_ids = []
@@ -102,12 +113,12 @@ def parse_nfl_game_ids(data_source: Union[str, Dict], week: int = None, year: in
                         if event_id:  # Make sure it's not empty after stripping
                             game_ids.append(event_id)
                         else:
-                            errors.append(f"Empty eventid found in item {i}")
+                            stats.error('empty_eventid', i)
                     else:
-                        errors.append(f"Missing eventid in item {i}: {item}")
+                        stats.error('missing_eventid', i)
                         
                 except Exception as e:
-                    errors.append(f"Error processing item {i}: {e}")
+                    stats.error('item_error', i, e)
                     continue
         
         # Step 5: Create structured output
@@ -117,22 +128,26 @@ def parse_nfl_game_ids(data_source: Union[str, Dict], week: int = None, year: in
             'game_ids': game_ids
         }
         
-        # Step 6: Print summary and return results
-        total_items = len(items)
-        successful_extractions = len(game_ids)
+        # Step 6: Record the games in the catalog used by the boxscore parser
+        catalog = get_game_catalog()
+        catalog.add_games(game_ids, parsed_year, parsed_week, parsed_type)
+        catalog.save()
         
-        print_parser_summary(parser_name, total_items, successful_extractions, errors if errors else None)
+        # Step 7: Record summary and return results
+        stats.total_records = len(items)
+        stats.success_count = len(game_ids)
+        stats.finish().report()
         
-        # Print additional context
-        print(f"📅 Parsed: {parsed_year} Season, Week {parsed_week}")
-        print(f"🎯 Extracted {successful_extractions} game IDs")
+        if stats.verbose:
+            print(f"📅 Parsed: {parsed_year} Season, Week {parsed_week}")
+            print(f"🎯 Extracted {len(game_ids)} game IDs")
         
         return result
         
     except Exception as e:
-        error_msg = f"Failed to parse {parser_name} data: {e}"
-        print_parser_summary(parser_name, 0, 0, [error_msg])
-        raise ParserError(error_msg) from e
+        stats.error('fatal', e)
+        stats.finish().report()
+        raise ParserError(f"Failed to parse {parser_name} data: {e}") from e
 
 
 def extract_game_ids_only(data_source: Union[str, Dict]) -> List[str]:
@@ -179,7 +194,7 @@ if __name__ == "__main__":
         if os.path.exists(test_file):
             print(f"\n🧪 Testing with {test_file}")
             try:
-                result = parse_nfl_game_ids(test_file)
+                result = parse_nfl_game_ids(test_file, verbose=True)
                 
                 print(f"📊 Parsing Results:")
                 print(f"  Year: {result['year']}")
@@ -4,34 +4,65 @@ PrizePicks NFL Projections Parser
 This module parses PrizePicks NFL projection data from JSON files.
 It handles the complex structure with data[] and included[] arrays,
 creating lookup dictionaries for players, teams, and markets.
+
+The included[] array is indexed once per payload by (type, id), and each
+referenced player is resolved once and shared by all derivation helpers,
+so a full board parses in time linear in len(data) + len(included).
+
+iter_prizepicks_records() exposes the same parsing as a generator; with the
+optional ijson package installed it streams the file instead of loading it.
+
+diff_prizepicks_board() compares a fresh board against the previous poll's
+snapshot (projection_id -> line_score) and parses only added or moved lines.
 """
 
-from typing import Dict, List, Any, Union
+import os
+from typing import Dict, List, Any, Union, Iterator, Optional, Tuple
+from .json_backend import dump_json_file, open_json_file, resolve_json_file
+from .player_registry import get_player_registry
 from .common import (
     safe_load_json,
     safe_get_list,
     safe_get_nested,
     validate_required_fields,
-    print_parser_summary,
+    format_parse_error,
+    ParseStats,
     ParserError,
+    JSONParseError,
+    FileNotFoundError,
     DataStructureError,
     derive_team_from_prizepicks,
     derive_opponent_from_prizepicks,
     derive_position_from_prizepicks,
     derive_game_time_from_prizepicks,
+    build_included_index,
+    resolve_prizepicks_player,
     add_standard_metadata,
     validate_metadata_fields,
     validate_no_placeholder_values,
     detect_placeholder_values
 )
 
+# Optional incremental JSON reader for streaming large payloads
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+    ijson_errors = (ijson.JSONError, ijson.IncompleteJSONError)
+except ImportError:
+    ijson = None
+    IJSON_AVAILABLE = False
+    ijson_errors = ()
 
-def parse_prizepicks_data(data_source: Union[str, Dict]) -> List[Dict[str, Any]]:
+
+def parse_prizepicks_data(data_source: Union[str, Dict], stats: Optional[ParseStats] = None,
+                          verbose: Optional[bool] = None) -> List[Dict[str, Any]]:
     """
     Enhanced PrizePicks NFL projection data parser with comprehensive validation.
     
     Args:
         data_source: File path to nfl_projections.json or pre-loaded JSON data
+        stats: Optional ParseStats to fill with counters, timings and error codes
+        verbose: Print a console summary (None uses set_parser_verbose/PARSER_VERBOSE)
         
     Returns:
         List of dictionaries with enhanced fields:
@@ -46,7 +77,7 @@ def parse_prizepicks_data(data_source: Union[str, Dict]) -> List[Dict[str, Any]]
         - league: "nfl" or "college"
         - season: Integer year (derived from game_time)
         - source: "PrizePicks"
-        - player_id: Unique player identifier hash
+        - player_id: Stable player key from the player registry
         - odds_type: Odds type from projection or "standard"
         
     Raises:
@@ -59,144 +90,396 @@ def parse_prizepicks_data(data_source: Union[str, Dict]) -> List[Dict[str, Any]]
     """
     parser_name = "PrizePicks"
     parsed_records = []
-    errors = []
+    stats = stats or ParseStats(parser_name, verbose)
     
     try:
         # Step 1: Load and validate input data
-        data = safe_load_json(data_source)
+        with stats.timer('load'):
+            data = safe_load_json(data_source)
         
         # Step 2: Validate required top-level fields
         validate_required_fields(data, ['data', 'included'], f"{parser_name} JSON structure")
         
-        # Step 3: Get included data for relationship lookups
-        included_data = safe_get_list(data, 'included', [])
+        # Step 3: Index included data once for O(1) relationship lookups
+        with stats.timer('index'):
+            included_data = safe_get_list(data, 'included', [])
+            included_index = build_included_index(included_data)
+        player_cache = {}
         
         # Step 4: Parse data[] array to extract projection records
         projections = safe_get_list(data, 'data', [])
+        stats.total_records = len(projections)
         
-        for projection in projections:
-            try:
-                # Extract basic projection data
-                projection_id = projection.get('id', '')
-                attributes = projection.get('attributes', {})
-                
-                # Extract stat type and line score
-                stat_type = attributes.get('stat_type', 'unknown')
-                line_score = attributes.get('line_score')
-                
-                # Convert line_score to float if possible
-                if line_score is not None:
-                    try:
-                        line_score = float(line_score)
-                    except (ValueError, TypeError):
-                        line_score = None
-                
-                # Task 2.1: Enhanced team derivation using helper function
-                team = derive_team_from_prizepicks(projection, included_data)
-                
-                # Task 2.2: Enhanced opponent derivation using helper function  
-                opponent = derive_opponent_from_prizepicks(projection, included_data)
-                
-                # Task 2.3: Position field extraction using helper function
-                position = derive_position_from_prizepicks(projection, included_data)
-                
-                # Task 2.4: Fix game_time field using helper function
-                game_time = derive_game_time_from_prizepicks(projection, included_data)
-                
-                # Task 2.6: Add odds_type field with fallback
-                odds_type = attributes.get('odds_type', 'standard')
-                
-                # Extract player name from relationships
-                player_name = "Unknown Player"
-                player_id_raw = None
-                relationships = projection.get('relationships', {})
-                
-                if 'new_player' in relationships:
-                    player_data = relationships['new_player'].get('data', {})
-                    player_id_raw = player_data.get('id')
-                    
-                    # Find player in included data
-                    for item in included_data:
-                        if (item.get('type') == 'new_player' and 
-                            item.get('id') == player_id_raw):
-                            attributes_player = item.get('attributes', {})
-                            player_name = (attributes_player.get('display_name') or 
-                                         attributes_player.get('name') or 'Unknown Player')
-                            break
-                
-                # Build the base parsed record
-                parsed_record = {
-                    'player_name': player_name,
-                    'team': team,
-                    'opponent': opponent,
-                    'stat_type': stat_type,
-                    'line_score': line_score,
-                    'game_time': game_time,
-                    'projection_id': projection_id,
-                    'position': position,
-                    'odds_type': odds_type
-                }
-                
-                # Determine league based on league ID in relationships
-                league_id = safe_get_nested(projection, ['relationships', 'league', 'data', 'id'])
-                league = "college" if league_id == "15" else "nfl"  # 15=CFB, 9=NFL
-                
-                # Task 2.5: Add metadata fields using helper function
-                enhanced_record = add_standard_metadata(
-                    parsed_record,
-                    league=league,
-                    source="PrizePicks",
-                    game_time=game_time,
-                    player_name=player_name,
-                    team=team,
-                    game_id=projection_id
-                )
-                
-                # Task 2.7: Validate all required fields are populated
-                try:
-                    validate_metadata_fields(enhanced_record, parser_name)
-                    validate_no_placeholder_values(enhanced_record, parser_name)
-                    
-                    # Only add records with valid essential data
-                    if (enhanced_record['player_name'] not in ['Unknown Player', 'Unknown', ''] and 
-                        enhanced_record['stat_type'] not in ['unknown', 'Unknown', ''] and 
-                        enhanced_record['line_score'] is not None):
-                        parsed_records.append(enhanced_record)
-                    else:
-                        errors.append(f"Essential data missing for projection {projection_id}")
-                        
-                except Exception as validation_error:
-                    errors.append(f"Validation failed for projection {projection_id}: {validation_error}")
-                    
-            except Exception as e:
-                errors.append(f"Error parsing projection {projection.get('id', 'unknown')}: {e}")
-                continue
+        with stats.timer('parse'):
+            for projection in projections:
+                record, error = _parse_projection(projection, included_index, player_cache, parser_name)
+                if record is not None:
+                    parsed_records.append(record)
+                else:
+                    stats.error(*error)
+        
+        stats.success_count = len(parsed_records)
         
-        # Step 5: Final quality check and reporting
-        if parsed_records:
+        # Step 5: Persist any newly assigned player keys for other runs
+        get_player_registry().save()
+        
+        # Step 6: Quality check and summary (verbose only)
+        if stats.verbose and parsed_records:
             placeholder_summary = detect_placeholder_values(parsed_records, return_summary=True)
-            if placeholder_summary['has_placeholders']:
-                print(f"⚠️ {parser_name}: {placeholder_summary['records_with_issues']} records have placeholder values")
-                print(f"   Issue rate: {placeholder_summary['issue_rate']:.2%}")
-        
-        # Step 6: Print summary and return results
-        print_parser_summary(parser_name, len(projections), len(parsed_records), errors if errors else None)
-        
-        # Additional quality reporting
-        if parsed_records:
-            print(f"📊 Enhanced Fields Added:")
-            print(f"   • Team derivation using relationship lookups")
-            print(f"   • Opponent derivation from market data")
-            print(f"   • Position extraction from player data")
-            print(f"   • Metadata fields (league, season, source, player_id)")
-            print(f"   • Quality validation and placeholder detection")
+            stats.count('placeholder_records', placeholder_summary['records_with_issues'])
+        
+        stats.finish().report()
         
         return parsed_records
         
     except Exception as e:
-        error_msg = f"Failed to parse {parser_name} data: {e}"
-        print_parser_summary(parser_name, 0, 0, [error_msg])
-        raise ParserError(error_msg) from e
+        stats.error('fatal', e)
+        stats.finish().report()
+        raise ParserError(f"Failed to parse {parser_name} data: {e}") from e
+
+
+def iter_prizepicks_records(data_source: Union[str, Dict],
+                            errors: Optional[List[str]] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Streaming variant of parse_prizepicks_data that yields records one at a time.
+    
+    When given a file path and ijson is installed, included[] is streamed into
+    the (type, id) index first and data[] is then streamed projection by
+    projection, so the raw payload is never held in memory as a whole. Without
+    ijson the file is loaded with safe_load_json and iterated lazily.
+    
+    Records are identical to those returned by parse_prizepicks_data. No
+    summary is printed; pass an ``errors`` list to collect per-projection errors.
+    
+    Args:
+        data_source: File path to nfl_projections.json or pre-loaded JSON data
+        errors: Optional list that receives error messages for skipped projections
+        
+    Yields:
+        Parsed projection dictionaries (same fields as parse_prizepicks_data)
+        
+    Raises:
+        FileNotFoundError: If file path doesn't exist
+        JSONParseError: If JSON parsing fails
+        DataStructureError: If expected data structure is missing
+        ParserError: For other parsing-related errors
+    """
+    parser_name = "PrizePicks"
+    
+    if isinstance(data_source, str) and IJSON_AVAILABLE:
+        included_index, projections = _stream_prizepicks_file(data_source)
+    else:
+        data = safe_load_json(data_source)
+        validate_required_fields(data, ['data', 'included'], f"{parser_name} JSON structure")
+        included_index = build_included_index(safe_get_list(data, 'included', []))
+        projections = iter(safe_get_list(data, 'data', []))
+    
+    player_cache = {}
+    
+    try:
+        for projection in projections:
+            record, error = _parse_projection(projection, included_index, player_cache, parser_name)
+            if record is not None:
+                yield record
+            elif errors is not None:
+                errors.append(format_parse_error(*error))
+    except ijson_errors as e:
+        raise JSONParseError(f"Failed to parse JSON from {data_source}: {e}") from e
+    
+    get_player_registry().save()
+
+
+def build_prizepicks_snapshot(data_source: Union[str, Dict]) -> Dict[str, Optional[float]]:
+    """
+    Build a projection_id -> line_score snapshot from a raw PrizePicks board.
+    
+    Only data[] attributes are read; included[] is not resolved, so this is
+    cheap enough to run on every poll.
+    
+    Args:
+        data_source: File path to a projections JSON file or pre-loaded JSON data
+        
+    Returns:
+        Dictionary mapping projection_id to line_score (None if not numeric)
+    """
+    data = safe_load_json(data_source)
+    validate_required_fields(data, ['data'], "PrizePicks JSON structure")
+    
+    return {
+        str(projection.get('id')): _coerce_line_score(
+            safe_get_nested(projection, ['attributes', 'line_score']))
+        for projection in safe_get_list(data, 'data', [])
+        if projection.get('id') is not None
+    }
+
+
+def diff_prizepicks_board(data_source: Union[str, Dict],
+                          previous_snapshot: Optional[Dict[str, Optional[float]]] = None,
+                          errors: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Diff a PrizePicks board against the previous snapshot and parse only the delta.
+    
+    Projections whose projection_id is new, or whose line_score moved, are
+    parsed into full records; unchanged projections are never parsed. Lines
+    missing from the new board are reported as removed.
+    
+    Args:
+        data_source: File path to a projections JSON file or pre-loaded JSON data
+        previous_snapshot: Snapshot from the last poll (None/empty treats every line as added)
+        errors: Optional list that receives error messages for skipped projections
+        
+    Returns:
+        Dictionary with keys:
+            added: Parsed records for new projection_ids
+            changed: List of {'projection_id', 'old_line_score', 'new_line_score', 'record'}
+            removed: List of {'projection_id', 'old_line_score'}
+            unchanged: Count of projections skipped because the line did not move
+            snapshot: Snapshot of the current board, to persist for the next poll
+            
+    Raises:
+        FileNotFoundError: If file path doesn't exist
+        JSONParseError: If JSON parsing fails
+        DataStructureError: If expected data structure is missing
+    """
+    parser_name = "PrizePicks"
+    previous_snapshot = previous_snapshot or {}
+    
+    data = safe_load_json(data_source)
+    validate_required_fields(data, ['data', 'included'], f"{parser_name} JSON structure")
+    
+    projections = safe_get_list(data, 'data', [])
+    
+    # Step 1: Find projections that are new or whose line moved
+    snapshot = {}
+    pending = []
+    unchanged = 0
+    
+    for projection in projections:
+        projection_id = projection.get('id')
+        if projection_id is None:
+            continue
+        projection_id = str(projection_id)
+        line_score = _coerce_line_score(safe_get_nested(projection, ['attributes', 'line_score']))
+        snapshot[projection_id] = line_score
+        
+        if projection_id not in previous_snapshot:
+            pending.append((projection, None))
+        elif previous_snapshot[projection_id] != line_score:
+            pending.append((projection, previous_snapshot[projection_id]))
+        else:
+            unchanged += 1
+    
+    # Step 2: Parse only the pending projections
+    added = []
+    changed = []
+    
+    if pending:
+        included_index = build_included_index(safe_get_list(data, 'included', []))
+        player_cache = {}
+        
+        for projection, old_line_score in pending:
+            record, error = _parse_projection(projection, included_index, player_cache, parser_name)
+            if record is None:
+                if errors is not None:
+                    errors.append(format_parse_error(*error))
+                continue
+            
+            if str(projection.get('id')) in previous_snapshot:
+                changed.append({
+                    'projection_id': record['projection_id'],
+                    'old_line_score': old_line_score,
+                    'new_line_score': record['line_score'],
+                    'record': record
+                })
+            else:
+                added.append(record)
+        
+        get_player_registry().save()
+    
+    # Step 3: Lines that dropped off the board
+    removed = [
+        {'projection_id': projection_id, 'old_line_score': line_score}
+        for projection_id, line_score in previous_snapshot.items()
+        if projection_id not in snapshot
+    ]
+    
+    return {
+        'added': added,
+        'changed': changed,
+        'removed': removed,
+        'unchanged': unchanged,
+        'snapshot': snapshot
+    }
+
+
+def load_prizepicks_snapshot(snapshot_path: str) -> Dict[str, Optional[float]]:
+    """
+    Load a snapshot saved by save_prizepicks_snapshot.
+    
+    Args:
+        snapshot_path: Path to the snapshot JSON file
+        
+    Returns:
+        Snapshot dictionary, or an empty dict if the file does not exist yet
+    """
+    if not os.path.exists(snapshot_path):
+        return {}
+    return safe_load_json(snapshot_path)
+
+
+def save_prizepicks_snapshot(snapshot: Dict[str, Optional[float]], snapshot_path: str) -> None:
+    """
+    Persist a projection_id -> line_score snapshot for the next poll.
+    
+    Args:
+        snapshot: Snapshot from build_prizepicks_snapshot or diff_prizepicks_board
+        snapshot_path: Destination file path
+    """
+    # Written to a temp file first so a crash never leaves a truncated snapshot
+    dump_json_file(snapshot_path, snapshot)
+
+
+def _coerce_line_score(line_score: Any) -> Optional[float]:
+    """Convert a raw line_score to float, or None if it is not numeric."""
+    if line_score is None:
+        return None
+    try:
+        return float(line_score)
+    except (ValueError, TypeError):
+        return None
+
+
+def _stream_prizepicks_file(file_path: str) -> Tuple[Dict, Iterator[Dict]]:
+    """
+    Index included[] and open a lazy iterator over data[] using ijson.
+    
+    Two passes are made over the file because PrizePicks serializes data[]
+    before included[], and every projection needs the full index.
+    
+    Args:
+        file_path: Path to a PrizePicks projections JSON file
+        
+    Returns:
+        Tuple of (included_index, projection iterator)
+    """
+    if not resolve_json_file(file_path).exists():
+        raise FileNotFoundError(f"Input file not found: {file_path}")
+    
+    try:
+        with open_json_file(file_path) as f:
+            included_index = build_included_index(ijson.items(f, 'included.item', use_float=True))
+    except ijson_errors as e:
+        raise JSONParseError(f"Failed to parse JSON from {file_path}: {e}") from e
+    
+    def projections() -> Iterator[Dict]:
+        with open_json_file(file_path) as f:
+            yield from ijson.items(f, 'data.item', use_float=True)
+    
+    return included_index, projections()
+
+
+def _parse_projection(projection: Dict, included_index: Dict, player_cache: Dict,
+                      parser_name: str) -> Tuple[Optional[Dict[str, Any]], Optional[tuple]]:
+    """
+    Build and validate a single prop record from a PrizePicks projection.
+    
+    Args:
+        projection: Individual projection from data[]
+        included_index: Index from build_included_index()
+        player_cache: Resolved-player cache shared across the payload
+        parser_name: Parser name for error context
+        
+    Returns:
+        Tuple of (record, None) on success or (None, (error_code, *details)) if skipped
+    """
+    try:
+        # Extract basic projection data
+        projection_id = projection.get('id', '')
+        attributes = projection.get('attributes', {})
+        
+        # Extract stat type and line score
+        stat_type = attributes.get('stat_type', 'unknown')
+        line_score = attributes.get('line_score')
+        
+        # Convert line_score to float if possible
+        if line_score is not None:
+            try:
+                line_score = float(line_score)
+            except (ValueError, TypeError):
+                line_score = None
+        
+        # Resolve the referenced player once for all derivations
+        player_item = resolve_prizepicks_player(projection, included_index, player_cache)
+        
+        # Task 2.1: Enhanced team derivation using helper function
+        team = derive_team_from_prizepicks(projection, included_index, player_item)
+        
+        # Task 2.2: Enhanced opponent derivation using helper function  
+        opponent = derive_opponent_from_prizepicks(projection, included_index)
+        
+        # Task 2.3: Position field extraction using helper function
+        position = derive_position_from_prizepicks(projection, included_index, player_item)
+        
+        # Task 2.4: Fix game_time field using helper function
+        game_time = derive_game_time_from_prizepicks(projection, included_index)
+        
+        # Task 2.6: Add odds_type field with fallback
+        odds_type = attributes.get('odds_type', 'standard')
+        
+        # Extract player name from the resolved player
+        player_name = "Unknown Player"
+        if player_item:
+            attributes_player = player_item.get('attributes', {})
+            player_name = (attributes_player.get('display_name') or 
+                         attributes_player.get('name') or 'Unknown Player')
+        
+        # Build the base parsed record
+        parsed_record = {
+            'player_name': player_name,
+            'team': team,
+            'opponent': opponent,
+            'stat_type': stat_type,
+            'line_score': line_score,
+            'game_time': game_time,
+            'projection_id': projection_id,
+            'position': position,
+            'odds_type': odds_type
+        }
+        
+        # Determine league based on league ID in relationships
+        league_id = safe_get_nested(projection, ['relationships', 'league', 'data', 'id'])
+        league = "college" if league_id == "15" else "nfl"  # 15=CFB, 9=NFL
+        
+        # Task 2.5: Add metadata fields using helper function
+        enhanced_record = add_standard_metadata(
+            parsed_record,
+            league=league,
+            source="PrizePicks",
+            game_time=game_time,
+            player_name=player_name,
+            team=team,
+            game_id=projection_id,
+            source_id=player_item.get('id') if player_item else None
+        )
+        
+        # Task 2.7: Validate all required fields are populated
+        try:
+            validate_metadata_fields(enhanced_record, parser_name)
+            validate_no_placeholder_values(enhanced_record, parser_name)
+            
+            # Only keep records with valid essential data
+            if (enhanced_record['player_name'] not in ['Unknown Player', 'Unknown', ''] and 
+                enhanced_record['stat_type'] not in ['unknown', 'Unknown', ''] and 
+                enhanced_record['line_score'] is not None):
+                return enhanced_record, None
+            
+            return None, ('missing_essential_data', projection_id)
+                
+        except Exception as validation_error:
+            return None, ('validation_failed', projection_id, validation_error)
+            
+    except Exception as e:
+        return None, ('projection_error', projection.get('id', 'unknown'), e)
 
 
 if __name__ == "__main__":
@@ -224,7 +507,7 @@ if __name__ == "__main__":
             print(f"\n🧪 Testing with {test_file}")
             
             try:
-                results = parse_prizepicks_data(test_file)
+                results = parse_prizepicks_data(test_file, verbose=True)
                 print(f"📊 Successfully parsed {len(results)} projections")
                 
                 if results:
@@ -284,4 +567,4 @@ if __name__ == "__main__":
     if successful_tests == total_tests and total_tests > 0:
         print("🎉 All tests passed! Enhanced parser working correctly.")
     else:
-        print("⚠️ Some tests failed. Review the output above.")
\ No newline at end of file
+        print("⚠️ Some tests failed. Review the output above.")
@@ -0,0 +1,324 @@
+"""
+Underdog Fantasy Over/Under Lines Parser
+
+This module parses the Underdog Fantasy over_under_lines payload into the
+same record shape as the PrizePicks parser, so both books route straight
+into prop_lines.
+
+The payload is normalized rather than nested: each line points at an
+appearance (player in a match) through over_under.appearance_stat, and the
+appearance points at players[] and games[]. Every array is indexed by id
+once per payload. Team abbreviations come from teams[] when present and
+otherwise from the game's abbreviated_title ("AWAY @ HOME").
+
+Only NFL and CFB lines are kept; other sports on the board are skipped.
+diff_underdog_board follows diff_prizepicks_board: it compares the board
+with the previous poll's line id -> stat_value snapshot and parses only
+added or moved lines.
+"""
+
+from typing import Dict, List, Any, Union, Optional, Tuple
+from .player_registry import get_player_registry
+from .common import (
+    safe_load_json,
+    safe_get_list,
+    safe_get_nested,
+    validate_required_fields,
+    format_parse_error,
+    ParseStats,
+    ParserError,
+    add_standard_metadata,
+    validate_metadata_fields,
+    validate_no_placeholder_values
+)
+
+# Underdog sport_id -> prop_lines league
+UNDERDOG_SPORTS = {'NFL': 'nfl', 'CFB': 'college'}
+
+# Line statuses that are still open for entry
+ACTIVE_LINE_STATUSES = {'active'}
+
+
+def _coerce_stat_value(value: Any) -> Optional[float]:
+    """Convert a stat_value to float, or None if it is not numeric."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _index_by_id(items: List[Dict]) -> Dict[str, Dict]:
+    """Index a list of payload objects by their string id."""
+    return {str(item.get('id')): item for item in items or [] if item.get('id') is not None}
+
+
+def _team_abbreviations(games: Dict[str, Dict], teams: Dict[str, Dict]) -> Dict[str, str]:
+    """
+    Map team ids to abbreviations.
+
+    Args:
+        games: games[] indexed by id
+        teams: teams[] indexed by id (may be empty)
+
+    Returns:
+        Dictionary of team_id -> abbreviation
+    """
+    abbreviations = {
+        team_id: team.get('abbr') or team.get('abbreviation')
+        for team_id, team in teams.items()
+        if team.get('abbr') or team.get('abbreviation')
+    }
+
+    # Fill the rest from "AWAY @ HOME" game titles
+    for game in games.values():
+        title = game.get('abbreviated_title') or ''
+        away, separator, home = title.partition(' @ ')
+        if not separator:
+            continue
+        abbreviations.setdefault(str(game.get('away_team_id')), away.strip())
+        abbreviations.setdefault(str(game.get('home_team_id')), home.strip())
+
+    return abbreviations
+
+
+def parse_underdog_data(data_source: Union[str, Dict], stats: Optional[ParseStats] = None,
+                        verbose: Optional[bool] = None) -> List[Dict[str, Any]]:
+    """
+    Parse Underdog Fantasy over/under lines into prop_lines records.
+
+    Args:
+        data_source: File path to over_under_lines.json or pre-loaded JSON data
+        stats: Optional ParseStats to fill with counters, timings and error codes
+        verbose: Print a console summary (None uses set_parser_verbose/PARSER_VERBOSE)
+
+    Returns:
+        List of dictionaries with the same fields as parse_prizepicks_data,
+        with source "Underdog" and projection_id set to the line id
+
+    Raises:
+        FileNotFoundError: If file path doesn't exist
+        JSONParseError: If JSON parsing fails
+        DataStructureError: If expected data structure is missing
+        ParserError: For other parsing-related errors
+    """
+    parser_name = "Underdog"
+    parsed_records = []
+    stats = stats or ParseStats(parser_name, verbose)
+
+    try:
+        # Step 1: Load and validate input data
+        with stats.timer('load'):
+            data = safe_load_json(data_source)
+
+        validate_required_fields(data, ['over_under_lines', 'appearances', 'players'],
+                                 f"{parser_name} JSON structure")
+
+        # Step 2: Index the normalized arrays once
+        with stats.timer('index'):
+            appearances = _index_by_id(safe_get_list(data, 'appearances', []))
+            players = _index_by_id(safe_get_list(data, 'players', []))
+            games = _index_by_id(safe_get_list(data, 'games', []))
+            teams = _index_by_id(safe_get_list(data, 'teams', []))
+            abbreviations = _team_abbreviations(games, teams)
+
+        # Step 3: Parse each line
+        lines = safe_get_list(data, 'over_under_lines', [])
+        stats.total_records = len(lines)
+
+        with stats.timer('parse'):
+            for line in lines:
+                record, error = _parse_line(line, appearances, players, games, abbreviations, parser_name)
+                if record is not None:
+                    parsed_records.append(record)
+                else:
+                    stats.error(*error)
+
+        stats.success_count = len(parsed_records)
+
+        # Step 4: Persist any newly assigned player keys for other runs
+        get_player_registry().save()
+
+        stats.finish().report()
+
+        return parsed_records
+
+    except Exception as e:
+        stats.error('fatal', e)
+        stats.finish().report()
+        raise ParserError(f"Failed to parse {parser_name} data: {e}") from e
+
+
+def diff_underdog_board(data_source: Union[str, Dict],
+                        previous_snapshot: Optional[Dict[str, Optional[float]]] = None,
+                        errors: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Diff an Underdog board against the previous snapshot and parse only the delta.
+
+    Lines whose id is new, or whose stat_value moved, are parsed into full
+    records; unchanged lines are never parsed. The result has the same shape
+    as diff_prizepicks_board, and the snapshot can be persisted with
+    save_prizepicks_snapshot.
+
+    Args:
+        data_source: File path to over_under_lines.json or pre-loaded JSON data
+        previous_snapshot: Snapshot from the last poll (None/empty treats every line as added)
+        errors: Optional list that receives error messages for skipped lines
+
+    Returns:
+        Dictionary with added, changed, removed, unchanged and snapshot
+        (see diff_prizepicks_board)
+
+    Raises:
+        FileNotFoundError: If file path doesn't exist
+        JSONParseError: If JSON parsing fails
+        DataStructureError: If expected data structure is missing
+    """
+    parser_name = "Underdog"
+    previous_snapshot = previous_snapshot or {}
+
+    data = safe_load_json(data_source)
+    validate_required_fields(data, ['over_under_lines', 'appearances', 'players'],
+                             f"{parser_name} JSON structure")
+
+    # Step 1: Find lines that are new or whose value moved
+    snapshot = {}
+    pending = []
+    unchanged = 0
+
+    for line in safe_get_list(data, 'over_under_lines', []):
+        if line.get('id') is None:
+            continue
+        line_id = str(line['id'])
+        line_score = _coerce_stat_value(line.get('stat_value'))
+        snapshot[line_id] = line_score
+
+        if line_id not in previous_snapshot:
+            pending.append((line, None))
+        elif previous_snapshot[line_id] != line_score:
+            pending.append((line, previous_snapshot[line_id]))
+        else:
+            unchanged += 1
+
+    # Step 2: Index the normalized arrays and parse only the pending lines
+    added = []
+    changed = []
+
+    if pending:
+        appearances = _index_by_id(safe_get_list(data, 'appearances', []))
+        players = _index_by_id(safe_get_list(data, 'players', []))
+        games = _index_by_id(safe_get_list(data, 'games', []))
+        abbreviations = _team_abbreviations(games, _index_by_id(safe_get_list(data, 'teams', [])))
+
+        for line, old_line_score in pending:
+            record, error = _parse_line(line, appearances, players, games, abbreviations, parser_name)
+            if record is None:
+                if errors is not None:
+                    errors.append(format_parse_error(*error))
+                continue
+
+            if record['projection_id'] in previous_snapshot:
+                changed.append({
+                    'projection_id': record['projection_id'],
+                    'old_line_score': old_line_score,
+                    'new_line_score': record['line_score'],
+                    'record': record
+                })
+            else:
+                added.append(record)
+
+        get_player_registry().save()
+
+    # Step 3: Lines that dropped off the board
+    removed = [
+        {'projection_id': line_id, 'old_line_score': line_score}
+        for line_id, line_score in previous_snapshot.items()
+        if line_id not in snapshot
+    ]
+
+    return {
+        'added': added,
+        'changed': changed,
+        'removed': removed,
+        'unchanged': unchanged,
+        'snapshot': snapshot
+    }
+
+
+def _parse_line(line: Dict, appearances: Dict[str, Dict], players: Dict[str, Dict],
+                games: Dict[str, Dict], abbreviations: Dict[str, str],
+                parser_name: str) -> Tuple[Optional[Dict[str, Any]], Optional[tuple]]:
+    """
+    Build and validate a single prop record from an Underdog line.
+
+    Returns:
+        Tuple of (record, None) on success or (None, (error_code, *details)) if skipped
+    """
+    line_id = str(line.get('id', ''))
+
+    try:
+        if line.get('status') and line['status'] not in ACTIVE_LINE_STATUSES:
+            return None, ('inactive_line', line_id, line['status'])
+
+        appearance_stat = safe_get_nested(line, ['over_under', 'appearance_stat'], {})
+        appearance = appearances.get(str(appearance_stat.get('appearance_id')))
+        if not appearance:
+            return None, ('missing_appearance', line_id)
+
+        player = players.get(str(appearance.get('player_id')))
+        if not player:
+            return None, ('missing_player', line_id)
+
+        league = UNDERDOG_SPORTS.get(str(player.get('sport_id', '')).upper())
+        if league is None:
+            return None, ('unsupported_sport', line_id, player.get('sport_id'))
+
+        # Team and opponent from the appearance's match
+        team_id = str(appearance.get('team_id') or player.get('team_id'))
+        game = games.get(str(appearance.get('match_id'))) or {}
+        home_id, away_id = str(game.get('home_team_id')), str(game.get('away_team_id'))
+        opponent_id = away_id if team_id == home_id else home_id if team_id == away_id else None
+        team = abbreviations.get(team_id)
+        opponent = abbreviations.get(opponent_id) if opponent_id else None
+
+        line_score = _coerce_stat_value(line.get('stat_value'))
+
+        player_name = f"{player.get('first_name') or ''} {player.get('last_name') or ''}".strip()
+        stat_type = appearance_stat.get('display_stat') or appearance_stat.get('stat')
+        game_time = game.get('scheduled_at')
+
+        # Only keep lines with valid essential data (checked before a registry key is assigned)
+        if not player_name or not team or not stat_type or line_score is None:
+            return None, ('missing_essential_data', line_id)
+
+        parsed_record = {
+            'player_name': player_name,
+            'team': team,
+            'opponent': opponent,
+            'stat_type': stat_type,
+            'line_score': line_score,
+            'game_time': game_time,
+            'projection_id': line_id,
+            'position': player.get('position_name'),
+            'odds_type': line.get('line_type') or 'standard'
+        }
+
+        enhanced_record = add_standard_metadata(
+            parsed_record,
+            league=league,
+            source="Underdog",
+            game_time=game_time,
+            player_name=player_name,
+            team=team,
+            source_id=str(player.get('id'))
+        )
+
+        try:
+            validate_metadata_fields(enhanced_record, parser_name)
+            validate_no_placeholder_values(enhanced_record, parser_name)
+        except Exception as validation_error:
+            return None, ('validation_failed', line_id, validation_error)
+
+        return enhanced_record, None
+
+    except Exception as e:
+        return None, ('line_error', line_id, e)
@@ -0,0 +1,413 @@
+"""
+Player Identity Registry
+
+Maps normalized player names and source-specific ids (PrizePicks new_player
+ids, ESPN/RapidAPI athlete ids, CollegeFootballData athlete ids) to stable
+integer player keys. The same player gets the same key in every game and
+every source, so player_id can be used for history queries.
+
+Keys are held in memory during a run and shared with other processes
+through a JSON file. A new key is allocated under an exclusive file lock
+(registry_path + '.lock'): the process first merges keys other processes
+appended to the journal (registry_path + '.log') or compacted into the JSON
+file, then appends its own allocation to the journal before releasing the
+lock, so separate parser processes agree on keys. save() compacts the
+journal into the JSON file under the same lock. Without fcntl (Windows)
+there is no cross-process locking. src.database.parser_integration persists
+keys to the players table. player_id columns are TEXT, so keys are emitted
+as their decimal string.
+"""
+
+import os
+import re
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Any, Optional, Tuple
+
+from .json_backend import load_json_file, dump_json_file, json_loads, json_dumps
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
+# Default on-disk location shared by all parser processes
+DEFAULT_REGISTRY_PATH = os.getenv('PLAYER_REGISTRY_PATH', 'parsed_data/player_registry.json')
+
+# Positions accepted by the players table CHECK constraint
+REGISTRY_POSITIONS = {'QB', 'WR', 'RB', 'TE', 'K', 'DEF'}
+
+_NAME_SUFFIXES = {'jr', 'sr', 'ii', 'iii', 'iv', 'v'}
+_NAME_PUNCTUATION = re.compile(r"[.'`’]")
+_NAME_WHITESPACE = re.compile(r"[\s\-]+")
+
+
+def normalize_player_name(player_name: str) -> str:
+    """
+    Normalize a player name for identity matching.
+
+    Lowercases, strips punctuation, collapses whitespace and drops
+    generational suffixes, so "A.J. Brown" and "AJ Brown" match and
+    "Marvin Harrison Jr." matches "Marvin Harrison".
+
+    Args:
+        player_name: Raw player name from any source
+
+    Returns:
+        Normalized name string
+    """
+    name = _NAME_PUNCTUATION.sub('', str(player_name).strip().lower())
+    parts = [part for part in _NAME_WHITESPACE.split(name) if part]
+    while len(parts) > 1 and parts[-1] in _NAME_SUFFIXES:
+        parts.pop()
+    return ' '.join(parts)
+
+
+def _file_stamp(file_path: str) -> Optional[Tuple[int, int, int]]:
+    """Identify a file version by (inode, mtime_ns, size); None if it does not exist."""
+    try:
+        stat = os.stat(file_path)
+    except FileNotFoundError:
+        return None
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+class PlayerRegistry:
+    """In-memory player identity registry with optional JSON persistence."""
+
+    def __init__(self, registry_path: Optional[str] = None):
+        """
+        Initialize the registry, loading existing keys from registry_path if present.
+
+        Args:
+            registry_path: JSON file shared with other processes (None for memory only)
+        """
+        self.registry_path = registry_path
+        # Reentrant so merges can run while resolve()/save() hold it; always taken before the file lock
+        self._lock = threading.RLock()
+        self._players: Dict[int, Dict[str, Any]] = {}
+        self._name_index: Dict[Tuple[str, str, str], int] = {}
+        self._source_index: Dict[Tuple[str, str], int] = {}
+        self._next_key = 1
+        self._dirty = False
+        # Version of registry_path last merged or written, and journal bytes merged since
+        self._disk_stamp: Optional[Tuple[int, int, int]] = None
+        self._journal_offset = 0
+
+        if registry_path and (os.path.exists(registry_path) or os.path.exists(f"{registry_path}.log")):
+            with self._lock, self._file_lock(registry_path):
+                self._sync(registry_path)
+
+    def __len__(self) -> int:
+        return len(self._players)
+
+    def resolve(self, player_name: str, team: str, league: str,
+                source: Optional[str] = None, source_id: Optional[Any] = None,
+                position: Optional[str] = None) -> str:
+        """
+        Return the stable player key for a player, assigning one if new.
+
+        Lookup order is (source, source_id) first, then (league, normalized
+        name, team). A match on name registers the source id as an alias.
+
+        Args:
+            player_name: Player name as given by the source
+            team: Team abbreviation or name
+            league: League identifier ("nfl" or "college")
+            source: Data source identifier (optional)
+            source_id: Source-specific player id (optional)
+            position: Player position, stored for the players table (optional)
+
+        Returns:
+            Player key as a decimal string for use as player_id
+        """
+        league = str(league).lower()
+        source_key = (str(source), str(source_id)) if source and source_id is not None else None
+
+        key = self._source_index.get(source_key) if source_key else None
+        if key is not None:
+            return str(key)
+
+        name_key = (league, normalize_player_name(player_name), str(team).strip().lower())
+
+        with self._lock:
+            key = self._name_index.get(name_key)
+            if key is not None and not source_key:
+                return str(key)
+
+            with self._file_lock(self.registry_path):
+                # Merge keys other processes assigned since the last sync before allocating
+                self._sync(self.registry_path)
+                key = (self._source_index.get(source_key) if source_key else None) or self._name_index.get(name_key)
+
+                entry = {'players': {}, 'aliases': {}}
+                if key is None:
+                    key = self._next_key
+                    self._next_key += 1
+                    self._name_index[name_key] = key
+                    self._players[key] = {
+                        'name': str(player_name).strip(),
+                        'team': team,
+                        'league': league,
+                        'position': position if position in REGISTRY_POSITIONS else None,
+                        'source': source or 'unknown',
+                        'persisted': False
+                    }
+                    entry['players'][str(key)] = dict(self._players[key])
+
+                if source_key and source_key not in self._source_index:
+                    self._source_index[source_key] = key
+                    entry['aliases'][f"{source}:{source_id}"] = key
+
+                if entry['players'] or entry['aliases']:
+                    entry['next_key'] = self._next_key
+                    self._append_journal(self.registry_path, entry)
+                    self._dirty = True
+
+        return str(key)
+
+    def register(self, key: int, player_name: str, team: str, league: str,
+                 position: Optional[str] = None, source: Optional[str] = None,
+                 persisted: bool = True) -> None:
+        """
+        Register a known key (e.g. a row loaded from the players table).
+
+        Args:
+            key: Existing integer player key
+            player_name: Player name
+            team: Team abbreviation or name
+            league: League identifier
+            position: Player position (optional)
+            source: Data source identifier (optional)
+            persisted: Whether the player already exists in the players table
+        """
+        key = int(key)
+        league = str(league).lower()
+
+        with self._lock:
+            self._players.setdefault(key, {
+                'name': player_name,
+                'team': team,
+                'league': league,
+                'position': position if position in REGISTRY_POSITIONS else None,
+                'source': source or 'unknown',
+                'persisted': persisted
+            })
+            self._name_index.setdefault(
+                (league, normalize_player_name(player_name), str(team).strip().lower()), key)
+            self._next_key = max(self._next_key, key + 1)
+
+    def pending_players(self) -> List[Dict[str, Any]]:
+        """
+        Return players not yet written to the players table, as players rows.
+
+        Returns:
+            List of dictionaries with players table columns
+        """
+        return [
+            {
+                'player_id': str(key),
+                'name': info['name'],
+                'position': info['position'],
+                'team': info['team'],
+                'league': info['league'],
+                'source': info['source']
+            }
+            for key, info in self._players.items()
+            if not info['persisted']
+        ]
+
+    def mark_persisted(self, player_ids: List[str]) -> None:
+        """Mark players as written to the players table."""
+        with self._lock:
+            for player_id in player_ids:
+                info = self._players.get(int(player_id))
+                if info and not info['persisted']:
+                    info['persisted'] = True
+                    self._dirty = True
+
+    @property
+    def next_key(self) -> int:
+        """The key that will be assigned to the next new player."""
+        return self._next_key
+
+    def new_players_since(self, first_key: int) -> Dict[int, Dict[str, Any]]:
+        """
+        Return players assigned keys >= first_key, with their source aliases.
+
+        Used to merge keys assigned in a worker process back into the parent
+        registry (see parse_boxscore_directory).
+
+        Args:
+            first_key: Registry next_key at the time the worker was seeded
+
+        Returns:
+            Dictionary of key -> player info with an 'aliases' list of (source, source_id)
+        """
+        new_players = {key: dict(info, aliases=[]) for key, info in self._players.items()
+                       if key >= first_key}
+        for source_key, key in self._source_index.items():
+            if key in new_players:
+                new_players[key]['aliases'].append(source_key)
+        return new_players
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the registry state as a JSON-serializable dictionary."""
+        with self._lock:
+            return {
+                'next_key': self._next_key,
+                'players': {str(key): dict(info) for key, info in self._players.items()},
+                'aliases': {f"{source}:{source_id}": key
+                            for (source, source_id), key in self._source_index.items()}
+            }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], registry_path: Optional[str] = None) -> 'PlayerRegistry':
+        """
+        Build a registry from to_dict() output.
+
+        Args:
+            data: Registry state
+            registry_path: JSON file for later save() calls (None for memory only)
+
+        Returns:
+            PlayerRegistry instance
+        """
+        registry = cls()
+        registry.registry_path = registry_path
+        registry._load_state(data)
+        return registry
+
+    def load(self, registry_path: Optional[str] = None) -> None:
+        """
+        Load keys and aliases from a JSON file written by save().
+
+        Args:
+            registry_path: File to load (defaults to self.registry_path)
+        """
+        registry_path = registry_path or self.registry_path
+        self._load_state(load_json_file(registry_path))
+
+    def _load_state(self, data: Dict[str, Any]) -> None:
+        """Merge to_dict()-style state (or a journal entry) into this registry."""
+        with self._lock:
+            next_key = max(self._next_key, data.get('next_key', 1))
+            for key, info in data.get('players', {}).items():
+                key = int(key)
+                current = self._players.get(key)
+                if current is not None:
+                    # Keep a players-table write recorded by either side
+                    current['persisted'] = current['persisted'] or info.get('persisted', False)
+                    continue
+                self._players[key] = info
+                self._name_index[(info['league'], normalize_player_name(info['name']),
+                                  str(info['team']).strip().lower())] = key
+                next_key = max(next_key, key + 1)
+            for source_key, key in data.get('aliases', {}).items():
+                source, _, source_id = source_key.partition(':')
+                self._source_index[(source, source_id)] = int(key)
+            self._next_key = next_key
+
+    @contextmanager
+    def _file_lock(self, registry_path: Optional[str]) -> Iterator[None]:
+        """Hold the cross-process lock for registry_path (no-op when memory only or without fcntl)."""
+        if not registry_path or not FCNTL_AVAILABLE:
+            yield
+            return
+
+        os.makedirs(os.path.dirname(registry_path) or '.', exist_ok=True)
+        with open(f"{registry_path}.lock", 'a') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _sync(self, registry_path: Optional[str]) -> None:
+        """Merge the JSON file if another process compacted it, then any new journal entries."""
+        if not registry_path:
+            return
+
+        stamp = _file_stamp(registry_path)
+        if stamp != self._disk_stamp:
+            if stamp is not None:
+                self._load_state(load_json_file(registry_path))
+            # A rewritten file means the journal was reset with it
+            self._disk_stamp = stamp
+            self._journal_offset = 0
+
+        try:
+            with open(f"{registry_path}.log", 'rb') as journal:
+                journal.seek(self._journal_offset)
+                for line in journal:
+                    if not line.endswith(b'\n'):
+                        break
+                    self._load_state(json_loads(line))
+                    self._journal_offset += len(line)
+        except FileNotFoundError:
+            pass
+
+    def _append_journal(self, registry_path: Optional[str], entry: Dict[str, Any]) -> None:
+        """Append one allocation to the journal (caller holds the file lock)."""
+        if not registry_path:
+            return
+
+        os.makedirs(os.path.dirname(registry_path) or '.', exist_ok=True)
+        line = json_dumps(entry, pretty=False) + b'\n'
+        with open(f"{registry_path}.log", 'ab') as journal:
+            journal.write(line)
+        self._journal_offset += len(line)
+
+    def save(self, registry_path: Optional[str] = None) -> None:
+        """
+        Compact keys and aliases into the JSON file if anything changed since the last save.
+
+        Entries other processes added since the last sync are merged first, so
+        a save never drops keys assigned elsewhere.
+
+        Args:
+            registry_path: Destination file (defaults to self.registry_path)
+        """
+        registry_path = registry_path or self.registry_path
+        with self._lock:
+            if not registry_path or not self._dirty:
+                return
+
+            with self._file_lock(registry_path):
+                self._sync(registry_path)
+                dump_json_file(registry_path, self.to_dict())
+                self._dirty = False
+
+                # The journal is now part of the file; reset both together under the lock
+                with open(f"{registry_path}.log", 'wb'):
+                    pass
+                self._disk_stamp = _file_stamp(registry_path)
+                self._journal_offset = 0
+
+
+_default_registry: Optional[PlayerRegistry] = None
+
+
+def get_player_registry() -> PlayerRegistry:
+    """
+    Get the process-wide registry, loading it from DEFAULT_REGISTRY_PATH on first use.
+
+    Returns:
+        Shared PlayerRegistry instance
+    """
+    global _default_registry
+    if _default_registry is None:
+        _default_registry = PlayerRegistry(DEFAULT_REGISTRY_PATH)
+    return _default_registry
+
+
+def set_player_registry(registry: PlayerRegistry) -> None:
+    """
+    Replace the process-wide registry (e.g. with one seeded from the database).
+
+    Args:
+        registry: Registry to use for subsequent parser calls
+    """
+    global _default_registry
+    _default_registry = registry
@@ -21,9 +21,13 @@ from parsers import (
     parse_prizepicks_data,
     parse_cfb_player_stats,
     parse_nfl_game_ids,
-    parse_nfl_boxscore
+    parse_nfl_boxscore,
+    set_parser_verbose
 )
 
+# Show parser summaries while testing
+set_parser_verbose(True)
+
 
 def test_prizepicks_parser():
     """Test PrizePicks parser with available data files."""
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Round-trip checks for JSON archive compression in parsers.json_backend.
+
+Writes plain, gzip and (when zstandard is installed) zstd archives to a
+temporary directory and reads them back through every reader entry point.
+
+Usage:
+    python3 parsers/test_json_backend.py
+"""
+
+import gzip
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Optional
+
+# Add the project root to Python path for imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from parsers.json_backend import (
+    ZSTD_AVAILABLE,
+    compressed_path,
+    detect_compression,
+    dump_json_file,
+    glob_json_files,
+    load_json_file,
+    open_json_file,
+    resolve_json_file
+)
+from parsers.common import safe_load_json
+
+SAMPLE = {
+    'data': [{'id': str(i), 'attributes': {'line_score': i + 0.5, 'name': f"Player {i}"}} for i in range(50)],
+    'included': [],
+    'note': 'Señor Ünïcode'
+}
+
+failures: List[str] = []
+
+
+def check(condition: bool, description: str) -> None:
+    """Print one check result and remember failures."""
+    print(f"{'✅' if condition else '❌'} {description}")
+    if not condition:
+        failures.append(description)
+
+
+def compression_name(compression: Optional[str]) -> str:
+    """Label for a compression setting in check output."""
+    return compression or 'plain'
+
+
+def test_round_trip(tmp: Path):
+    """Every compression reads back to the same data."""
+    print("🗜️ TESTING COMPRESSION ROUND-TRIP")
+    print("=" * 40)
+
+    compressions = [None, 'gzip'] + (['zstd'] if ZSTD_AVAILABLE else [])
+    for compression in compressions:
+        written = dump_json_file(tmp / compression_name(compression) / 'board.json', SAMPLE, compression=compression)
+        check(detect_compression(written) == compression, f"{compression_name(compression)}: written as {written.name}")
+        check(load_json_file(written) == SAMPLE, f"{compression_name(compression)}: load_json_file round-trips")
+        check(safe_load_json(str(written.parent / 'board.json')) == SAMPLE,
+              f"{compression_name(compression)}: safe_load_json finds it from the plain .json path")
+        with open_json_file(written) as f:
+            streamed = f.read()
+        check(streamed.startswith(b'{'), f"{compression_name(compression)}: open_json_file yields decompressed bytes")
+
+    if not ZSTD_AVAILABLE:
+        check(compressed_path('board.json', 'zstd').name == 'board.json.gz',
+              "zstd falls back to gzip without zstandard")
+
+    written = dump_json_file(tmp / 'suffix' / 'board.json.gz', SAMPLE)
+    check(detect_compression(written) == 'gzip', "A .gz suffix selects gzip without a compression argument")
+
+    try:
+        dump_json_file(tmp / 'bad.json', SAMPLE, compression='lz4')
+        rejected = False
+    except ValueError:
+        rejected = True
+    check(rejected, "Unknown compression names are rejected")
+
+
+def test_variants(tmp: Path):
+    """Magic-byte detection and choosing between plain and compressed copies."""
+    print("\n\n📁 TESTING FILE VARIANTS")
+    print("=" * 40)
+
+    misnamed = tmp / 'misnamed.json'
+    with gzip.open(misnamed, 'wb') as f:
+        f.write(b'{"ok": true}')
+    check(detect_compression(misnamed) == 'gzip', "Gzip content is detected by magic bytes despite a .json name")
+    check(load_json_file(misnamed) == {'ok': True}, "Misnamed gzip file still loads")
+
+    directory = tmp / 'mixed'
+    dump_json_file(directory / 'game_1.json', {'version': 'plain'})
+    time.sleep(0.01)
+    dump_json_file(directory / 'game_1.json', {'version': 'gzip'}, compression='gzip')
+    dump_json_file(directory / 'game_2.json', {'version': 'plain'})
+
+    check(resolve_json_file(directory / 'game_1.json').name == 'game_1.json.gz',
+          "resolve_json_file picks the newest variant")
+    found = [path.name for path in glob_json_files(directory, 'game_*.json')]
+    check(found == ['game_1.json.gz', 'game_2.json'], f"glob_json_files returns one copy per file ({found})")
+    check(load_json_file(directory / 'game_1.json') == {'version': 'gzip'},
+          "Loading the plain path reads the newer compressed copy")
+
+
+def run_all_tests():
+    """Run all JSON backend checks."""
+    print("🏈 FOOTBALL PROP INSIGHTS - JSON BACKEND CHECKS")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        test_round_trip(Path(tmp))
+        test_variants(Path(tmp))
+
+    print("\n\n" + "=" * 60)
+    if failures:
+        print(f"❌ {len(failures)} check(s) failed")
+        sys.exit(1)
+    print("🎉 All JSON backend checks passed")
+
+
+if __name__ == "__main__":
+    run_all_tests()
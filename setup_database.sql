@@ -105,9 +105,13 @@ CREATE TABLE IF NOT EXISTS games_processed (
     league TEXT NOT NULL CHECK (league IN ('nfl', 'college')),
     source TEXT NOT NULL,
     game_type INTEGER DEFAULT 2, -- For NFL: 1=preseason, 2=regular, 3=postseason
+    is_final BOOLEAN NOT NULL DEFAULT FALSE, -- Stats loaded from a finished game; never refetched
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+-- Add is_final to databases created before the column existed
+ALTER TABLE games_processed ADD COLUMN IF NOT EXISTS is_final BOOLEAN NOT NULL DEFAULT FALSE;
+
 -- Create indexes for tracking and lookup
 CREATE INDEX IF NOT EXISTS idx_games_processed_league_year_week ON games_processed(league, year, week);
 CREATE INDEX IF NOT EXISTS idx_games_processed_source ON games_processed(source);
@@ -13,18 +13,86 @@ Each function includes comprehensive error handling and data validation.
 import os
 import requests
 import json
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
 from dotenv import load_dotenv
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List, Collection
 from pathlib import Path
 
-# Load environment variables
+# Load environment variables before the src modules read their settings
 load_dotenv()
 
+if __package__ in (None, ''):
+    # Running as a script (python3 src/api_client.py): make the project root importable
+    import sys
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.archive import ArchiveWriter
+from src.rate_limit import provider_limits
+from src.http_client import get_http_client
+from parsers.json_backend import ARCHIVE_COMPRESSION, compressed_path, dump_json_file
+
+# PrizePicks endpoint configuration shared by the single-page and paginated fetchers
+PRIZEPICKS_BASE_URL = os.getenv('PRIZEPICKS_BASE_URL', "https://api.prizepicks.com/projections")
+
+# Underdog Fantasy over/under board (no auth; every sport in one payload)
+UNDERDOG_BASE_URL = os.getenv('UNDERDOG_BASE_URL', "https://api.underdogfantasy.com/beta/v6/over_under_lines")
+
+# Base URL overrides for the other APIs, e.g. src/mock_api_server.py for offline load tests
+# (RapidAPI defaults to https://<RAPIDAPI_HOST>)
+RAPIDAPI_BASE_URL = os.getenv('RAPIDAPI_BASE_URL')
+CFB_API_BASE_URL = os.getenv('CFB_API_BASE_URL', "https://api.collegefootballdata.com")
+
+PRIZEPICKS_LEAGUE_CONFIGS = {
+    'nfl': {
+        'league_id': 9,
+        'name': 'NFL'
+    },
+    'cfb': {
+        'league_id': 15,
+        'name': 'College Football'
+    }
+}
+
+# Browser-like headers; PrizePicks rejects bare library user agents
+PRIZEPICKS_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'application/json, text/plain, */*',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'DNT': '1',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+}
+
+
+# Optional background writer for raw payloads (see set_archive_writer)
+_archive_writer: Optional[ArchiveWriter] = None
+
+
+def set_archive_writer(writer: Optional[ArchiveWriter]) -> Optional[ArchiveWriter]:
+    """
+    Route save_api_data through a background ArchiveWriter (None to write inline).
+    
+    Args:
+        writer: ArchiveWriter to queue raw payload writes on, or None
+        
+    Returns:
+        The previously installed writer
+    """
+    global _archive_writer
+    previous, _archive_writer = _archive_writer, writer
+    return previous
+
 
 def save_api_data(data: Any, api_folder: str, filename: str) -> None:
     """
     Save API response data to JSON file.
     
+    When an archive writer is installed with set_archive_writer(), the write
+    is queued on its background thread instead of blocking the caller. With
+    ARCHIVE_COMPRESSION set, the file is stored as <filename>.gz or .zst.
+    
     Args:
         data: The data to save (usually API response)
         api_folder: Subfolder name under api_data (e.g., 'prizepicks', 'nfl_stats')
@@ -34,12 +102,15 @@ def save_api_data(data: Any, api_folder: str, filename: str) -> None:
         # Create directory structure
         base_dir = Path("api_data")
         api_dir = base_dir / api_folder
-        api_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Save data to file
         filepath = api_dir / filename
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        
+        if _archive_writer is not None:
+            _archive_writer.write(filepath, data)
+            print(f"💾 Data queued for: {compressed_path(filepath, _archive_writer.compression)}")
+            return
+        
+        # Save data to file (compact unless JSON_PRETTY is set)
+        filepath = dump_json_file(filepath, data, compression=ARCHIVE_COMPRESSION)
         
         print(f"💾 Data saved to: {filepath}")
         
@@ -113,12 +184,13 @@ def print_response_summary(api_name: str, success: bool, record_count: int = 0,
     print("=" * 80)
 
 
-def fetch_prizepicks_data(league: str = 'nfl') -> Dict[str, Any]:
+def fetch_prizepicks_data(league: str = 'nfl', cache: bool = True) -> Dict[str, Any]:
     """
     Fetch prop betting data from PrizePicks API for specified league.
     
     Args:
         league (str): League to fetch data for ('nfl' or 'cfb')
+        cache (bool): Use the HTTP response cache (False always fetches a fresh board, e.g. when polling)
         
     Returns:
         Dict[str, Any]: Response data with success status and results
@@ -126,16 +198,7 @@ def fetch_prizepicks_data(league: str = 'nfl') -> Dict[str, Any]:
     print_api_separator(f"PrizePicks {league.upper()}")
     
     # Define league-specific endpoints
-    league_configs = {
-        'nfl': {
-            'league_id': 9,
-            'name': 'NFL'
-        },
-        'cfb': {
-            'league_id': 15,
-            'name': 'College Football'
-        }
-    }
+    league_configs = PRIZEPICKS_LEAGUE_CONFIGS
     
     if league.lower() not in league_configs:
         error_msg = f"Invalid league '{league}'. Supported leagues: nfl, cfb"
@@ -150,7 +213,7 @@ def fetch_prizepicks_data(league: str = 'nfl') -> Dict[str, Any]:
     league_name = config['name']
     
     # Build API URL
-    base_url = "https://api.prizepicks.com/projections"
+    base_url = PRIZEPICKS_BASE_URL
     params = {
         'league_id': config['league_id'],
         'per_page': 250,
@@ -166,17 +229,9 @@ def fetch_prizepicks_data(league: str = 'nfl') -> Dict[str, Any]:
         print(f"📋 Parameters: {params}")
         
         # Add headers to appear more like a browser request
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'application/json, text/plain, */*',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'DNT': '1',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        }
+        headers = PRIZEPICKS_HEADERS
         
-        response = requests.get(base_url, params=params, headers=headers, timeout=30)
+        response = get_http_client().get(base_url, params=params, headers=headers, timeout=30, cache=cache)
         
         print(f"📡 HTTP Status Code: {response.status_code}")
         
@@ -275,6 +330,240 @@ def fetch_prizepicks_data(league: str = 'nfl') -> Dict[str, Any]:
         }
 
 
+def merge_prizepicks_pages(pages: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Merge paginated PrizePicks responses into a single payload.
+    
+    data[] is concatenated in page order; included[] is deduplicated by
+    (type, id), keeping the first occurrence. The result has the same shape
+    as a single-page response and is accepted unchanged by parse_prizepicks_data.
+    
+    Args:
+        pages: List of PrizePicks JSON responses, ordered by page number
+        
+    Returns:
+        Merged payload with data, included, links and meta keys
+    """
+    merged_data = []
+    merged_included = []
+    seen_included = set()
+    
+    for page in pages:
+        merged_data.extend(page.get('data', []))
+        
+        for item in page.get('included', []):
+            key = (item.get('type'), item.get('id'))
+            if key not in seen_included:
+                seen_included.add(key)
+                merged_included.append(item)
+    
+    first_page = pages[0] if pages else {}
+    
+    return {
+        'data': merged_data,
+        'included': merged_included,
+        'links': first_page.get('links', {}),
+        'meta': {
+            'current_page': 1,
+            'total_pages': 1,
+            'pages_merged': len(pages)
+        }
+    }
+
+
+def fetch_prizepicks_data_paginated(league: str = 'nfl', per_page: int = 250,
+                                    max_workers: int = 4) -> Dict[str, Any]:
+    """
+    Fetch every page of a PrizePicks board concurrently and merge the results.
+    
+    Page 1 is fetched first to learn meta.total_pages; the remaining pages are
+    pulled through the shared pooled HTTP client by at most max_workers threads.
+    
+    Args:
+        league (str): League to fetch data for ('nfl' or 'cfb')
+        per_page (int): Projections requested per page
+        max_workers (int): Upper bound on concurrent page requests
+        
+    Returns:
+        Dict[str, Any]: Response data with success status and merged results
+    """
+    print_api_separator(f"PrizePicks {league.upper()} (paginated)")
+    
+    if league.lower() not in PRIZEPICKS_LEAGUE_CONFIGS:
+        error_msg = f"Invalid league '{league}'. Supported leagues: nfl, cfb"
+        print(f"❌ ERROR: {error_msg}")
+        return {
+            'success': False,
+            'error': error_msg,
+            'data': None
+        }
+    
+    config = PRIZEPICKS_LEAGUE_CONFIGS[league.lower()]
+    league_name = config['name']
+    max_workers = max(1, max_workers)
+    
+    base_params = {
+        'league_id': config['league_id'],
+        'per_page': per_page,
+        'single_stat': 'true',
+        'in_game': 'true',
+        'state_code': 'CA',
+        'game_mode': 'prizepools'
+    }
+    
+    client = get_http_client()
+    
+    def fetch_page(page_number: int) -> Dict[str, Any]:
+        params = dict(base_params, page=page_number)
+        response = client.get(PRIZEPICKS_BASE_URL, params=params, headers=PRIZEPICKS_HEADERS, timeout=30)
+        response.raise_for_status()
+        page_data = response.json()
+        if not isinstance(page_data, dict) or 'data' not in page_data:
+            raise ValueError(f"Page {page_number} response missing 'data' field")
+        return page_data
+    
+    try:
+        print(f"🔗 Calling PrizePicks API for {league_name} (per_page={per_page})...")
+        
+        first_page = fetch_page(1)
+        total_pages = int(first_page.get('meta', {}).get('total_pages') or 1)
+        print(f"📄 Total pages: {total_pages}")
+        
+        pages = [first_page]
+        if total_pages > 1:
+            workers = min(max_workers, total_pages - 1)
+            print(f"🧵 Fetching pages 2-{total_pages} with {workers} workers...")
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                # map() preserves page order regardless of completion order
+                pages.extend(executor.map(fetch_page, range(2, total_pages + 1)))
+        
+        data = merge_prizepicks_pages(pages)
+        record_count = len(data['data'])
+        
+        print(f"✅ Successfully retrieved {record_count} {league_name} projections across {total_pages} pages")
+        
+        # Save merged payload under the same name as the single-page fetcher
+        filename = f"{league.lower()}_projections.json"
+        save_api_data(data, "prizepicks", filename)
+        
+        sample_record = data['data'][0] if data['data'] else None
+        print_response_summary(f"PrizePicks {league_name}", True, record_count, sample_record)
+        
+        return {
+            'success': True,
+            'league': league_name,
+            'record_count': record_count,
+            'pages': total_pages,
+            'data': data
+        }
+        
+    except requests.exceptions.Timeout:
+        error_msg = "Request timeout (30 seconds)"
+        print(f"❌ Timeout Error: {error_msg}")
+        
+    except requests.exceptions.HTTPError as e:
+        error_msg = f"HTTP error: {str(e)}"
+        print(f"❌ HTTP Error: {error_msg}")
+        
+    except requests.exceptions.ConnectionError as e:
+        error_msg = f"Connection error: {str(e)}"
+        print(f"❌ Connection Error: {error_msg}")
+        
+    except Exception as e:
+        error_msg = f"Unexpected error: {str(e)}"
+        print(f"❌ Unexpected Error: {error_msg}")
+    
+    print_response_summary(f"PrizePicks {league_name}", False)
+    
+    return {
+        'success': False,
+        'error': error_msg,
+        'data': None
+    }
+
+
+def fetch_underdog_data(cache: bool = True) -> Dict[str, Any]:
+    """
+    Fetch the Underdog Fantasy over/under board.
+    
+    The board covers every sport Underdog offers; parse_underdog_data keeps
+    the NFL and CFB lines.
+    
+    Args:
+        cache (bool): Use the HTTP response cache (False always fetches a fresh board, e.g. when polling)
+    
+    Returns:
+        Dict[str, Any]: Response data with success status and results
+    """
+    print_api_separator("Underdog Fantasy")
+    
+    base_url = UNDERDOG_BASE_URL
+    
+    try:
+        print("🔗 Calling Underdog Fantasy API...")
+        print(f"🌐 URL: {base_url}")
+        
+        response = get_http_client().get(base_url, headers=PRIZEPICKS_HEADERS, timeout=30, cache=cache)
+        
+        print(f"📡 HTTP Status Code: {response.status_code}")
+        
+        if response.status_code != 200:
+            error_msg = f"HTTP {response.status_code}: {response.reason}"
+            print(f"❌ HTTP Error: {error_msg}")
+            print(f"📄 Response content: {response.text[:200]}...")
+            print_response_summary("Underdog Fantasy", False)
+            return {'success': False, 'error': error_msg, 'data': None}
+        
+        data = response.json()
+        
+        # Validate response structure
+        if not isinstance(data, dict) or 'over_under_lines' not in data:
+            error_msg = "Response missing 'over_under_lines' field"
+            print(f"❌ Response validation failed: {error_msg}")
+            print(f"📄 Response keys: {list(data.keys()) if isinstance(data, dict) else 'Not a dictionary'}")
+            print_response_summary("Underdog Fantasy", False)
+            return {'success': False, 'error': error_msg, 'data': data}
+        
+        lines = data['over_under_lines']
+        record_count = len(lines)
+        print(f"✅ Successfully retrieved {record_count} Underdog lines")
+        
+        # Save raw API data to file
+        save_api_data(data, "underdog", "over_under_lines.json")
+        
+        print_response_summary("Underdog Fantasy", True, record_count, lines[0] if lines else None)
+        
+        return {
+            'success': True,
+            'record_count': record_count,
+            'data': data
+        }
+        
+    except ValueError as e:
+        error_msg = f"Failed to parse JSON response: {str(e)}"
+        print(f"❌ JSON Error: {error_msg}")
+        print_response_summary("Underdog Fantasy", False)
+        return {'success': False, 'error': error_msg, 'data': None}
+        
+    except requests.exceptions.Timeout:
+        error_msg = "Request timeout (30 seconds)"
+        print(f"❌ Timeout Error: {error_msg}")
+        print_response_summary("Underdog Fantasy", False)
+        return {'success': False, 'error': error_msg, 'data': None}
+        
+    except requests.exceptions.ConnectionError as e:
+        error_msg = f"Connection error: {str(e)}"
+        print(f"❌ Connection Error: {error_msg}")
+        print_response_summary("Underdog Fantasy", False)
+        return {'success': False, 'error': error_msg, 'data': None}
+        
+    except Exception as e:
+        error_msg = f"Unexpected error: {str(e)}"
+        print(f"❌ Unexpected Error: {error_msg}")
+        print_response_summary("Underdog Fantasy", False)
+        return {'success': False, 'error': error_msg, 'data': None}
+
+
 def fetch_nfl_game_ids(year: int = 2023, week: int = 1, type_param: int = 2) -> Dict[str, Any]:
     """
     Fetch NFL game events and IDs from RapidAPI NFL Data service.
@@ -304,7 +593,7 @@ def fetch_nfl_game_ids(year: int = 2023, week: int = 1, type_param: int = 2) ->
         }
     
     # Build API URL and headers
-    base_url = f"https://{rapidapi_host}/nfl-weeks-events"
+    base_url = f"{RAPIDAPI_BASE_URL or f'https://{rapidapi_host}'}/nfl-weeks-events"
     params = {
         'year': year,
         'week': week,
@@ -313,8 +602,7 @@ def fetch_nfl_game_ids(year: int = 2023, week: int = 1, type_param: int = 2) ->
     
     headers = {
         'X-RapidAPI-Key': rapidapi_key,
-        'X-RapidAPI-Host': rapidapi_host,
-        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+        'X-RapidAPI-Host': rapidapi_host
     }
     
     try:
@@ -323,7 +611,7 @@ def fetch_nfl_game_ids(year: int = 2023, week: int = 1, type_param: int = 2) ->
         print(f"📋 Parameters: {params}")
         print(f"🔑 Using RapidAPI Host: {rapidapi_host}")
         
-        response = requests.get(base_url, params=params, headers=headers, timeout=30)
+        response = get_http_client().get(base_url, params=params, headers=headers, timeout=30)
         
         print(f"📡 HTTP Status Code: {response.status_code}")
         
@@ -474,7 +762,7 @@ def fetch_nfl_boxscore(event_id: str) -> Dict[str, Any]:
             return {'success': False, 'error': error_msg, 'event_id': event_id}
         
         # API endpoint for boxscore
-        url = f"https://{api_host}/nfl-boxscore"
+        url = f"{RAPIDAPI_BASE_URL or f'https://{api_host}'}/nfl-boxscore"
         params = {'id': event_id}
         
         headers = {
@@ -486,7 +774,7 @@ def fetch_nfl_boxscore(event_id: str) -> Dict[str, Any]:
         print(f"📋 Parameters: {params}")
         
         # Make the API request
-        response = requests.get(url, params=params, headers=headers, timeout=30)
+        response = get_http_client().get(url, params=params, headers=headers, timeout=30)
         
         print(f"📡 Response status: {response.status_code}")
         
@@ -584,14 +872,77 @@ def fetch_nfl_boxscore(event_id: str) -> Dict[str, Any]:
         return {'success': False, 'error': error_msg, 'event_id': event_id}
 
 
-def fetch_nfl_week_boxscores(year: int = 2023, week: int = 1, type_param: int = 2) -> Dict[str, Any]:
+def _fetch_week_game(game_number: int, game_item: Dict[str, Any], total_games: int) -> Dict[str, Any]:
+    """
+    Fetch one game's boxscore for fetch_nfl_week_boxscores and summarize it.
+    
+    Args:
+        game_number: 1-based position of the game in the week
+        game_item: Game entry from the game IDs response
+        total_games: Number of games in the week (for progress output)
+        
+    Returns:
+        Per-game summary dictionary
+    """
+    game_id = game_item.get('eventid')  # NFL API uses 'eventid' not 'id'
+    game_name = f"NFL Game {game_id}" if game_id else f"Game {game_number}"
+    
+    print(f"🎯 Processing Game {game_number}/{total_games}: {game_name} (ID: {game_id})")
+    
+    if not game_id:
+        print(f"⚠️ Skipping game {game_number}: No game ID found")
+        return {
+            'game_number': game_number,
+            'game_id': None,
+            'game_name': game_name,
+            'success': False,
+            'error': 'No game ID found'
+        }
+    
+    boxscore_result = fetch_nfl_boxscore(game_id)
+    
+    game_summary = {
+        'game_number': game_number,
+        'game_id': game_id,
+        'game_name': game_name,
+        'success': boxscore_result['success']
+    }
+    
+    if boxscore_result['success']:
+        game_summary.update({
+            'teams_count': boxscore_result.get('teams_count', 0),
+            'players_count': boxscore_result.get('players_count', 0)
+        })
+        print(f"✅ Game {game_number} completed successfully: {boxscore_result.get('players_count', 0)} player stats")
+    else:
+        game_summary['error'] = boxscore_result.get('error', 'Unknown error')
+        print(f"❌ Game {game_number} failed: {boxscore_result.get('error', 'Unknown error')}")
+    
+    return game_summary
+
+
+def fetch_nfl_week_boxscores(year: int = 2023, week: int = 1, type_param: int = 2,
+                             max_workers: int = 4,
+                             skip_game_ids: Optional[Collection[str]] = None) -> Dict[str, Any]:
     """
     Fetch detailed NFL boxscore data for ALL games in a specific week.
     
+    Boxscores are fetched by a bounded thread pool. Every request goes
+    through HttpClient, whose RateGovernor keeps all workers (and other
+    processes) under the RapidAPI plan's requests/second, so a week takes
+    roughly games / rate seconds instead of the sum of latencies. Cached
+    boxscores are not paced.
+    
+    For incremental runs, pass the already-ingested final games (see
+    DataRouter.get_processed_game_ids) as skip_game_ids; only the rest are
+    requested.
+    
     Args:
         year: NFL season year (default: 2023)
         week: Week number 1-18 (default: 1)
         type_param: Game type - 1=preseason, 2=regular season, 3=postseason (default: 2)
+        max_workers: Number of concurrent boxscore requests (1 fetches sequentially)
+        skip_game_ids: Game IDs not to fetch (e.g. final games already in the database)
         
     Returns:
         Dict containing success status and summary of all games processed
@@ -618,68 +969,35 @@ def fetch_nfl_week_boxscores(year: int = 2023, week: int = 1, type_param: int =
             print(f"⚠️ {error_msg}")
             return {'success': True, 'warning': error_msg, 'games_processed': 0, 'games': []}
         
+        if skip_game_ids:
+            skip = {str(game_id) for game_id in skip_game_ids}
+            game_items = [item for item in game_items if str(item.get('eventid')) not in skip]
+            skipped_games = len(games_data.get('items', [])) - len(game_items)
+            print(f"⏭️  Skipping {skipped_games} already-processed games")
+        else:
+            skipped_games = 0
+        
         total_games = len(game_items)
-        print(f"📊 Found {total_games} games to process")
+        rate = provider_limits()['rapidapi'].requests_per_second
+        print(f"📊 Found {total_games} games to process ({max_workers} workers, {rate:g} req/s)")
         print()
         
-        # Step 2: Process each game's boxscore
-        processed_games = []
-        successful_games = 0
-        failed_games = 0
+        # Step 2: Fetch boxscores concurrently; HttpClient paces the requests
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            processed_games = list(executor.map(
+                _fetch_week_game, range(1, total_games + 1), game_items, repeat(total_games)
+            ))
         
-        for i, game_item in enumerate(game_items, 1):
-            game_id = game_item.get('eventid')  # NFL API uses 'eventid' not 'id'
-            game_name = f"NFL Game {game_id}" if game_id else f"Game {i}"
-            
-            print(f"🎯 Processing Game {i}/{total_games}: {game_name} (ID: {game_id})")
-            
-            if not game_id:
-                print(f"⚠️ Skipping game {i}: No game ID found")
-                failed_games += 1
-                processed_games.append({
-                    'game_number': i,
-                    'game_id': None,
-                    'game_name': game_name,
-                    'success': False,
-                    'error': 'No game ID found'
-                })
-                continue
-            
-            # Fetch boxscore for this specific game
-            boxscore_result = fetch_nfl_boxscore(game_id)
-            
-            game_summary = {
-                'game_number': i,
-                'game_id': game_id,
-                'game_name': game_name,
-                'success': boxscore_result['success']
-            }
-            
-            if boxscore_result['success']:
-                successful_games += 1
-                game_summary.update({
-                    'teams_count': boxscore_result.get('teams_count', 0),
-                    'players_count': boxscore_result.get('players_count', 0)
-                })
-                print(f"✅ Game {i} completed successfully: {boxscore_result.get('players_count', 0)} player stats")
-            else:
-                failed_games += 1
-                game_summary['error'] = boxscore_result.get('error', 'Unknown error')
-                print(f"❌ Game {i} failed: {boxscore_result.get('error', 'Unknown error')}")
-            
-            processed_games.append(game_summary)
-            print()
-            
-            # Add small delay between requests to be respectful to the API
-            if i < total_games:  # Don't delay after the last game
-                import time
-                time.sleep(1)  # 1 second delay between requests
+        successful_games = sum(1 for game in processed_games if game['success'])
+        failed_games = total_games - successful_games
         
         # Step 3: Summary
         print("=" * 80)
         print("🏁 WEEKLY BOXSCORE PROCESSING SUMMARY")
         print("=" * 80)
-        print(f"📊 Total Games Found: {total_games}")
+        print(f"📊 Total Games Found: {total_games + skipped_games}")
+        if skipped_games:
+            print(f"⏭️  Skipped (already processed): {skipped_games}")
         print(f"✅ Successfully Processed: {successful_games}")
         print(f"❌ Failed: {failed_games}")
         print(f"📈 Success Rate: {(successful_games/total_games)*100:.1f}%" if total_games > 0 else "0.0%")
@@ -698,6 +1016,7 @@ def fetch_nfl_week_boxscores(year: int = 2023, week: int = 1, type_param: int =
             'total_games': total_games,
             'successful_games': successful_games,
             'failed_games': failed_games,
+            'skipped_games': skipped_games,
             'games': processed_games
         }
         
@@ -705,13 +1024,14 @@ def fetch_nfl_week_boxscores(year: int = 2023, week: int = 1, type_param: int =
         save_api_data(week_summary, "nfl_boxscore", filename)
         
         return {
-            'success': successful_games > 0,
+            'success': successful_games > 0 or total_games == 0,
             'year': year,
             'week': week,
             'type': type_param,
             'total_games': total_games,
             'successful_games': successful_games,
             'failed_games': failed_games,
+            'skipped_games': skipped_games,
             'games_processed': successful_games,
             'games': processed_games
         }
@@ -750,7 +1070,7 @@ def fetch_cfb_player_data(year: int = 2023, week: int = 1, season_type: str = 'r
         }
     
     # Build API URL and headers
-    base_url = "https://api.collegefootballdata.com/games/players"
+    base_url = f"{CFB_API_BASE_URL}/games/players"
     params = {
         'year': year,
         'week': week,
@@ -758,9 +1078,7 @@ def fetch_cfb_player_data(year: int = 2023, week: int = 1, season_type: str = 'r
     }
     
     headers = {
-        'Authorization': f'Bearer {cfb_api_key}',
-        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
-        'Accept': 'application/json'
+        'Authorization': f'Bearer {cfb_api_key}'
     }
     
     try:
@@ -769,7 +1087,7 @@ def fetch_cfb_player_data(year: int = 2023, week: int = 1, season_type: str = 'r
         print(f"📋 Parameters: {params}")
         print(f"🔑 Using Bearer token authentication")
         
-        response = requests.get(base_url, params=params, headers=headers, timeout=30)
+        response = get_http_client().get(base_url, params=params, headers=headers, timeout=30)
         
         print(f"📡 HTTP Status Code: {response.status_code}")
         
@@ -0,0 +1,87 @@
+"""
+Football Prop Insights - Archive Writer
+
+Writes raw API payloads (api_data/) and parsed records (parsed_data/) to
+JSON files on a background thread, so the in-process fetch -> parse -> route
+pipeline never waits on serialization or disk I/O. Files are written through
+parsers.json_backend to a temporary path and renamed into place, so readers
+never see partial files. With ARCHIVE_COMPRESSION=gzip|zstd (or the
+compression argument) they are stored as .json.gz / .json.zst.
+"""
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, List, Optional, Union
+
+from parsers.json_backend import ARCHIVE_COMPRESSION, dump_json_file
+
+
+class ArchiveWriter:
+    """Background JSON archive writer; writes are applied in submission order."""
+
+    def __init__(self, pretty: Optional[bool] = None, compression: Optional[str] = ARCHIVE_COMPRESSION):
+        """
+        Initialize the writer with a single background thread.
+
+        Args:
+            pretty: Indent archived files (None uses JSON_PRETTY; compact by default)
+            compression: 'gzip', 'zstd' or None (defaults to ARCHIVE_COMPRESSION)
+        """
+        self.pretty = pretty
+        self.compression = compression
+        self.errors: List[str] = []
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='archive-writer')
+        self._pending: List[Future] = []
+        self._lock = threading.Lock()
+
+    def write(self, file_path: Union[str, Path], data: Any) -> Future:
+        """
+        Queue data to be written to file_path.
+
+        The data object is serialized later on the writer thread, so callers
+        must not mutate it after submitting.
+
+        Args:
+            file_path: Destination file (the compression suffix is appended if needed)
+            data: JSON-serializable data
+
+        Returns:
+            Future resolving to the written Path
+        """
+        future = self._executor.submit(self._write, Path(file_path), data)
+        with self._lock:
+            self._pending.append(future)
+        return future
+
+    def _write(self, file_path: Path, data: Any) -> Optional[Path]:
+        try:
+            return dump_json_file(file_path, data, self.pretty, self.compression)
+        except Exception as e:
+            message = f"{file_path}: {e}"
+            with self._lock:
+                self.errors.append(message)
+            print(f"⚠️  Failed to archive {message}")
+            return None
+
+    def flush(self) -> int:
+        """
+        Wait until every queued write has finished.
+
+        Returns:
+            Number of files written since the last flush
+        """
+        with self._lock:
+            pending, self._pending = self._pending, []
+        return sum(1 for future in pending if future.result() is not None)
+
+    def close(self) -> None:
+        """Flush queued writes and stop the writer thread."""
+        self.flush()
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> 'ArchiveWriter':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
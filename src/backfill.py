@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Football Prop Insights - Season Backfill Engine
+
+Schedules every fetch of a multi-season backfill as its own job: one job per
+NFL week (game IDs), one per NFL game (boxscore) and one per CFB week (the
+CollegeFootballData endpoint is weekly). Each provider gets its own worker
+pool, so RapidAPI and CFB jobs run at the same time, and the shared
+RateGovernor keeps every pool within its provider's rate budget. Completed
+jobs are checkpointed as they finish (written at most every few seconds and
+once more at the end), so an interrupted backfill resumes from the last
+checkpointed job instead of the last finished week.
+
+Usage:
+    python3 src/backfill.py --nfl-years 2023 2024 --cfb-years 2024
+"""
+
+import argparse
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Union
+
+if __package__ in (None, ''):
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from src.api_client import set_archive_writer
+from src.pipeline import DataPipeline
+from parsers.json_backend import dump_json_file, load_json_file
+
+BACKFILL_CHECKPOINT_FILE = 'backfill_progress.json'
+
+# Minimum seconds between checkpoint writes while jobs are finishing
+CHECKPOINT_INTERVAL = 5.0
+
+# Provider whose rate budget each job kind spends
+JOB_PROVIDERS = {
+    'nfl_week': 'rapidapi',
+    'nfl_game': 'rapidapi',
+    'cfb_week': 'cfbd',
+}
+
+# Concurrent jobs per provider; the rate governor does the actual pacing
+DEFAULT_PROVIDER_WORKERS = {
+    'rapidapi': 4,
+    'cfbd': 2,
+}
+
+
+class BackfillJob(NamedTuple):
+    """One fetch -> parse -> route unit of a backfill."""
+    kind: str
+    year: int
+    week: int
+    season_type: Union[int, str]
+    game_id: Optional[str] = None
+
+    @property
+    def key(self) -> str:
+        """Checkpoint key, e.g. 'nfl_game:2024:2:1:401547353'."""
+        parts = [self.kind, str(self.year), str(self.season_type), str(self.week)]
+        if self.game_id is not None:
+            parts.append(self.game_id)
+        return ':'.join(parts)
+
+    @property
+    def provider(self) -> str:
+        return JOB_PROVIDERS[self.kind]
+
+
+class BackfillEngine:
+    """Runs backfill jobs concurrently per provider with job-level checkpoints."""
+
+    def __init__(self, checkpoint_file: str = BACKFILL_CHECKPOINT_FILE, route: bool = True,
+                 archive: bool = True, provider_workers: Optional[Dict[str, int]] = None,
+                 pipeline: Optional[DataPipeline] = None):
+        """
+        Initialize the engine and load any existing checkpoint.
+
+        Args:
+            checkpoint_file: JSON file recording finished and failed jobs
+            route: Route parsed records to the database as each job finishes
+            archive: Write raw and parsed JSON archives
+            provider_workers: Concurrent jobs per provider (defaults to DEFAULT_PROVIDER_WORKERS)
+            pipeline: DataPipeline to run jobs through (one is created from route/archive otherwise)
+        """
+        self.checkpoint_file = Path(checkpoint_file)
+        self.provider_workers = dict(DEFAULT_PROVIDER_WORKERS, **(provider_workers or {}))
+        self.pipeline = pipeline if pipeline is not None else DataPipeline(route=route, archive=archive)
+        self._owns_pipeline = pipeline is None
+
+        self.jobs: List[BackfillJob] = []
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._outstanding = 0
+        self._executors: Dict[str, ThreadPoolExecutor] = {}
+        self._run_stats = {'completed': 0, 'failed': 0, 'skipped': 0, 'records': 0}
+
+        self.checkpoint = self._load_checkpoint()
+        self._checkpoint_dirty = False
+        self._checkpoint_saved_at = time.monotonic()
+
+    def _load_checkpoint(self) -> Dict[str, Any]:
+        if self.checkpoint_file.exists():
+            checkpoint = load_json_file(self.checkpoint_file)
+            checkpoint.setdefault('completed', {})
+            checkpoint.setdefault('failed', {})
+            return checkpoint
+        return {'completed': {}, 'failed': {}, 'last_updated': None}
+
+    def _save_checkpoint(self, force: bool = False) -> None:
+        """
+        Write the checkpoint atomically if it changed (caller holds the lock).
+
+        Args:
+            force: Write now instead of waiting for CHECKPOINT_INTERVAL since the last write
+        """
+        if not self._checkpoint_dirty:
+            return
+        if not force and time.monotonic() - self._checkpoint_saved_at < CHECKPOINT_INTERVAL:
+            return
+
+        self.checkpoint['last_updated'] = datetime.now().isoformat()
+        dump_json_file(self.checkpoint_file, self.checkpoint, pretty=True)
+        self._checkpoint_dirty = False
+        self._checkpoint_saved_at = time.monotonic()
+
+    def add_nfl_season(self, year: int, weeks: Iterable[int] = range(1, 19), type_param: int = 2) -> None:
+        """Queue the game-ID job of every NFL week; boxscore jobs are added as game IDs arrive."""
+        self.jobs.extend(BackfillJob('nfl_week', year, week, type_param) for week in weeks)
+
+    def add_cfb_season(self, year: int, weeks: Iterable[int] = range(1, 16),
+                       season_type: str = 'regular') -> None:
+        """Queue one stats job per CFB week."""
+        self.jobs.extend(BackfillJob('cfb_week', year, week, season_type) for week in weeks)
+
+    def is_week_complete(self, kind: str, year: int, week: int, season_type: Union[int, str]) -> bool:
+        """
+        Check whether a week job and (for NFL) all of its game jobs have finished.
+
+        Args:
+            kind: 'nfl_week' or 'cfb_week'
+            year: Season year
+            week: Week number
+            season_type: NFL type_param or CFB season type
+
+        Returns:
+            True if nothing is left to fetch for the week
+        """
+        week_job = BackfillJob(kind, year, week, season_type)
+        with self._lock:
+            entry = self.checkpoint['completed'].get(week_job.key)
+            if entry is None:
+                return False
+            return all(
+                BackfillJob('nfl_game', year, week, season_type, game_id).key in self.checkpoint['completed']
+                for game_id in entry.get('game_ids', [])
+            )
+
+    def run(self) -> Dict[str, Any]:
+        """
+        Run every queued job and wait for all of them (including discovered game jobs).
+
+        Returns:
+            Dictionary with completed, failed, skipped and records counts for this run
+        """
+        print(f"🚀 Backfill: {len(self.jobs)} queued jobs, workers per provider: {self.provider_workers}")
+
+        # Install the pipeline's writer once so concurrent fetches never swap it
+        previous_writer = set_archive_writer(self.pipeline.writer)
+        self._executors = {
+            provider: ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix=f"backfill-{provider}")
+            for provider, workers in self.provider_workers.items()
+        }
+        try:
+            for job in self.jobs:
+                self._submit(job)
+
+            with self._idle:
+                while self._outstanding:
+                    self._idle.wait()
+        finally:
+            for executor in self._executors.values():
+                executor.shutdown(wait=True, cancel_futures=True)
+            set_archive_writer(previous_writer)
+            if self._owns_pipeline:
+                self.pipeline.close()
+            with self._lock:
+                self._save_checkpoint(force=True)
+
+        print(f"🏁 Backfill finished: {self._run_stats['completed']} jobs completed, "
+              f"{self._run_stats['failed']} failed, {self._run_stats['skipped']} already done, "
+              f"{self._run_stats['records']} records")
+        return dict(self._run_stats)
+
+    def _submit(self, job: BackfillJob) -> None:
+        with self._lock:
+            entry = self.checkpoint['completed'].get(job.key)
+            if entry is not None:
+                self._run_stats['skipped'] += 1
+            else:
+                self._outstanding += 1
+
+        if entry is not None:
+            # Finished week jobs still expand into any unfinished game jobs
+            for game_job in self._game_jobs(job, entry.get('game_ids', [])):
+                self._submit(game_job)
+            return
+
+        self._executors[job.provider].submit(self._run_job, job)
+
+    @staticmethod
+    def _game_jobs(job: BackfillJob, game_ids: List[str]) -> List[BackfillJob]:
+        if job.kind != 'nfl_week':
+            return []
+        return [BackfillJob('nfl_game', job.year, job.week, job.season_type, str(game_id)) for game_id in game_ids]
+
+    def _run_job(self, job: BackfillJob) -> None:
+        game_ids, skipped_ids = [], []
+        try:
+            # Step 1: Fetch -> parse -> route through the pipeline
+            if job.kind == 'nfl_week':
+                result = self.pipeline.run_nfl_game_ids(job.year, job.week, job.season_type)
+                if result['success']:
+                    # Final games already in games_processed need no boxscore job
+                    processed = self.pipeline.processed_game_ids(job.year, job.week)
+                    for game_id in result['records'].get('game_ids', []):
+                        (skipped_ids if str(game_id) in processed else game_ids).append(str(game_id))
+            elif job.kind == 'nfl_game':
+                result = self.pipeline.run_nfl_boxscore(job.game_id, job.year, job.week, job.season_type)
+            else:
+                result = self.pipeline.run_cfb_stats(job.year, job.week, job.season_type)
+        except Exception as e:
+            result = {'success': False, 'error': f"Unexpected error: {e}"}
+            game_ids, skipped_ids = [], []
+
+        try:
+            # Step 2: Checkpoint the outcome
+            with self._lock:
+                if result['success']:
+                    entry = {'records': result['record_count'], 'finished_at': datetime.now().isoformat()}
+                    if job.kind == 'nfl_week':
+                        entry['game_ids'] = game_ids
+                        entry['already_processed'] = skipped_ids
+                    self.checkpoint['completed'][job.key] = entry
+                    self.checkpoint['failed'].pop(job.key, None)
+                    self._run_stats['completed'] += 1
+                    self._run_stats['records'] += result['record_count']
+                else:
+                    self.checkpoint['failed'][job.key] = result.get('error')
+                    self._run_stats['failed'] += 1
+                    print(f"❌ Backfill job {job.key} failed: {result.get('error')}")
+                self._checkpoint_dirty = True
+                self._save_checkpoint()
+
+            # Step 3: Fan out the week's game jobs before this job counts as done
+            for game_job in self._game_jobs(job, game_ids):
+                self._submit(game_job)
+        finally:
+            with self._idle:
+                self._outstanding -= 1
+                if not self._outstanding:
+                    self._idle.notify_all()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Backfill NFL and CFB player stats for whole seasons')
+    parser.add_argument('--nfl-years', type=int, nargs='*', default=[], help='NFL seasons to backfill')
+    parser.add_argument('--cfb-years', type=int, nargs='*', default=[], help='CFB seasons to backfill')
+    parser.add_argument('--checkpoint', default=BACKFILL_CHECKPOINT_FILE, help='Checkpoint file')
+    parser.add_argument('--no-route', action='store_true', help='Only archive JSON; do not write to the database')
+    parser.add_argument('--rapidapi-workers', type=int, default=DEFAULT_PROVIDER_WORKERS['rapidapi'])
+    parser.add_argument('--cfb-workers', type=int, default=DEFAULT_PROVIDER_WORKERS['cfbd'])
+    args = parser.parse_args()
+
+    engine = BackfillEngine(args.checkpoint, route=not args.no_route,
+                            provider_workers={'rapidapi': args.rapidapi_workers, 'cfbd': args.cfb_workers})
+    for year in args.nfl_years:
+        engine.add_nfl_season(year)
+    for year in args.cfb_years:
+        engine.add_cfb_season(year)
+
+    result = engine.run()
+    sys.exit(1 if result['failed'] else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -12,6 +12,7 @@ The database module is organized into several specialized modules:
 - `schema.py`: Database schema creation and management
 - `insert.py`: Direct insertion functions for individual records
 - `batch.py`: Batch insertion operations with transaction support
+- `records.py`: Fixed-layout record types consumed by the batch inserters
 - `validation.py`: Data validation and quality assurance
 - `sample_data.py`: Sample data insertion and testing utilities
 - `parser_integration.py`: Integration with existing data parsers
@@ -117,8 +118,11 @@ try:
         batch_insert_player_stats,
         batch_insert_games_processed,
         batch_insert_mixed_data,
+        batch_insert_players,
+        batch_delete_player_stats,
         batch_transaction
     )
+    from .records import PropLineRecord, PlayerStatRecord
     from .validation import (
         ValidationSeverity,
         ValidationResult,
@@ -175,7 +179,12 @@ try:
         'batch_insert_player_stats',
         'batch_insert_games_processed',
         'batch_insert_mixed_data',
+        'batch_insert_players',
+        'batch_delete_player_stats',
         'batch_transaction',
+        # Record types
+        'PropLineRecord',
+        'PlayerStatRecord',
         # Validation
         'ValidationSeverity',
         'ValidationResult',
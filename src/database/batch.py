@@ -14,12 +14,13 @@ Features:
 """
 
 import logging
-from typing import Dict, Any, List, Optional, Union, Tuple
+from typing import Dict, Any, Iterable, List, Optional, Set, Union, Tuple
 from datetime import datetime
 from contextlib import contextmanager
 
 from .connection import get_connection_manager, PSYCOPG2_AVAILABLE
 from .insert import InsertError, _validate_required_fields
+from .records import PropLineRecord, PlayerStatRecord, PROP_LINE_COLUMNS, PLAYER_STAT_COLUMNS
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -80,11 +81,19 @@ class BatchInsertResult:
                 f"({self.success_rate:.1f}%) in {self.duration:.2f}s)")
 
 
+# ids of connections currently inside a batch_transaction
+_open_transactions: Set[int] = set()
+
+
 @contextmanager
 def batch_transaction(connection=None, rollback_on_error: bool = True):
     """
     Context manager for batch transaction handling.
     
+    Nested use on a connection that is already inside a batch_transaction
+    joins the enclosing transaction; only the outermost block commits or
+    rolls back.
+    
     Args:
         connection: Optional database connection to use
         rollback_on_error: Whether to rollback on any error
@@ -94,6 +103,11 @@ def batch_transaction(connection=None, rollback_on_error: bool = True):
     """
     manager = get_connection_manager()
     
+    if connection is not None and id(connection) in _open_transactions:
+        # Join the enclosing transaction; it commits or rolls back
+        yield connection
+        return
+    
     if connection:
         # Use provided connection
         conn = connection
@@ -111,6 +125,7 @@ def batch_transaction(connection=None, rollback_on_error: bool = True):
     try:
         # Start transaction
         conn.autocommit = False
+        _open_transactions.add(id(conn))
         yield conn
         
         # Commit if we reach here
@@ -126,6 +141,8 @@ def batch_transaction(connection=None, rollback_on_error: bool = True):
         raise
         
     finally:
+        _open_transactions.discard(id(conn))
+        
         # Restore autocommit and return connection
         if not external_connection:
             conn.autocommit = True
@@ -174,7 +191,30 @@ def _prepare_batch_insert_query(table_name: str, data_list: List[Dict[str, Any]]
     return query, parameters
 
 
-def batch_insert_prop_lines(data_list: List[Dict[str, Any]], 
+def _validate_batch_record(record: Union[Dict[str, Any], tuple], required_fields: List[str],
+                           table_name: str) -> None:
+    """
+    Validate required fields on a dict or a PropLineRecord/PlayerStatRecord.
+    
+    Raises:
+        InsertError: If any required fields are missing
+    """
+    if isinstance(record, (PropLineRecord, PlayerStatRecord)):
+        missing_fields = record.missing_fields(required_fields)
+        if missing_fields:
+            raise InsertError(f"Missing required fields for {table_name}: {missing_fields}")
+    else:
+        _validate_required_fields(record, required_fields, table_name)
+
+
+def _record_player_name(record: Union[Dict[str, Any], tuple]) -> str:
+    """Return the player name from a dict or record type for logging."""
+    if isinstance(record, (PropLineRecord, PlayerStatRecord)):
+        return record.player_name or 'unknown'
+    return record.get('player_name', 'unknown')
+
+
+def batch_insert_prop_lines(data_list: List[Union[Dict[str, Any], PropLineRecord]], 
                            connection=None,
                            chunk_size: int = 1000,
                            rollback_on_error: bool = True) -> BatchInsertResult:
@@ -182,7 +222,7 @@ def batch_insert_prop_lines(data_list: List[Dict[str, Any]],
     Batch insert prop betting line records.
     
     Args:
-        data_list: List of prop line data dictionaries
+        data_list: List of prop line dictionaries or PropLineRecord instances
         connection: Optional database connection to use
         chunk_size: Number of records to insert per batch
         rollback_on_error: Whether to rollback entire transaction on any error
@@ -205,10 +245,10 @@ def batch_insert_prop_lines(data_list: List[Dict[str, Any]],
                     # Validate chunk data
                     for j, record in enumerate(chunk):
                         try:
-                            _validate_required_fields(record, required_fields, table_name)
+                            _validate_batch_record(record, required_fields, table_name)
                             
-                            # Add defaults
-                            if 'odds_type' not in record:
+                            # Add defaults (PropLineRecord already defaults odds_type)
+                            if isinstance(record, dict) and 'odds_type' not in record:
                                 record['odds_type'] = 'standard'
                                 
                         except Exception as e:
@@ -221,13 +261,13 @@ def batch_insert_prop_lines(data_list: List[Dict[str, Any]],
                         from psycopg2.extras import execute_values
                         
                         # Prepare data for execute_values
-                        columns = ['player_id', 'player_name', 'team', 'opponent', 'position', 'stat_type', 
-                                  'line_score', 'game_time', 'league', 'source', 'odds_type', 'season', 'projection_id']
+                        columns = PROP_LINE_COLUMNS
                         
-                        values = []
-                        for record in chunk:
-                            row = tuple(record.get(col) for col in columns)
-                            values.append(row)
+                        values = [
+                            record.as_row() if isinstance(record, PropLineRecord)
+                            else tuple(record.get(col) for col in columns)
+                            for record in chunk
+                        ]
                         
                         query = f"""
                             INSERT INTO {table_name} ({', '.join(columns)})
@@ -244,7 +284,7 @@ def batch_insert_prop_lines(data_list: List[Dict[str, Any]],
                     else:
                         # Mock insertion
                         for j, record in enumerate(chunk):
-                            logger.info(f"Mock batch insert {table_name}: {record.get('player_name', 'unknown')}")
+                            logger.info(f"Mock batch insert {table_name}: {_record_player_name(record)}")
                             result.add_success(i + j + 1)
                     
                 except Exception as e:
@@ -265,7 +305,7 @@ def batch_insert_prop_lines(data_list: List[Dict[str, Any]],
         raise
 
 
-def batch_insert_player_stats(data_list: List[Dict[str, Any]], 
+def batch_insert_player_stats(data_list: List[Union[Dict[str, Any], PlayerStatRecord]], 
                              connection=None,
                              chunk_size: int = 1000,
                              rollback_on_error: bool = True) -> BatchInsertResult:
@@ -273,7 +313,7 @@ def batch_insert_player_stats(data_list: List[Dict[str, Any]],
     Batch insert player statistics records.
     
     Args:
-        data_list: List of player stats data dictionaries
+        data_list: List of player stats dictionaries or PlayerStatRecord instances
         connection: Optional database connection to use
         chunk_size: Number of records to insert per batch
         rollback_on_error: Whether to rollback entire transaction on any error
@@ -296,7 +336,7 @@ def batch_insert_player_stats(data_list: List[Dict[str, Any]],
                     # Validate chunk data
                     for j, record in enumerate(chunk):
                         try:
-                            _validate_required_fields(record, required_fields, table_name)
+                            _validate_batch_record(record, required_fields, table_name)
                         except Exception as e:
                             result.add_error(f"Record {i+j+1} validation failed: {e}")
                             if rollback_on_error:
@@ -307,18 +347,13 @@ def batch_insert_player_stats(data_list: List[Dict[str, Any]],
                         from psycopg2.extras import execute_values
                         
                         # All player_stats columns
-                        columns = [
-                            'player_id', 'player_name', 'team', 'opponent', 'position', 'stat_type',
-                            'passing_yards', 'completions', 'attempts', 'passing_touchdowns', 'interceptions',
-                            'sacks', 'sack_yards_lost', 'receiving_yards', 'receptions', 'targets', 
-                            'receiving_touchdowns', 'rushing_yards', 'rushing_attempts', 'rushing_touchdowns',
-                            'game_id', 'week', 'game_date', 'season', 'league', 'source'
-                        ]
+                        columns = PLAYER_STAT_COLUMNS
                         
-                        values = []
-                        for record in chunk:
-                            row = tuple(record.get(col) for col in columns)
-                            values.append(row)
+                        values = [
+                            record.as_row() if isinstance(record, PlayerStatRecord)
+                            else tuple(record.get(col) for col in columns)
+                            for record in chunk
+                        ]
                         
                         query = f"""
                             INSERT INTO {table_name} ({', '.join(columns)})
@@ -335,7 +370,7 @@ def batch_insert_player_stats(data_list: List[Dict[str, Any]],
                     else:
                         # Mock insertion
                         for j, record in enumerate(chunk):
-                            logger.info(f"Mock batch insert {table_name}: {record.get('player_name', 'unknown')}")
+                            logger.info(f"Mock batch insert {table_name}: {_record_player_name(record)}")
                             result.add_success(i + j + 1)
                     
                 except Exception as e:
@@ -359,7 +394,8 @@ def batch_insert_player_stats(data_list: List[Dict[str, Any]],
 def batch_insert_games_processed(data_list: List[Dict[str, Any]], 
                                 connection=None,
                                 chunk_size: int = 1000,
-                                rollback_on_error: bool = True) -> BatchInsertResult:
+                                rollback_on_error: bool = True,
+                                on_conflict: Optional[str] = None) -> BatchInsertResult:
     """
     Batch insert processed game tracking records.
     
@@ -368,6 +404,8 @@ def batch_insert_games_processed(data_list: List[Dict[str, Any]],
         connection: Optional database connection to use
         chunk_size: Number of records to insert per batch
         rollback_on_error: Whether to rollback entire transaction on any error
+        on_conflict: Handling of existing game_ids - None (error), 'ignore' (keep
+            the existing row) or 'update' (overwrite it, including is_final)
         
     Returns:
         BatchInsertResult with operation details
@@ -375,6 +413,16 @@ def batch_insert_games_processed(data_list: List[Dict[str, Any]],
     table_name = 'games_processed'
     required_fields = ['game_id', 'week', 'year', 'league', 'source']
     
+    conflict_clauses = {
+        None: '',
+        'ignore': 'ON CONFLICT (game_id) DO NOTHING',
+        'update': """ON CONFLICT (game_id) DO UPDATE SET
+                week = EXCLUDED.week, year = EXCLUDED.year, league = EXCLUDED.league,
+                source = EXCLUDED.source, game_type = EXCLUDED.game_type, is_final = EXCLUDED.is_final"""
+    }
+    if on_conflict not in conflict_clauses:
+        raise BatchInsertError(f"Invalid on_conflict value: {on_conflict}")
+    
     result = BatchInsertResult(table_name, len(data_list))
     
     try:
@@ -390,6 +438,8 @@ def batch_insert_games_processed(data_list: List[Dict[str, Any]],
                             _validate_required_fields(record, required_fields, table_name)
                             if 'game_type' not in record:
                                 record['game_type'] = 2  # Regular season
+                            if 'is_final' not in record:
+                                record['is_final'] = False
                         except Exception as e:
                             result.add_error(f"Record {i+j+1} validation failed: {e}")
                             if rollback_on_error:
@@ -399,7 +449,7 @@ def batch_insert_games_processed(data_list: List[Dict[str, Any]],
                     if PSYCOPG2_AVAILABLE:
                         from psycopg2.extras import execute_values
                         
-                        columns = ['game_id', 'week', 'year', 'league', 'source', 'game_type']
+                        columns = ['game_id', 'week', 'year', 'league', 'source', 'game_type', 'is_final']
                         
                         values = []
                         for record in chunk:
@@ -409,6 +459,7 @@ def batch_insert_games_processed(data_list: List[Dict[str, Any]],
                         query = f"""
                             INSERT INTO {table_name} ({', '.join(columns)})
                             VALUES %s
+                            {conflict_clauses[on_conflict]}
                             RETURNING id
                         """
                         
@@ -442,8 +493,121 @@ def batch_insert_games_processed(data_list: List[Dict[str, Any]],
         raise
 
 
-def batch_insert_mixed_data(prop_lines: List[Dict[str, Any]] = None,
-                           player_stats: List[Dict[str, Any]] = None,
+def batch_insert_players(data_list: List[Dict[str, Any]],
+                         connection=None,
+                         chunk_size: int = 1000,
+                         rollback_on_error: bool = True) -> BatchInsertResult:
+    """
+    Batch insert player reference records, skipping player_ids that already exist.
+    
+    Args:
+        data_list: List of player data dictionaries (player_id, name, league, source, ...)
+        connection: Optional database connection to use
+        chunk_size: Number of records to insert per batch
+        rollback_on_error: Whether to rollback entire transaction on any error
+        
+    Returns:
+        BatchInsertResult with operation details
+    """
+    table_name = 'players'
+    required_fields = ['player_id', 'name', 'league', 'source']
+    
+    result = BatchInsertResult(table_name, len(data_list))
+    
+    try:
+        with batch_transaction(connection, rollback_on_error) as conn:
+            # Process in chunks
+            for i in range(0, len(data_list), chunk_size):
+                chunk = data_list[i:i + chunk_size]
+                
+                try:
+                    # Validate chunk data
+                    for j, record in enumerate(chunk):
+                        try:
+                            _validate_required_fields(record, required_fields, table_name)
+                        except Exception as e:
+                            result.add_error(f"Record {i+j+1} validation failed: {e}")
+                            if rollback_on_error:
+                                raise BatchInsertError(f"Validation failed for record {i+j+1}: {e}")
+                    
+                    # Insert chunk
+                    if PSYCOPG2_AVAILABLE:
+                        from psycopg2.extras import execute_values
+                        
+                        columns = ['player_id', 'name', 'position', 'team', 'league', 'source']
+                        
+                        values = [tuple(record.get(col) for col in columns) for record in chunk]
+                        
+                        query = f"""
+                            INSERT INTO {table_name} ({', '.join(columns)})
+                            VALUES %s
+                            ON CONFLICT (player_id) DO NOTHING
+                            RETURNING id
+                        """
+                        
+                        with conn.cursor() as cursor:
+                            execute_values(cursor, query, values, template=None, page_size=chunk_size)
+                            inserted_ids = [row[0] for row in cursor.fetchall()]
+                            
+                            for inserted_id in inserted_ids:
+                                result.add_success(inserted_id)
+                    else:
+                        # Mock insertion
+                        for j, record in enumerate(chunk):
+                            logger.info(f"Mock batch insert {table_name}: {record.get('name', 'unknown')}")
+                            result.add_success(i + j + 1)
+                    
+                except Exception as e:
+                    error_msg = f"Chunk {i//chunk_size + 1} failed: {e}"
+                    result.add_error(error_msg)
+                    if rollback_on_error:
+                        raise BatchInsertError(error_msg) from e
+        
+        result.finish()
+        logger.info(f"Batch insert completed: {result}")
+        return result
+        
+    except Exception as e:
+        result.finish()
+        logger.error(f"Batch insert failed: {e}")
+        if not isinstance(e, BatchInsertError):
+            raise BatchInsertError(f"Batch insert failed: {e}") from e
+        raise
+
+
+def batch_delete_player_stats(game_ids: Iterable[str], connection=None) -> int:
+    """
+    Delete the player_stats rows of the given games.
+    
+    Run it in the same batch_transaction as the insert of the games' new
+    rows, so re-loading a game replaces its stats instead of duplicating them.
+    
+    Args:
+        game_ids: Games whose rows should be removed
+        connection: Optional database connection to use
+        
+    Returns:
+        Number of rows deleted
+    """
+    game_ids = sorted({str(game_id) for game_id in game_ids})
+    if not game_ids:
+        return 0
+    
+    with batch_transaction(connection) as conn:
+        if not PSYCOPG2_AVAILABLE:
+            logger.info(f"Mock batch delete player_stats for games: {', '.join(game_ids)}")
+            return 0
+        
+        with conn.cursor() as cursor:
+            cursor.execute("DELETE FROM player_stats WHERE game_id = ANY(%s)", (game_ids,))
+            deleted = cursor.rowcount
+    
+    logger.info(f"Deleted {deleted} existing player_stats rows for {len(game_ids)} games")
+    return deleted
+
+
+def batch_insert_mixed_data(prop_lines: List[Union[Dict[str, Any], PropLineRecord]] = None,
+                           player_stats: List[Union[Dict[str, Any], PlayerStatRecord]] = None,
                            games_processed: List[Dict[str, Any]] = None,
                            connection=None,
                            chunk_size: int = 1000,
@@ -627,6 +627,8 @@ def upsert_game_processed(data: Dict[str, Any], connection=None) -> Optional[int
         # Define conflict resolution
         conflict_columns = ['game_id']
         update_columns = ['week', 'year', 'league', 'source', 'game_type']
+        if 'is_final' in data_with_defaults:
+            update_columns.append('is_final')
         
         # Prepare upsert query
         query, parameters = _prepare_upsert_query(table_name, data_with_defaults, 
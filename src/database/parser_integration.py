@@ -14,9 +14,8 @@ Features:
 """
 
 import logging
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, List, Optional, Set, Union, Iterable, Callable
 from pathlib import Path
-import json
 
 from .insert import (
     insert_prop_line, insert_player_stats, insert_game_processed,
@@ -25,10 +24,12 @@ from .insert import (
 )
 from .batch import (
     batch_insert_prop_lines, batch_insert_player_stats,
-    batch_insert_games_processed, batch_insert_mixed_data,
-    BatchInsertResult, BatchInsertError
+    batch_insert_games_processed, batch_insert_mixed_data, batch_insert_players,
+    batch_delete_player_stats, batch_transaction, BatchInsertResult, BatchInsertError
 )
-from .connection import get_connection_manager, PSYCOPG2_AVAILABLE
+from .connection import get_connection_manager, cursor_context, PSYCOPG2_AVAILABLE
+from .records import PropLineRecord, PlayerStatRecord
+from parsers.json_backend import JSON_DECODE_ERRORS, glob_json_files, load_json_file, resolve_json_file
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -70,36 +71,9 @@ class DataRouter:
         logger.info(f"Routing {len(parsed_data)} PrizePicks records to prop_lines table")
         
         try:
-            # Transform data for prop_lines table if needed
-            transformed_data = []
-            for record in parsed_data:
-                # PrizePicks data should already match prop_lines schema
-                transformed_record = {
-                    'player_id': record.get('player_id'),
-                    'player_name': record.get('player'),  # Note: 'player' field maps to 'player_name'
-                    'team': record.get('team'),
-                    'opponent': record.get('opponent'),
-                    'position': record.get('position'),
-                    'stat_type': record.get('stat_type'),
-                    'line_score': record.get('line_score'),
-                    'game_time': record.get('game_time'),
-                    'league': record.get('league'),
-                    'source': record.get('source', 'PrizePicks'),
-                    'odds_type': record.get('odds_type', 'standard'),
-                    'season': record.get('season'),
-                    'projection_id': record.get('projection_id')
-                }
-                
-                # Only add records with required fields
-                if all(transformed_record.get(field) for field in 
-                      ['player_id', 'player_name', 'team', 'position', 'stat_type', 'league', 'season']):
-                    transformed_data.append(transformed_record)
-                else:
-                    logger.warning(f"Skipping incomplete PrizePicks record: {record}")
-            
             # Batch insert
             return batch_insert_prop_lines(
-                transformed_data, 
+                self._prop_line_records(parsed_data), 
                 connection=connection, 
                 chunk_size=self.batch_size
             )
@@ -108,14 +82,138 @@ class DataRouter:
             logger.error(f"Failed to route PrizePicks data: {e}")
             raise ParserIntegrationError(f"PrizePicks routing failed: {e}") from e
     
-    def route_nfl_boxscore_data(self, parsed_data: List[Dict[str, Any]], 
+    def route_line_board(self, parsed_data: List[Dict[str, Any]],
+                         connection=None) -> BatchInsertResult:
+        """
+        Route a combined multi-book line board to prop_lines in one transaction.
+        
+        Records keep their own source ('PrizePicks', 'Underdog', ...), so
+        lines from every book land in a single batched insert.
+        
+        Args:
+            parsed_data: Parsed prop records from any line parser
+            connection: Optional database connection
+            
+        Returns:
+            BatchInsertResult with operation details
+        """
+        source_counts: Dict[str, int] = {}
+        for record in parsed_data:
+            source = record.get('source') or 'PrizePicks'
+            source_counts[source] = source_counts.get(source, 0) + 1
+        logger.info(f"Routing {len(parsed_data)} board lines to prop_lines table: {source_counts}")
+        
+        try:
+            return batch_insert_prop_lines(
+                self._prop_line_records(parsed_data),
+                connection=connection,
+                chunk_size=self.batch_size
+            )
+            
+        except Exception as e:
+            logger.error(f"Failed to route line board: {e}")
+            raise ParserIntegrationError(f"Line board routing failed: {e}") from e
+    
+    @staticmethod
+    def _prop_line_records(parsed_data: Iterable[Dict[str, Any]]) -> List[PropLineRecord]:
+        """Build fixed-layout records the batch inserter consumes directly, skipping incomplete ones."""
+        transformed_data = []
+        for record in parsed_data:
+            prop_record = PropLineRecord.from_parsed(record)
+            
+            # Only add records with required fields
+            if not prop_record.missing_fields(
+                    ['player_id', 'player_name', 'team', 'position', 'stat_type', 'league', 'season']):
+                transformed_data.append(prop_record)
+            else:
+                logger.warning(f"Skipping incomplete {prop_record.source} record: {record}")
+        return transformed_data
+    
+    def route_prizepicks_delta(self, delta: Dict[str, Any],
                                connection=None) -> BatchInsertResult:
         """
+        Route only the added and moved lines from diff_prizepicks_board.
+        
+        Removed lines are logged but not written; prop_lines keeps the
+        history of every line that was posted.
+        
+        Args:
+            delta: Result of parsers.diff_prizepicks_board
+            connection: Optional database connection
+            
+        Returns:
+            BatchInsertResult with operation details
+        """
+        records = list(delta.get('added', []))
+        records.extend(change['record'] for change in delta.get('changed', []))
+        
+        logger.info(
+            f"PrizePicks delta: {len(delta.get('added', []))} added, "
+            f"{len(delta.get('changed', []))} changed, "
+            f"{len(delta.get('removed', []))} removed, "
+            f"{delta.get('unchanged', 0)} unchanged"
+        )
+        
+        return self.route_prizepicks_data(records, connection)
+    
+    def route_prizepicks_stream(self, records: Iterable[Dict[str, Any]],
+                                connection=None) -> List[BatchInsertResult]:
+        """
+        Route a stream of PrizePicks records (e.g. from iter_prizepicks_records)
+        to prop_lines, inserting each batch_size chunk as soon as it fills.
+        
+        Args:
+            records: Iterable of parsed PrizePicks projections
+            connection: Optional database connection
+            
+        Returns:
+            List of BatchInsertResult, one per routed chunk
+        """
+        return self._route_in_batches(records, self.route_prizepicks_data, connection)
+    
+    def _route_in_batches(self, records: Iterable[Dict[str, Any]],
+                          route_func: Callable[..., BatchInsertResult],
+                          connection=None) -> List[BatchInsertResult]:
+        """
+        Drain an iterable of records through route_func in batch_size chunks.
+        
+        Args:
+            records: Iterable of parsed records
+            route_func: Bound route_* method that accepts (records, connection)
+            connection: Optional database connection
+            
+        Returns:
+            List of BatchInsertResult, one per routed chunk
+        """
+        results = []
+        chunk = []
+        
+        for record in records:
+            chunk.append(record)
+            if len(chunk) >= self.batch_size:
+                results.append(route_func(chunk, connection))
+                chunk = []
+        
+        if chunk:
+            results.append(route_func(chunk, connection))
+        
+        return results
+    
+    def route_nfl_boxscore_data(self, parsed_data: List[Dict[str, Any]], 
+                               connection=None,
+                               processed_game: Optional[Dict[str, Any]] = None) -> BatchInsertResult:
+        """
         Route NFL boxscore parsed data to player_stats table.
         
+        Existing rows of the routed games are deleted in the same transaction,
+        so re-running a game replaces its stats instead of duplicating them.
+        
         Args:
             parsed_data: List of parsed NFL boxscore player stats
             connection: Optional database connection
+            processed_game: games_processed record (game_id, week, year, league,
+                source, game_type, is_final) upserted in the same transaction as
+                the stats, so a game is only marked processed once its stats are in
             
         Returns:
             BatchInsertResult with operation details
@@ -123,54 +221,33 @@ class DataRouter:
         logger.info(f"Routing {len(parsed_data)} NFL boxscore records to player_stats table")
         
         try:
-            # Transform data for player_stats table
+            # Build fixed-layout records the batch inserter consumes directly
             transformed_data = []
             for record in parsed_data:
-                # NFL boxscore data should already match player_stats schema
-                transformed_record = {
-                    'player_id': record.get('player_id'),
-                    'player_name': record.get('player'),
-                    'team': record.get('team'),
-                    'opponent': record.get('opponent'),
-                    'position': record.get('position'),
-                    'stat_type': record.get('stat_type'),
-                    'game_id': record.get('game_id'),
-                    'week': record.get('week'),
-                    'game_date': record.get('game_date'),
-                    'season': record.get('season'),
-                    'league': record.get('league', 'nfl'),
-                    'source': record.get('source', 'RapidAPI'),
-                    
-                    # Position-specific stats
-                    'passing_yards': record.get('passing_yards'),
-                    'completions': record.get('completions'),
-                    'attempts': record.get('attempts'),
-                    'passing_touchdowns': record.get('passing_touchdowns'),
-                    'interceptions': record.get('interceptions'),
-                    'sacks': record.get('sacks'),
-                    'sack_yards_lost': record.get('sack_yards_lost'),
-                    'receiving_yards': record.get('receiving_yards'),
-                    'receptions': record.get('receptions'),
-                    'targets': record.get('targets'),
-                    'receiving_touchdowns': record.get('receiving_touchdowns'),
-                    'rushing_yards': record.get('rushing_yards'),
-                    'rushing_attempts': record.get('rushing_attempts'),
-                    'rushing_touchdowns': record.get('rushing_touchdowns')
-                }
+                stat_record = PlayerStatRecord.from_parsed(
+                    record,
+                    league=record.get('league', 'nfl'),
+                    source=record.get('source', 'RapidAPI')
+                )
                 
                 # Only add records with required fields
-                if all(transformed_record.get(field) for field in 
-                      ['player_id', 'player_name', 'team', 'position', 'stat_type', 'game_id', 'season']):
-                    transformed_data.append(transformed_record)
+                if not stat_record.missing_fields(
+                        ['player_id', 'player_name', 'team', 'position', 'stat_type', 'game_id', 'season']):
+                    transformed_data.append(stat_record)
                 else:
                     logger.warning(f"Skipping incomplete NFL boxscore record: {record}")
             
-            # Batch insert
-            return batch_insert_player_stats(
-                transformed_data,
-                connection=connection,
-                chunk_size=self.batch_size
-            )
+            # Replace the games' stats and mark the game processed atomically
+            with batch_transaction(connection) as conn:
+                batch_delete_player_stats({record.game_id for record in transformed_data}, connection=conn)
+                result = batch_insert_player_stats(
+                    transformed_data,
+                    connection=conn,
+                    chunk_size=self.batch_size
+                )
+                if processed_game is not None:
+                    batch_insert_games_processed([processed_game], connection=conn, on_conflict='update')
+            return result
             
         except Exception as e:
             logger.error(f"Failed to route NFL boxscore data: {e}")
@@ -191,42 +268,25 @@ class DataRouter:
         logger.info(f"Routing {len(parsed_data)} CFB stats records to player_stats table")
         
         try:
-            # Transform data for player_stats table
+            # Build fixed-layout records the batch inserter consumes directly
             transformed_data = []
             for record in parsed_data:
-                # CFB data should already match player_stats schema
-                transformed_record = {
-                    'player_id': record.get('player_id'),
-                    'player_name': record.get('player'),
-                    'team': record.get('team'),
-                    'opponent': record.get('opponent'),
-                    'position': record.get('position'),
-                    'stat_type': record.get('stat_type'),
-                    'game_id': record.get('game_id', f"cfb_{record.get('season', 2023)}_w{record.get('week', 1)}_{record.get('team', 'unk').lower()}"),
-                    'week': record.get('week'),
-                    'game_date': record.get('start_time'),  # CFB uses 'start_time'
-                    'season': record.get('season'),
-                    'league': record.get('league', 'college'),
-                    'source': record.get('source', 'CollegeFootballData'),
-                    
-                    # Position-specific stats
-                    'passing_yards': record.get('passing_yards'),
-                    'completions': record.get('completions'),
-                    'attempts': record.get('attempts'),
-                    'passing_touchdowns': record.get('passing_touchdowns'),
-                    'interceptions': record.get('interceptions'),
-                    'receiving_yards': record.get('receiving_yards'),
-                    'receptions': record.get('receptions'),
-                    'receiving_touchdowns': record.get('receiving_touchdowns'),
-                    'rushing_yards': record.get('rushing_yards'),
-                    'rushing_attempts': record.get('rushing_attempts'),
-                    'rushing_touchdowns': record.get('rushing_touchdowns')
-                }
+                stat_record = PlayerStatRecord.from_parsed(
+                    record,
+                    game_id=record.get('game_id', f"cfb_{record.get('season', 2023)}_w{record.get('week', 1)}_{record.get('team', 'unk').lower()}"),
+                    game_date=record.get('start_time'),  # CFB uses 'start_time'
+                    league=record.get('league', 'college'),
+                    source=record.get('source', 'CollegeFootballData'),
+                    # CFB parser does not emit these columns
+                    sacks=None,
+                    sack_yards_lost=None,
+                    targets=None
+                )
                 
                 # Only add records with required fields
-                if all(transformed_record.get(field) for field in 
-                      ['player_id', 'player_name', 'team', 'position', 'stat_type', 'season']):
-                    transformed_data.append(transformed_record)
+                if not stat_record.missing_fields(
+                        ['player_id', 'player_name', 'team', 'position', 'stat_type', 'season']):
+                    transformed_data.append(stat_record)
                 else:
                     logger.warning(f"Skipping incomplete CFB record: {record}")
             
@@ -241,6 +301,21 @@ class DataRouter:
             logger.error(f"Failed to route CFB stats data: {e}")
             raise ParserIntegrationError(f"CFB stats routing failed: {e}") from e
     
+    def route_cfb_stats_stream(self, records: Iterable[Dict[str, Any]],
+                               connection=None) -> List[BatchInsertResult]:
+        """
+        Route a stream of CFB records (e.g. from iter_cfb_player_records)
+        to player_stats, inserting each batch_size chunk as soon as it fills.
+        
+        Args:
+            records: Iterable of parsed CFB player stats
+            connection: Optional database connection
+            
+        Returns:
+            List of BatchInsertResult, one per routed chunk
+        """
+        return self._route_in_batches(records, self.route_cfb_stats_data, connection)
+    
     def route_nfl_game_ids_data(self, parsed_data: Dict[str, Any], 
                                connection=None) -> BatchInsertResult:
         """
@@ -273,16 +348,108 @@ class DataRouter:
                 }
                 game_records.append(game_record)
             
-            # Batch insert
+            # Batch insert; known games keep their row (and is_final flag) when upserting
             return batch_insert_games_processed(
                 game_records,
                 connection=connection,
-                chunk_size=self.batch_size
+                chunk_size=self.batch_size,
+                on_conflict='ignore' if self.use_upsert else None
             )
             
         except Exception as e:
             logger.error(f"Failed to route NFL game IDs data: {e}")
             raise ParserIntegrationError(f"NFL game IDs routing failed: {e}") from e
+    
+    def get_processed_game_ids(self, league: str, year: int, week: int,
+                               final_only: bool = True) -> Set[str]:
+        """
+        Get the games of a week that are already in games_processed, in one query.
+        
+        Args:
+            league: 'nfl' or 'college'
+            year: Season year
+            week: Week number
+            final_only: Only return games whose stats were loaded after they finished
+            
+        Returns:
+            Set of game_id strings (empty when the database is unavailable or
+            the query fails, so callers fall back to fetching every game)
+        """
+        if not PSYCOPG2_AVAILABLE:
+            return set()
+        
+        query = "SELECT game_id FROM games_processed WHERE league = %s AND year = %s AND week = %s"
+        if final_only:
+            query += " AND is_final"
+        
+        try:
+            with cursor_context() as cursor:
+                cursor.execute(query, (league, year, week))
+                return {str(row[0]) for row in cursor.fetchall()}
+        except Exception as e:
+            logger.warning(f"Could not read processed games for {league} {year} week {week}: {e}")
+            return set()
+
+
+def load_player_registry_from_database(registry=None) -> int:
+    """
+    Seed the player registry with existing rows from the players table.
+    
+    Only rows whose player_id is an integer registry key are loaded; legacy
+    hashed ids are left alone.
+    
+    Args:
+        registry: PlayerRegistry to seed (defaults to the shared parser registry)
+        
+    Returns:
+        Number of players registered
+    """
+    from parsers.player_registry import get_player_registry
+    
+    registry = registry or get_player_registry()
+    
+    if not PSYCOPG2_AVAILABLE:
+        logger.info("Mock player registry load (psycopg2 not available)")
+        return 0
+    
+    with cursor_context() as cursor:
+        cursor.execute("SELECT player_id, name, team, league, position, source FROM players")
+        rows = cursor.fetchall()
+    
+    loaded = 0
+    for player_id, name, team, league, position, source in rows:
+        if str(player_id).isdigit():
+            registry.register(int(player_id), name, team, league, position, source)
+            loaded += 1
+    
+    logger.info(f"Loaded {loaded} players into registry from players table")
+    return loaded
+
+
+def sync_player_registry(registry=None, connection=None) -> BatchInsertResult:
+    """
+    Persist players assigned since the last sync to the players table.
+    
+    Args:
+        registry: PlayerRegistry to sync (defaults to the shared parser registry)
+        connection: Optional database connection
+        
+    Returns:
+        BatchInsertResult with operation details
+    """
+    from parsers.player_registry import get_player_registry
+    
+    registry = registry or get_player_registry()
+    pending = registry.pending_players()
+    
+    logger.info(f"Syncing {len(pending)} new players to players table")
+    
+    result = batch_insert_players(pending, connection=connection)
+    if result.failed_records == 0:
+        registry.mark_persisted([player['player_id'] for player in pending])
+        registry.save()
+    
+    return result
 
 
 def load_and_route_parsed_file(file_path: Union[str, Path], 
@@ -306,15 +473,14 @@ def load_and_route_parsed_file(file_path: Union[str, Path],
     Raises:
         ParserIntegrationError: If file loading or routing fails
     """
-    file_path = Path(file_path)
+    file_path = resolve_json_file(file_path)
     
     if not file_path.exists():
         raise ParserIntegrationError(f"Parsed file not found: {file_path}")
     
     try:
         # Load parsed data
-        with open(file_path, 'r') as f:
-            parsed_data = json.load(f)
+        parsed_data = load_json_file(file_path)
         
         logger.info(f"Loaded {file_path} with {len(parsed_data) if isinstance(parsed_data, list) else 1} records")
         
@@ -332,7 +498,7 @@ def load_and_route_parsed_file(file_path: Union[str, Path],
         else:
             raise ParserIntegrationError(f"Unknown data type: {data_type}")
         
-    except json.JSONDecodeError as e:
+    except JSON_DECODE_ERRORS as e:
         raise ParserIntegrationError(f"Invalid JSON in file {file_path}: {e}") from e
     except Exception as e:
         if isinstance(e, ParserIntegrationError):
@@ -375,7 +541,7 @@ def bulk_load_parsed_directory(parsed_data_dir: Union[str, Path],
         # Process PrizePicks data
         prizepicks_dir = parsed_data_dir / 'prizepicks'
         if prizepicks_dir.exists():
-            for file in prizepicks_dir.glob('*_parsed.json'):
+            for file in glob_json_files(prizepicks_dir, '*_parsed.json'):
                 try:
                     result = load_and_route_parsed_file(file, 'prizepicks', use_upsert, batch_size)
                     results['prizepicks'].append(result)
@@ -386,7 +552,7 @@ def bulk_load_parsed_directory(parsed_data_dir: Union[str, Path],
         # Process NFL boxscore data
         nfl_boxscore_dir = parsed_data_dir / 'nfl_boxscore'
         if nfl_boxscore_dir.exists():
-            for file in nfl_boxscore_dir.glob('*_parsed.json'):
+            for file in glob_json_files(nfl_boxscore_dir, '*_parsed.json'):
                 try:
                     result = load_and_route_parsed_file(file, 'nfl_boxscore', use_upsert, batch_size)
                     results['nfl_boxscore'].append(result)
@@ -397,7 +563,7 @@ def bulk_load_parsed_directory(parsed_data_dir: Union[str, Path],
         # Process CFB stats data
         cfb_stats_dir = parsed_data_dir / 'cfb_stats'
         if cfb_stats_dir.exists():
-            for file in cfb_stats_dir.glob('*_parsed.json'):
+            for file in glob_json_files(cfb_stats_dir, '*_parsed.json'):
                 try:
                     result = load_and_route_parsed_file(file, 'cfb_stats', use_upsert, batch_size)
                     results['cfb_stats'].append(result)
@@ -408,7 +574,7 @@ def bulk_load_parsed_directory(parsed_data_dir: Union[str, Path],
         # Process NFL game IDs data
         nfl_stats_dir = parsed_data_dir / 'nfl_stats'
         if nfl_stats_dir.exists():
-            for file in nfl_stats_dir.glob('*_parsed.json'):
+            for file in glob_json_files(nfl_stats_dir, '*_parsed.json'):
                 try:
                     result = load_and_route_parsed_file(file, 'nfl_game_ids', use_upsert, batch_size)
                     results['nfl_game_ids'].append(result)
@@ -416,6 +582,12 @@ def bulk_load_parsed_directory(parsed_data_dir: Union[str, Path],
                 except Exception as e:
                     logger.error(f"❌ {file.name}: {e}")
         
+        # Persist registry players referenced by the loaded records
+        try:
+            sync_player_registry()
+        except Exception as e:
+            logger.error(f"❌ Player registry sync failed: {e}")
+        
         # Summary
         total_files = sum(len(file_results) for file_results in results.values())
         total_records = sum(
@@ -0,0 +1,120 @@
+"""
+Database Record Types
+
+Compact, fixed-layout record types for the two high-volume tables. Each
+record is a NamedTuple whose field order matches the column order used by
+the batch inserters, so ``as_row()`` hands the record itself to
+execute_values without building an intermediate dict or tuple.
+
+Features:
+- PropLineRecord for prop_lines rows
+- PlayerStatRecord for player_stats rows
+- from_parsed() constructors that map parser output field names
+"""
+
+from typing import Dict, Any, List, NamedTuple, Optional
+
+
+class PropLineRecord(NamedTuple):
+    """A single prop_lines row in batch insert column order."""
+
+    player_id: Optional[str] = None
+    player_name: Optional[str] = None
+    team: Optional[str] = None
+    opponent: Optional[str] = None
+    position: Optional[str] = None
+    stat_type: Optional[str] = None
+    line_score: Optional[float] = None
+    game_time: Optional[str] = None
+    league: Optional[str] = None
+    source: Optional[str] = 'PrizePicks'
+    odds_type: Optional[str] = 'standard'
+    season: Optional[int] = None
+    projection_id: Optional[str] = None
+
+    @classmethod
+    def from_parsed(cls, record: Dict[str, Any], **overrides) -> 'PropLineRecord':
+        """
+        Build a record from a parsed PrizePicks dictionary.
+
+        Args:
+            record: Parsed projection (accepts 'player_name' or legacy 'player')
+            **overrides: Field values that take precedence over the parsed record
+
+        Returns:
+            PropLineRecord instance
+        """
+        values = {field: record.get(field) for field in cls._fields}
+        values['player_name'] = record.get('player_name') or record.get('player')
+        values['source'] = values['source'] or 'PrizePicks'
+        values['odds_type'] = values['odds_type'] or 'standard'
+        values.update(overrides)
+        return cls(**values)
+
+    def as_row(self) -> tuple:
+        """Return the record as a parameter tuple (the record itself, no copy)."""
+        return self
+
+    def missing_fields(self, fields: List[str]) -> List[str]:
+        """Return the subset of fields that are None or empty."""
+        return [field for field in fields if not getattr(self, field)]
+
+
+class PlayerStatRecord(NamedTuple):
+    """A single player_stats row in batch insert column order."""
+
+    player_id: Optional[str] = None
+    player_name: Optional[str] = None
+    team: Optional[str] = None
+    opponent: Optional[str] = None
+    position: Optional[str] = None
+    stat_type: Optional[str] = None
+    passing_yards: Optional[float] = None
+    completions: Optional[int] = None
+    attempts: Optional[int] = None
+    passing_touchdowns: Optional[int] = None
+    interceptions: Optional[int] = None
+    sacks: Optional[int] = None
+    sack_yards_lost: Optional[int] = None
+    receiving_yards: Optional[float] = None
+    receptions: Optional[int] = None
+    targets: Optional[int] = None
+    receiving_touchdowns: Optional[int] = None
+    rushing_yards: Optional[float] = None
+    rushing_attempts: Optional[int] = None
+    rushing_touchdowns: Optional[int] = None
+    game_id: Optional[str] = None
+    week: Optional[int] = None
+    game_date: Optional[str] = None
+    season: Optional[int] = None
+    league: Optional[str] = None
+    source: Optional[str] = None
+
+    @classmethod
+    def from_parsed(cls, record: Dict[str, Any], **overrides) -> 'PlayerStatRecord':
+        """
+        Build a record from a parsed boxscore or CFB stats dictionary.
+
+        Args:
+            record: Parsed player stat line (accepts 'player' or 'player_name')
+            **overrides: Field values that take precedence over the parsed record
+
+        Returns:
+            PlayerStatRecord instance
+        """
+        values = {field: record.get(field) for field in cls._fields}
+        values['player_name'] = record.get('player') or record.get('player_name')
+        values.update(overrides)
+        return cls(**values)
+
+    def as_row(self) -> tuple:
+        """Return the record as a parameter tuple (the record itself, no copy)."""
+        return self
+
+    def missing_fields(self, fields: List[str]) -> List[str]:
+        """Return the subset of fields that are None or empty."""
+        return [field for field in fields if not getattr(self, field)]
+
+
+PROP_LINE_COLUMNS = list(PropLineRecord._fields)
+PLAYER_STAT_COLUMNS = list(PlayerStatRecord._fields)
@@ -13,7 +13,6 @@ Features:
 - Comprehensive error handling and logging
 """
 
-import json
 import logging
 import os
 import random
@@ -21,6 +20,8 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
 
+from parsers.json_backend import glob_json_files, load_json_file
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -83,28 +84,28 @@ class SampleDataLoader:
         prizepicks_dir = self.base_path / "prizepicks"
         if prizepicks_dir.exists():
             available_files['prizepicks'] = [
-                str(f) for f in prizepicks_dir.glob("*_parsed.json")
+                str(f) for f in glob_json_files(prizepicks_dir, "*_parsed.json")
             ]
         
         # Scan for NFL stats files
         nfl_stats_dir = self.base_path / "nfl_stats"
         if nfl_stats_dir.exists():
             available_files['nfl_stats'] = [
-                str(f) for f in nfl_stats_dir.glob("games_*_parsed.json")
+                str(f) for f in glob_json_files(nfl_stats_dir, "games_*_parsed.json")
             ]
         
         # Scan for NFL boxscore files
         nfl_boxscore_dir = self.base_path / "nfl_boxscore"
         if nfl_boxscore_dir.exists():
             available_files['nfl_boxscore'] = [
-                str(f) for f in nfl_boxscore_dir.glob("*_parsed.json")
+                str(f) for f in glob_json_files(nfl_boxscore_dir, "*_parsed.json")
             ][:5]  # Limit to 5 files for testing
         
         # Scan for CFB stats files
         cfb_stats_dir = self.base_path / "cfb_stats"
         if cfb_stats_dir.exists():
             available_files['cfb_stats'] = [
-                str(f) for f in cfb_stats_dir.glob("*_parsed.json")
+                str(f) for f in glob_json_files(cfb_stats_dir, "*_parsed.json")
             ]
         
         return available_files
@@ -130,8 +131,7 @@ class SampleDataLoader:
         file_path = available_files[data_type][0]
         
         try:
-            with open(file_path, 'r') as f:
-                data = json.load(f)
+            data = load_json_file(file_path)
             
             # Handle different data structures
             if isinstance(data, list):
@@ -0,0 +1,288 @@
+"""
+Football Prop Insights - On-Disk HTTP Response Cache
+
+SQLite-backed cache for GET responses, keyed by URL + query parameters and
+used by HttpClient. Each endpoint has a TTL policy: finished NFL boxscores
+and finished seasons are kept forever, live PrizePicks and Underdog boards
+for a couple of minutes. Expired entries that carry an ETag or Last-Modified header are
+revalidated with a conditional request, so a 304 refreshes the entry
+without re-downloading the body. Total body size is capped with
+least-recently-used eviction.
+
+Set HTTP_CACHE=0 to bypass the cache, or pass cache=False per request.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from urllib.parse import urlencode, urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from parsers.parse_nfl_boxscore import is_boxscore_final
+
+# Sentinel TTL for entries that never expire
+CACHE_FOREVER = None
+
+DEFAULT_HTTP_CACHE_PATH = os.path.join('api_cache', 'http_cache.sqlite3')
+DEFAULT_HTTP_CACHE_MAX_MB = 512
+
+# Response headers kept with cached bodies
+_STORED_HEADERS = ('Content-Type', 'ETag', 'Last-Modified', 'Date')
+
+def http_cache_enabled() -> bool:
+    """Check the HTTP_CACHE setting (read per call so values loaded from .env apply)."""
+    return os.getenv('HTTP_CACHE', '1').lower() not in ('0', 'false', 'no', 'off')
+
+
+TtlPolicy = Union[None, float, Callable[[str, Dict[str, Any], requests.Response], Optional[float]]]
+
+
+def _boxscore_ttl(url: str, params: Dict[str, Any], response: requests.Response) -> Optional[float]:
+    """Keep boxscores of finished games forever and in-progress ones for a minute."""
+    try:
+        data = response.json()
+    except ValueError:
+        return 0
+
+    if is_boxscore_final(data):
+        return CACHE_FOREVER
+
+    # Not marked final: treat games that kicked off more than a day ago as final
+    header = data.get('header') or data.get('boxscore', {}).get('header') or {}
+    competitions = header.get('competitions') or [{}]
+    game_date = header.get('gameDate') or header.get('date') or competitions[0].get('date')
+    if game_date:
+        try:
+            kickoff = datetime.fromisoformat(str(game_date).replace('Z', '+00:00'))
+            if kickoff.tzinfo is None:
+                kickoff = kickoff.replace(tzinfo=timezone.utc)
+            if kickoff < datetime.now(timezone.utc) - timedelta(days=1):
+                return CACHE_FOREVER
+        except ValueError:
+            pass
+
+    return 60
+
+
+# Month of the following year by which a season, its playoffs and bowl games are over
+SEASON_OVER_MONTH = 3
+
+
+def _season_ttl(url: str, params: Dict[str, Any], response: requests.Response) -> Optional[float]:
+    """
+    Keep finished seasons forever and the current season for six hours.
+
+    A season's playoffs and bowl games run into January and February of the
+    next year, so the year only counts as finished from March of year + 1.
+    """
+    try:
+        year = int(params.get('year'))
+    except (TypeError, ValueError):
+        return 6 * 3600
+    season_over = datetime(year + 1, SEASON_OVER_MONTH, 1) <= datetime.now()
+    return CACHE_FOREVER if season_over else 6 * 3600
+
+
+# Substring of the URL path -> TTL in seconds (CACHE_FOREVER never expires, 0 disables caching)
+DEFAULT_TTL_POLICIES: List[Tuple[str, TtlPolicy]] = [
+    ('/nfl-boxscore', _boxscore_ttl),
+    ('/nfl-weeks-events', _season_ttl),
+    ('/games/players', _season_ttl),
+    ('/projections', 120),
+    ('/over_under_lines', 120),
+]
+
+
+class HttpCache:
+    """SQLite-backed GET response cache with TTL policies, revalidation and an LRU cap."""
+
+    def __init__(self, cache_path: Optional[str] = None,
+                 max_bytes: Optional[int] = None,
+                 ttl_policies: Optional[List[Tuple[str, TtlPolicy]]] = None,
+                 default_ttl: TtlPolicy = 0):
+        """
+        Initialize the cache, creating the database if needed.
+
+        Args:
+            cache_path: SQLite database file (defaults to HTTP_CACHE_PATH or api_cache/http_cache.sqlite3)
+            max_bytes: Cap on total cached body size; least recently used entries are evicted
+                (defaults to HTTP_CACHE_MAX_MB megabytes)
+            ttl_policies: (path substring, TTL) pairs checked in order (defaults to DEFAULT_TTL_POLICIES)
+            default_ttl: TTL for URLs no policy matches (0 = not cached)
+        """
+        if cache_path is None:
+            cache_path = os.getenv('HTTP_CACHE_PATH', DEFAULT_HTTP_CACHE_PATH)
+        if max_bytes is None:
+            max_bytes = int(float(os.getenv('HTTP_CACHE_MAX_MB', DEFAULT_HTTP_CACHE_MAX_MB)) * 1024 * 1024)
+        self.cache_path = cache_path
+        self.max_bytes = max_bytes
+        self.ttl_policies = DEFAULT_TTL_POLICIES if ttl_policies is None else ttl_policies
+        self.default_ttl = default_ttl
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(cache_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(cache_path, timeout=30, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    url TEXT NOT NULL,
+                    status INTEGER NOT NULL,
+                    headers TEXT NOT NULL,
+                    body BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    stored_at REAL NOT NULL,
+                    expires_at REAL,
+                    last_access REAL NOT NULL
+                )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses (last_access)")
+
+    @staticmethod
+    def make_key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Build the cache key for a GET request from its URL and sorted query parameters."""
+        query = urlencode(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+        return hashlib.sha256(f"GET {url}?{query}".encode('utf-8')).hexdigest()
+
+    def ttl_for(self, url: str, params: Dict[str, Any], response: requests.Response) -> Optional[float]:
+        """
+        Resolve the TTL for a response from the endpoint policies.
+
+        Returns:
+            Seconds to keep the entry, CACHE_FOREVER (None), or 0 to skip caching
+        """
+        path = urlsplit(url).path
+        policy = self.default_ttl
+        for pattern, ttl in self.ttl_policies:
+            if pattern in path:
+                policy = ttl
+                break
+        return policy(url, params, response) if callable(policy) else policy
+
+    def fetch(self, url: str, params: Optional[Dict[str, Any]],
+              send: Callable[[Dict[str, str]], requests.Response]) -> requests.Response:
+        """
+        Serve a GET request from the cache, revalidating or fetching as needed.
+
+        Args:
+            url: Request URL
+            params: Query parameters
+            send: Performs the real request given extra (conditional) headers
+
+        Returns:
+            requests.Response; cached responses have from_cache set to True
+        """
+        params = params or {}
+        key = self.make_key(url, params)
+        now = time.time()
+        entry = self._load(key)
+
+        # Step 1: Fresh entry
+        if entry and (entry['expires_at'] is None or entry['expires_at'] > now):
+            self._touch(key, now)
+            return self._to_response(url, entry)
+
+        # Step 2: Stale entry with validators -> conditional request
+        validators = {}
+        if entry:
+            if entry['headers'].get('ETag'):
+                validators['If-None-Match'] = entry['headers']['ETag']
+            if entry['headers'].get('Last-Modified'):
+                validators['If-Modified-Since'] = entry['headers']['Last-Modified']
+
+        response = send(validators)
+
+        if response.status_code == 304 and entry:
+            cached = self._to_response(url, entry)
+            self._refresh(key, self.ttl_for(url, params, cached), now)
+            return cached
+
+        # Step 3: Store successful responses the policy allows
+        if response.status_code == 200:
+            ttl = self.ttl_for(url, params, response)
+            if ttl is CACHE_FOREVER or ttl > 0:
+                self._store(key, url, response, ttl, now)
+
+        response.from_cache = False
+        return response
+
+    def _load(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status, headers, body, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        headers = dict(line.split(': ', 1) for line in row[1].splitlines() if ': ' in line)
+        return {'status': row[0], 'headers': headers, 'body': row[2], 'expires_at': row[3]}
+
+    def _touch(self, key: str, now: float) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+
+    def _refresh(self, key: str, ttl: Optional[float], now: float) -> None:
+        expires_at = None if ttl is CACHE_FOREVER else now + ttl
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE responses SET stored_at = ?, expires_at = ?, last_access = ? WHERE key = ?",
+                (now, expires_at, now, key)
+            )
+
+    def _store(self, key: str, url: str, response: requests.Response,
+               ttl: Optional[float], now: float) -> None:
+        body = response.content
+        headers = '\n'.join(f"{name}: {response.headers[name]}"
+                            for name in _STORED_HEADERS if name in response.headers)
+        expires_at = None if ttl is CACHE_FOREVER else now + ttl
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, url, status, headers, body, size, stored_at, expires_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, url, response.status_code, headers, sqlite3.Binary(body), len(body), now, expires_at, now)
+            )
+            self._evict()
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until the total size fits max_bytes (lock held)."""
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        for key, size in self._conn.execute(
+                "SELECT key, size FROM responses ORDER BY last_access").fetchall():
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    @staticmethod
+    def _to_response(url: str, entry: Dict[str, Any]) -> requests.Response:
+        response = requests.Response()
+        response.status_code = entry['status']
+        response.reason = 'OK'
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        response._content = bytes(entry['body'])
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers) or 'utf-8'
+        response.url = url
+        response.from_cache = True
+        return response
+
+    def clear(self) -> None:
+        """Delete every cached response."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
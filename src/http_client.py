@@ -0,0 +1,171 @@
+"""
+Football Prop Insights - Pooled HTTP Client
+
+Thin wrapper around a keep-alive requests.Session shared by every fetcher in
+api_client, so repeated calls to the same API reuse warm TCP/TLS
+connections instead of opening a new one per request. GET responses go
+through the on-disk HttpCache unless HTTP_CACHE=0, and requests that reach
+the network are paced by the cross-process RateGovernor and retried under
+a shared RetryPolicy with a per-host circuit breaker.
+"""
+
+import os
+import threading
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.http_cache import HttpCache, http_cache_enabled
+from src.rate_limit import RateGovernor, get_rate_governor, provider_for_url
+from src.retry import CircuitBreakerRegistry, RetryPolicy
+
+# Connections kept alive per host (urllib3 keeps one pool per host)
+HTTP_POOL_MAXSIZE = int(os.getenv('HTTP_POOL_MAXSIZE', '10'))
+
+# Default request timeout in seconds
+HTTP_TIMEOUT = 30
+
+# Headers sent with every request unless a caller overrides them
+HTTP_DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
+    'Accept': 'application/json'
+}
+
+
+class HttpClient:
+    """Pooled keep-alive HTTP client with shared headers and per-host connection limits."""
+
+    def __init__(self, pool_maxsize: int = HTTP_POOL_MAXSIZE, pool_connections: int = 10,
+                 headers: Optional[Dict[str, str]] = None,
+                 host_limits: Optional[Dict[str, int]] = None,
+                 cache: Optional[HttpCache] = None,
+                 governor: Optional[RateGovernor] = None,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 breakers: Optional[CircuitBreakerRegistry] = None):
+        """
+        Initialize the client and its session.
+
+        Args:
+            pool_maxsize: Connections kept alive per host
+            pool_connections: Number of host pools to cache
+            headers: Default headers (defaults to HTTP_DEFAULT_HEADERS)
+            host_limits: Hard cap on concurrent connections per host, e.g.
+                {'nfl-api-data.p.rapidapi.com': 4}; extra requests wait for a free connection
+            cache: Response cache for GET requests (None disables caching)
+            governor: Shared per-provider rate/quota limiter (None disables it)
+            retry_policy: Retry policy for transient failures (defaults to RetryPolicy())
+            breakers: Per-host circuit breakers (defaults to a new CircuitBreakerRegistry)
+        """
+        self.pool_maxsize = pool_maxsize
+        self.pool_connections = pool_connections
+        self.cache = cache
+        self.governor = governor
+        self.retry_policy = RetryPolicy() if retry_policy is None else retry_policy
+        self.breakers = CircuitBreakerRegistry() if breakers is None else breakers
+        self.session = requests.Session()
+        self.session.headers.update(HTTP_DEFAULT_HEADERS if headers is None else headers)
+
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        for host, max_connections in (host_limits or {}).items():
+            self.set_host_limit(host, max_connections)
+
+    def set_host_limit(self, host: str, max_connections: int) -> None:
+        """
+        Cap concurrent connections to one host.
+
+        Args:
+            host: Hostname (e.g. 'api.prizepicks.com')
+            max_connections: Maximum open connections; further requests block until one frees up
+        """
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_connections, pool_block=True)
+        self.session.mount(f"https://{host}", adapter)
+        self.session.mount(f"http://{host}", adapter)
+
+    def get(self, url: str, params: Optional[Dict[str, Any]] = None,
+            headers: Optional[Dict[str, str]] = None, timeout: float = HTTP_TIMEOUT,
+            cache: bool = True) -> requests.Response:
+        """
+        Send a GET request over the pooled session, serving it from the cache when possible.
+
+        Args:
+            url: Request URL
+            params: Query parameters
+            headers: Extra headers merged over the defaults
+            timeout: Timeout in seconds
+            cache: Use the response cache for this request (False always hits the network)
+
+        Returns:
+            requests.Response
+
+        Raises:
+            QuotaExceededError: If the provider's daily quota is used up
+            CircuitOpenError: If the host's circuit breaker is open
+            requests.exceptions.RequestException: If the last retry attempt raised
+        """
+        host = urlsplit(url).hostname or ''
+        provider = provider_for_url(url)
+
+        def attempt(validators: Dict[str, str]) -> requests.Response:
+            # Only requests that reach the network count against provider limits
+            if self.governor is not None and provider:
+                self.governor.acquire(provider)
+            return self.session.get(url, params=params, headers={**(headers or {}), **validators},
+                                    timeout=timeout)
+
+        def send(validators: Dict[str, str]) -> requests.Response:
+            return self.retry_policy.call(lambda: attempt(validators), f"GET {host}{urlsplit(url).path}",
+                                          self.breakers.for_host(host))
+
+        if self.cache is None or not cache:
+            return send({})
+
+        return self.cache.fetch(url, params, send)
+
+    def close(self) -> None:
+        """Close the session and its pooled connections."""
+        self.session.close()
+        if self.cache is not None:
+            self.cache.close()
+
+    def __enter__(self) -> 'HttpClient':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+_default_client: Optional[HttpClient] = None
+_default_client_lock = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    """
+    Get the process-wide HTTP client, creating it on first use.
+
+    Returns:
+        Shared HttpClient instance
+    """
+    global _default_client
+    if _default_client is None:
+        # Fetcher threads may race here on first use
+        with _default_client_lock:
+            if _default_client is None:
+                _default_client = HttpClient(cache=HttpCache() if http_cache_enabled() else None,
+                                             governor=get_rate_governor())
+    return _default_client
+
+
+def set_http_client(client: HttpClient) -> None:
+    """
+    Replace the process-wide HTTP client (e.g. with custom pool sizes or host limits).
+
+    Args:
+        client: Client to use for subsequent fetches
+    """
+    global _default_client
+    _default_client = client
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Football Prop Insights - Multi-Source Line Poller
+
+Refreshes the prop board from every configured line source at once:
+PrizePicks NFL, PrizePicks CFB and Underdog. Each source is fetched
+(bypassing the HTTP cache) and diffed on its own thread, so a full
+cross-book refresh takes about as long as the slowest endpoint instead of
+the sum of all of them.
+
+Each source's board is compared with the projection_id -> line_score
+snapshot of the previous poll, and only added or moved lines are parsed.
+The combined delta is written to prop_lines with a single batched insert in
+one transaction. Snapshots are saved only after that write succeeds, so a
+failed write is retried in full by the next poll. A source that fails is
+reported and left out of that poll's write; the other books are still
+written.
+
+Usage:
+    python3 src/line_poller.py --once
+    python3 src/line_poller.py --interval 60 --sources prizepicks_nfl underdog
+"""
+
+import argparse
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+if __package__ in (None, ''):
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from src.api_client import fetch_prizepicks_data, fetch_underdog_data, set_archive_writer
+from src.archive import ArchiveWriter
+from src.pipeline import PARSED_DATA_DIR
+from parsers import (
+    diff_prizepicks_board,
+    diff_underdog_board,
+    load_prizepicks_snapshot,
+    save_prizepicks_snapshot
+)
+from parsers.json_backend import compressed_path
+
+
+class LineSource(NamedTuple):
+    """One book/league feed of the board."""
+    fetch: Callable[[], Dict[str, Any]]
+    diff: Callable[[Any, Dict[str, Optional[float]]], Dict[str, Any]]
+    delta_path: Path
+    snapshot_path: Path
+
+
+LINE_SOURCES: Dict[str, LineSource] = {
+    'prizepicks_nfl': LineSource(lambda: fetch_prizepicks_data('nfl', cache=False), diff_prizepicks_board,
+                                 PARSED_DATA_DIR / "prizepicks" / "nfl_delta.json",
+                                 PARSED_DATA_DIR / "prizepicks" / "nfl_snapshot.json"),
+    'prizepicks_cfb': LineSource(lambda: fetch_prizepicks_data('cfb', cache=False), diff_prizepicks_board,
+                                 PARSED_DATA_DIR / "prizepicks" / "cfb_delta.json",
+                                 PARSED_DATA_DIR / "prizepicks" / "cfb_snapshot.json"),
+    'underdog': LineSource(lambda: fetch_underdog_data(cache=False), diff_underdog_board,
+                           PARSED_DATA_DIR / "underdog" / "lines_delta.json",
+                           PARSED_DATA_DIR / "underdog" / "lines_snapshot.json"),
+}
+
+
+class LinePoller:
+    """Fetches every line source concurrently and writes the combined delta in one transaction."""
+
+    def __init__(self, sources: Optional[List[str]] = None, route: bool = True, archive: bool = True,
+                 router=None, connection=None, writer: Optional[ArchiveWriter] = None):
+        """
+        Initialize the poller.
+
+        Args:
+            sources: Names from LINE_SOURCES to poll (defaults to all of them)
+            route: Write added and moved lines to prop_lines through DataRouter; snapshots
+                are loaded from and saved to disk only when routing (otherwise kept in memory)
+            archive: Write raw boards and each poll's parsed delta as JSON in the background
+            router: DataRouter to use (created on demand when route is True)
+            connection: Optional database connection passed to the router
+            writer: ArchiveWriter to share (one is created when archive is True)
+        """
+        unknown = [name for name in sources or [] if name not in LINE_SOURCES]
+        if unknown:
+            raise ValueError(f"Unknown line sources: {unknown}. Available: {list(LINE_SOURCES)}")
+
+        self.sources = {name: LINE_SOURCES[name] for name in (sources or LINE_SOURCES)}
+        self.route = route
+        self.connection = connection
+        self.router = router
+        self.writer = writer if writer is not None else (ArchiveWriter() if archive else None)
+        self._owns_writer = writer is None and self.writer is not None
+        self._executor = ThreadPoolExecutor(max_workers=len(self.sources), thread_name_prefix='line-poller')
+        # projection_id -> line_score of what the last successful poll wrote, per source
+        self._snapshots: Dict[str, Dict[str, Optional[float]]] = {
+            name: load_prizepicks_snapshot(str(source.snapshot_path)) if route else {}
+            for name, source in self.sources.items()
+        }
+
+        if self.route and self.router is None:
+            from src.database.parser_integration import DataRouter
+            self.router = DataRouter()
+
+    def poll(self) -> Dict[str, Any]:
+        """
+        Refresh the board once from every source, writing only added or moved lines.
+
+        Returns:
+            Dictionary with success (every source fetched and the delta was written),
+            per-source results, record_count (lines written), duration, route_result
+            and route_error
+        """
+        started = time.perf_counter()
+
+        # Step 1: Fetch and diff every source at the same time
+        previous_writer = set_archive_writer(self.writer)
+        try:
+            futures = {name: self._executor.submit(self._poll_source, name, source)
+                       for name, source in self.sources.items()}
+            results = {name: future.result() for name, future in futures.items()}
+        finally:
+            set_archive_writer(previous_writer)
+
+        delta = [record for result in results.values() for record in result.pop('records', [])]
+        snapshots = {name: result.pop('snapshot') for name, result in results.items() if 'snapshot' in result}
+
+        # Step 2: Write the combined delta in one batched transaction
+        route_result, route_error = None, None
+        if self.route and delta:
+            try:
+                route_result = self.router.route_line_board(delta, self.connection)
+            except Exception as e:
+                route_error = str(e)
+                print(f"❌ Board routing failed: {route_error}")
+
+        # Step 3: Advance the snapshots only once their delta is written
+        if route_error is None:
+            for name, snapshot in snapshots.items():
+                self._snapshots[name] = snapshot
+                if self.route:
+                    save_prizepicks_snapshot(snapshot, str(self.sources[name].snapshot_path))
+
+        duration = time.perf_counter() - started
+        slowest = max(results, key=lambda name: results[name]['duration'])
+        succeeded = sum(1 for result in results.values() if result['success'])
+
+        for name, result in results.items():
+            if result['success']:
+                status = (f"{result['added']} added, {result['changed']} moved, "
+                          f"{result['removed']} removed, {result['unchanged']} unchanged")
+            else:
+                status = f"❌ {result['error']}"
+            print(f"   {name}: {status} ({result['duration']:.2f}s)")
+        print(f"📋 Board refreshed: {len(delta)} new or moved lines from {succeeded}/{len(results)} sources "
+              f"in {duration:.2f}s (slowest: {slowest} {results[slowest]['duration']:.2f}s)")
+
+        return {
+            'success': succeeded == len(results) and route_error is None,
+            'sources': results,
+            'record_count': len(delta),
+            'duration': duration,
+            'route_result': route_result,
+            'route_error': route_error
+        }
+
+    def _poll_source(self, name: str, source: LineSource) -> Dict[str, Any]:
+        started = time.perf_counter()
+        try:
+            response = source.fetch()
+            if not response.get('success'):
+                return {'success': False, 'error': response.get('error'), 'record_count': 0,
+                        'duration': time.perf_counter() - started}
+
+            delta = source.diff(response['data'], self._snapshots[name])
+            records = delta['added'] + [change['record'] for change in delta['changed']]
+
+            delta_file = None
+            if self.writer is not None and records:
+                self.writer.write(source.delta_path, records)
+                delta_file = str(compressed_path(source.delta_path, self.writer.compression))
+
+            return {'success': True, 'records': records, 'record_count': len(records),
+                    'added': len(delta['added']), 'changed': len(delta['changed']),
+                    'removed': len(delta['removed']), 'unchanged': delta['unchanged'],
+                    'snapshot': delta['snapshot'], 'delta_file': delta_file,
+                    'duration': time.perf_counter() - started}
+        except Exception as e:
+            return {'success': False, 'error': f"Unexpected error: {e}", 'record_count': 0,
+                    'duration': time.perf_counter() - started}
+
+    def run(self, interval: float = 60.0, iterations: Optional[int] = None,
+            stop_event: Optional[threading.Event] = None) -> None:
+        """
+        Poll repeatedly, starting a refresh every interval seconds.
+
+        Args:
+            interval: Seconds between the starts of consecutive polls
+            iterations: Number of polls (None runs until stopped)
+            stop_event: Event that ends the loop when set
+        """
+        stop_event = stop_event or threading.Event()
+        count = 0
+        while not stop_event.is_set() and (iterations is None or count < iterations):
+            started = time.monotonic()
+            self.poll()
+            count += 1
+            if iterations is None or count < iterations:
+                stop_event.wait(max(0.0, interval - (time.monotonic() - started)))
+
+    def close(self) -> None:
+        """Stop the worker threads and flush archives written by this poller."""
+        self._executor.shutdown(wait=True)
+        if self._owns_writer:
+            self.writer.close()
+
+    def __enter__(self) -> 'LinePoller':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Poll every prop line source concurrently')
+    parser.add_argument('--sources', nargs='*', choices=list(LINE_SOURCES), help='Sources to poll (default: all)')
+    parser.add_argument('--interval', type=float, default=60.0, help='Seconds between polls')
+    parser.add_argument('--once', action='store_true', help='Poll once and exit')
+    parser.add_argument('--no-route', action='store_true', help='Only archive JSON; do not write to the database')
+    args = parser.parse_args()
+
+    with LinePoller(args.sources, route=not args.no_route) as poller:
+        if args.once:
+            result = poller.poll()
+            sys.exit(0 if result['success'] else 1)
+        try:
+            poller.run(args.interval)
+        except KeyboardInterrupt:
+            print("\n🛑 Line poller stopped")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+Football Prop Insights - Mock API Server
+
+Local stand-in for the PrizePicks, Underdog, RapidAPI NFL and
+CollegeFootballData endpoints used by api_client, for load-testing the fetch layer without
+spending real quota. It replays payloads the fetchers have already recorded
+under api_data/ (plain or gzip/zstd-compressed) and can inject latency,
+server errors and 429 responses.
+
+Responses carry an ETag and honor If-None-Match, so cache revalidation can
+be exercised too. Request counts are available at /__stats.
+
+A request without an exact recording gets a 404. With --fallback the server
+answers with another recording of the same endpoint instead, which is
+useful for load tests but means the payload belongs to a different game or
+week than the one requested.
+
+Usage:
+    python3 src/mock_api_server.py --port 8765 --latency 0.2 --error-rate 0.05 --rate-limit-rate 0.1
+
+    export PRIZEPICKS_BASE_URL=http://127.0.0.1:8765/projections
+    export UNDERDOG_BASE_URL=http://127.0.0.1:8765/over_under_lines
+    export RAPIDAPI_BASE_URL=http://127.0.0.1:8765
+    export CFB_API_BASE_URL=http://127.0.0.1:8765
+
+Fetchers save what they download into api_data/, so point --data-dir at a
+copy of the recordings if they should not be overwritten during a run.
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+if __package__ in (None, ''):
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from parsers.json_backend import glob_json_files, json_loads, open_json_file, resolve_json_file
+
+# PrizePicks league_id -> recording name prefix
+PRIZEPICKS_LEAGUES = {'9': 'nfl', '15': 'cfb'}
+
+
+class MockApiServer:
+    """Threaded HTTP server replaying recorded API payloads with injected faults."""
+
+    def __init__(self, data_dir: str = 'api_data', host: str = '127.0.0.1', port: int = 0,
+                 latency: float = 0.0, jitter: float = 0.0, error_rate: float = 0.0,
+                 rate_limit_rate: float = 0.0, retry_after: float = 1.0,
+                 fallback: bool = False, seed: Optional[int] = None):
+        """
+        Initialize the server (call start() or serve_forever() to run it).
+
+        Args:
+            data_dir: Directory of recordings in the api_data/ layout
+            host: Interface to bind
+            port: Port to bind (0 picks a free one)
+            latency: Seconds added to every response
+            jitter: Extra random latency, uniform in [0, jitter]
+            error_rate: Fraction of requests answered with HTTP 503
+            rate_limit_rate: Fraction of requests answered with HTTP 429
+            retry_after: Retry-After value sent with 429 responses
+            fallback: Serve another recording of the same endpoint when the exact one is missing
+                (load tests only; the payload then belongs to a different request)
+            seed: Random seed for reproducible fault injection
+        """
+        self.data_dir = Path(data_dir)
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.fallback = fallback
+        self.stats: Counter = Counter()
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._payloads: Dict[Path, Tuple[Any, bytes, str]] = {}
+        self._thread: Optional[threading.Thread] = None
+
+        handler = type('MockApiHandler', (_MockApiHandler,), {'mock': self})
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running server."""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> str:
+        """
+        Serve requests on a background thread.
+
+        Returns:
+            Base URL of the server
+        """
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name='mock-api-server', daemon=True)
+        self._thread.start()
+        return self.url
+
+    def serve_forever(self) -> None:
+        """Serve requests on the calling thread until interrupted."""
+        self.httpd.serve_forever()
+
+    def stop(self) -> None:
+        """Stop serving and close the socket."""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> 'MockApiServer':
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+    def draw_fault(self) -> Optional[int]:
+        """Pick an injected status code for one request, or None to serve normally."""
+        with self._lock:
+            roll = self._random.random()
+            delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay:
+            time.sleep(delay)
+        if roll < self.rate_limit_rate:
+            return 429
+        if roll < self.rate_limit_rate + self.error_rate:
+            return 503
+        return None
+
+    def resolve(self, path: str, params: Dict[str, str]) -> Tuple[Optional[Path], Optional[str]]:
+        """
+        Map a request to its recording.
+
+        Args:
+            path: Request path
+            params: Query parameters (first value of each)
+
+        Returns:
+            (recording path or None, glob pattern for fallback recordings of the endpoint)
+        """
+        if path.endswith('/projections'):
+            league = PRIZEPICKS_LEAGUES.get(params.get('league_id', ''), 'nfl')
+            return self.data_dir / 'prizepicks' / f"{league}_projections.json", 'prizepicks/*_projections.json'
+        if path.endswith('/over_under_lines'):
+            return self.data_dir / 'underdog' / 'over_under_lines.json', 'underdog/*.json'
+        if path.endswith('/nfl-weeks-events'):
+            name = f"games_{params.get('year')}_week{params.get('week')}_type{params.get('type')}.json"
+            return self.data_dir / 'nfl_stats' / name, 'nfl_stats/games_*.json'
+        if path.endswith('/nfl-boxscore'):
+            return self.data_dir / 'nfl_boxscore' / f"boxscore_{params.get('id')}.json", 'nfl_boxscore/boxscore_[0-9]*.json'
+        if path.endswith('/games/players'):
+            name = f"players_{params.get('year')}_week{params.get('week')}_{params.get('seasonType')}.json"
+            return self.data_dir / 'cfb_stats' / name, 'cfb_stats/players_*.json'
+        return None, None
+
+    def load(self, path: Path, pattern: Optional[str]) -> Optional[Tuple[Any, bytes, str]]:
+        """Load a recording (or a fallback for the same endpoint) as (data, body, etag)."""
+        path = resolve_json_file(path)
+        if not path.exists() and self.fallback and pattern:
+            directory, _, file_pattern = pattern.rpartition('/')
+            path = next(iter(glob_json_files(self.data_dir / directory, file_pattern)), path)
+        if not path.exists():
+            return None
+
+        with self._lock:
+            cached = self._payloads.get(path)
+        if cached is None:
+            # Serve the decompressed JSON whatever the archive format
+            with open_json_file(path) as f:
+                body = f.read()
+            cached = (json_loads(body), body, f'"{hashlib.sha1(body).hexdigest()}"')
+            with self._lock:
+                self._payloads[path] = cached
+        return cached
+
+
+def paginate_projections(data: Dict[str, Any], params: Dict[str, str]) -> Dict[str, Any]:
+    """Slice a recorded PrizePicks board into the requested page."""
+    projections = data.get('data', [])
+    per_page = max(1, int(params.get('per_page') or len(projections) or 1))
+    page = max(1, int(params.get('page') or 1))
+    total_pages = max(1, -(-len(projections) // per_page))
+
+    page_data = dict(data)
+    page_data['data'] = projections[(page - 1) * per_page:page * per_page]
+    page_data['meta'] = dict(data.get('meta') or {}, current_page=page, total_pages=total_pages)
+    return page_data
+
+
+class _MockApiHandler(BaseHTTPRequestHandler):
+    mock: MockApiServer = None
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def _send(self, status: int, body: bytes = b'', headers: Optional[Dict[str, str]] = None) -> None:
+        with self.mock._lock:
+            self.mock.stats[status] += 1
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        parts = urlsplit(self.path)
+        params = {key: values[0] for key, values in parse_qs(parts.query).items()}
+
+        if parts.path == '/__stats':
+            with self.mock._lock:
+                stats = {str(status): count for status, count in self.mock.stats.items()}
+            self._send(200, json.dumps(stats).encode('utf-8'), {'Content-Type': 'application/json'})
+            return
+
+        # Step 1: Injected latency and faults
+        fault = self.mock.draw_fault()
+        if fault == 429:
+            self._send(429, b'{"message": "Too many requests"}',
+                       {'Content-Type': 'application/json', 'Retry-After': str(self.mock.retry_after)})
+            return
+        if fault:
+            self._send(fault, b'{"message": "Service unavailable"}', {'Content-Type': 'application/json'})
+            return
+
+        # Step 2: Find the recording
+        recording, pattern = self.mock.resolve(parts.path, params)
+        payload = self.mock.load(recording, pattern) if recording else None
+        if payload is None:
+            self._send(404, json.dumps({'message': f"No recording for {self.path}"}).encode('utf-8'),
+                       {'Content-Type': 'application/json'})
+            return
+
+        data, body, etag = payload
+        if parts.path.endswith('/projections') and 'page' in params:
+            body = json.dumps(paginate_projections(data, params)).encode('utf-8')
+            etag = f'"{hashlib.sha1(body).hexdigest()}"'
+
+        # Step 3: Conditional request support
+        if self.headers.get('If-None-Match') == etag:
+            self._send(304, headers={'ETag': etag})
+            return
+
+        self._send(200, body, {'Content-Type': 'application/json', 'ETag': etag})
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Replay recorded API payloads with injected latency and faults')
+    parser.add_argument('--data-dir', default='api_data', help='Recordings directory (default: api_data)')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', type=float, default=0.0, help='Seconds added to every response')
+    parser.add_argument('--jitter', type=float, default=0.0, help='Extra random latency up to this many seconds')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of requests answered with 503')
+    parser.add_argument('--rate-limit-rate', type=float, default=0.0, help='Fraction of requests answered with 429')
+    parser.add_argument('--retry-after', type=float, default=1.0, help='Retry-After seconds sent with 429s')
+    parser.add_argument('--fallback', action='store_true',
+                        help='Serve another recording of the endpoint instead of 404 (load tests only)')
+    parser.add_argument('--seed', type=int, help='Random seed for reproducible faults')
+    args = parser.parse_args()
+
+    server = MockApiServer(args.data_dir, args.host, args.port, args.latency, args.jitter, args.error_rate,
+                           args.rate_limit_rate, args.retry_after, args.fallback, args.seed)
+    print(f"🧪 Mock API server replaying {args.data_dir}/ at {server.url}")
+    print(f"   export PRIZEPICKS_BASE_URL={server.url}/projections")
+    print(f"   export UNDERDOG_BASE_URL={server.url}/over_under_lines")
+    print(f"   export RAPIDAPI_BASE_URL={server.url}")
+    print(f"   export CFB_API_BASE_URL={server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n🛑 Mock API server stopped")
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,267 @@
+"""
+Football Prop Insights - In-Process Fetch -> Parse -> Route Pipeline
+
+Hands each fetched API payload straight to its parser and the parsed records
+straight to DataRouter, without re-reading anything from disk. Raw payloads
+(api_data/) and parsed records (parsed_data/) are still archived, but on a
+background ArchiveWriter thread off the hot path.
+
+Usage:
+    from src.pipeline import DataPipeline
+
+    with DataPipeline() as pipeline:
+        pipeline.run_prizepicks('nfl')
+        pipeline.run_cfb_stats(2023, 1, 'regular')
+"""
+
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set, Union
+
+from parsers import (
+    parse_prizepicks_data,
+    parse_nfl_game_ids,
+    parse_nfl_boxscore,
+    parse_cfb_player_stats,
+    is_boxscore_final
+)
+from parsers.game_catalog import get_game_catalog
+from parsers.json_backend import compressed_path
+
+from .archive import ArchiveWriter
+from .api_client import (
+    fetch_prizepicks_data,
+    fetch_nfl_game_ids,
+    fetch_nfl_boxscore,
+    fetch_cfb_player_data,
+    set_archive_writer
+)
+
+PARSED_DATA_DIR = Path("parsed_data")
+
+
+class DataPipeline:
+    """Runs fetch -> parse -> route in one process with background archiving."""
+
+    def __init__(self, route: bool = True, archive: bool = True, router=None,
+                 connection=None, writer: Optional[ArchiveWriter] = None):
+        """
+        Initialize the pipeline.
+
+        Args:
+            route: Send parsed records to the database through DataRouter
+            archive: Write raw and parsed JSON archives in the background
+            router: DataRouter to use (created on demand when route is True)
+            connection: Optional database connection passed to the router
+            writer: ArchiveWriter to share (one is created when archive is True)
+        """
+        self.route = route
+        self.connection = connection
+        self.router = router
+        self.writer = writer if writer is not None else (ArchiveWriter() if archive else None)
+        self._owns_writer = writer is None and self.writer is not None
+        # Pooled psycopg2 connections are not thread-safe; serialize routing across threads
+        self._route_lock = threading.Lock()
+
+        if self.route and self.router is None:
+            from .database.parser_integration import DataRouter
+            self.router = DataRouter()
+
+    def run_prizepicks(self, league: str = 'nfl') -> Dict[str, Any]:
+        """Fetch, parse and route PrizePicks projections for a league ('nfl' or 'cfb')."""
+        return self._run(
+            f"PrizePicks {league.upper()}",
+            lambda: fetch_prizepicks_data(league),
+            parse_prizepicks_data,
+            PARSED_DATA_DIR / "prizepicks" / f"{league.lower()}_parsed.json",
+            'route_prizepicks_data'
+        )
+
+    def run_nfl_game_ids(self, year: int = 2023, week: int = 1, type_param: int = 2) -> Dict[str, Any]:
+        """Fetch, parse and route the NFL game IDs for a week."""
+        return self._run(
+            "NFL Game IDs",
+            lambda: fetch_nfl_game_ids(year, week, type_param),
+            lambda data: parse_nfl_game_ids(data, week=week, year=year, game_type=type_param),
+            PARSED_DATA_DIR / "nfl_stats" / f"games_{year}_week{week}_type{type_param}_parsed.json",
+            'route_nfl_game_ids_data'
+        )
+
+    def run_nfl_boxscore(self, event_id: Union[str, int], year: Optional[int] = None,
+                         week: Optional[int] = None, type_param: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Fetch, parse and route one NFL boxscore.
+
+        When routing, the game is marked in games_processed (with is_final from
+        the boxscore status) in the same transaction as its stats. year, week
+        and type_param default to the game catalog entry for the game.
+        """
+        def processed_game(data: Dict[str, Any], records: List[Dict[str, Any]]) -> Dict[str, Any]:
+            entry = get_game_catalog().get(event_id) or {}
+            game_year = year or entry.get('year') or (records[0].get('season') if records else None)
+            game_week = week or entry.get('week') or (records[0].get('week') if records else None)
+            if game_year is None or game_week is None:
+                return {}
+            return {'processed_game': {
+                'game_id': str(event_id),
+                'week': game_week,
+                'year': game_year,
+                'league': 'nfl',
+                'source': 'RapidAPI',
+                'game_type': type_param or entry.get('type') or 2,
+                'is_final': is_boxscore_final(data)
+            }}
+
+        return self._run(
+            f"NFL Boxscore {event_id}",
+            lambda: fetch_nfl_boxscore(str(event_id)),
+            lambda data: parse_nfl_boxscore(data, game_id=str(event_id)),
+            PARSED_DATA_DIR / "nfl_boxscore" / f"boxscore_{event_id}_parsed.json",
+            'route_nfl_boxscore_data',
+            processed_game
+        )
+
+    def run_nfl_week(self, year: int = 2023, week: int = 1, type_param: int = 2,
+                     incremental: bool = True) -> Dict[str, Any]:
+        """
+        Fetch, parse and route the game IDs and every boxscore of an NFL week.
+
+        Args:
+            year: NFL season year
+            week: Week number
+            type_param: Game type (2 = regular season)
+            incremental: Skip games already marked final in games_processed (requires routing)
+
+        Returns:
+            Dictionary with success, game_ids, skipped game IDs and per-game results
+        """
+        games_result = self.run_nfl_game_ids(year, week, type_param)
+        if not games_result['success']:
+            return {'success': False, 'error': games_result['error'], 'game_ids': [], 'skipped': [], 'games': {}}
+
+        game_ids = [str(game_id) for game_id in games_result['records'].get('game_ids', [])]
+        processed = self.processed_game_ids(year, week) if incremental else set()
+        skipped = [game_id for game_id in game_ids if game_id in processed]
+        if skipped:
+            print(f"⏭️  Skipping {len(skipped)}/{len(game_ids)} games already processed")
+
+        games = {
+            game_id: self.run_nfl_boxscore(game_id, year, week, type_param)
+            for game_id in game_ids if game_id not in processed
+        }
+        return {
+            'success': all(result['success'] for result in games.values()),
+            'error': None,
+            'game_ids': game_ids,
+            'skipped': skipped,
+            'games': games
+        }
+
+    def processed_game_ids(self, year: int, week: int) -> Set[str]:
+        """Final NFL games of a week already in games_processed (empty when not routing)."""
+        if not self.route:
+            return set()
+        with self._route_lock:
+            return self.router.get_processed_game_ids('nfl', year, week)
+
+    def run_cfb_stats(self, year: int = 2023, week: int = 1, season_type: str = 'regular') -> Dict[str, Any]:
+        """Fetch, parse and route College Football player stats for a week."""
+        return self._run(
+            "CFB Stats",
+            lambda: fetch_cfb_player_data(year, week, season_type),
+            parse_cfb_player_stats,
+            PARSED_DATA_DIR / "cfb_stats" / f"players_{year}_week{week}_{season_type}_parsed.json",
+            'route_cfb_stats_data'
+        )
+
+    def _run(self, label: str, fetch: Callable[[], Dict[str, Any]],
+             parse: Callable[[Any], Union[List[Dict[str, Any]], Dict[str, Any]]],
+             parsed_path: Path, route_method: str,
+             route_kwargs: Optional[Callable[[Any, Any], Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """
+        Run one fetch -> parse -> route pass.
+
+        Args:
+            label: Name used in console output
+            fetch: Zero-argument api_client fetcher call
+            parse: Parser accepting the fetched payload object
+            parsed_path: Destination of the parsed archive
+            route_method: DataRouter method name for the parsed records
+            route_kwargs: Builds extra route_method keyword arguments from (payload, parsed records)
+
+        Returns:
+            Dictionary with success, error, record_count, records, parsed_file and route_result
+        """
+        # Step 1: Fetch; raw archives go through the background writer
+        previous_writer = set_archive_writer(self.writer)
+        try:
+            fetch_result = fetch()
+        finally:
+            set_archive_writer(previous_writer)
+
+        if not fetch_result.get('success') or fetch_result.get('data') is None:
+            return {
+                'success': False,
+                'error': fetch_result.get('error', 'No data returned'),
+                'record_count': 0,
+                'records': None,
+                'parsed_file': None,
+                'route_result': None
+            }
+
+        # Step 2: Parse the payload object directly
+        try:
+            parsed = parse(fetch_result['data'])
+        except Exception as e:
+            print(f"❌ {label} parsing error: {e}")
+            return {
+                'success': False,
+                'error': f"Parsing failed: {e}",
+                'record_count': 0,
+                'records': None,
+                'parsed_file': None,
+                'route_result': None
+            }
+
+        record_count = len(parsed['game_ids']) if isinstance(parsed, dict) else len(parsed)
+
+        # Step 3: Archive parsed records in the background
+        parsed_file = None
+        if self.writer is not None:
+            self.writer.write(parsed_path, parsed)
+            parsed_file = str(compressed_path(parsed_path, self.writer.compression))
+            print(f"📊 Parsed {record_count} {label} records → {parsed_file}")
+        else:
+            print(f"📊 Parsed {record_count} {label} records")
+
+        # Step 4: Route straight to the database
+        route_result = None
+        if self.route:
+            extra = route_kwargs(fetch_result['data'], parsed) if route_kwargs else {}
+            with self._route_lock:
+                route_result = getattr(self.router, route_method)(parsed, self.connection, **extra)
+            print(f"🗄️  Routed {label}: {route_result}")
+
+        return {
+            'success': True,
+            'error': None,
+            'record_count': record_count,
+            'records': parsed,
+            'parsed_file': parsed_file,
+            'route_result': route_result
+        }
+
+    def close(self) -> None:
+        """Wait for pending archive writes and release the writer if owned."""
+        if self.writer is None:
+            return
+        if self._owns_writer:
+            self.writer.close()
+        else:
+            self.writer.flush()
+
+    def __enter__(self) -> 'DataPipeline':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
@@ -0,0 +1,293 @@
+"""
+Football Prop Insights - Request Rate Limiting
+
+SQLite-backed RateGovernor that keeps concurrent API fetches under each
+provider's requests-per-second limit (e.g. the RapidAPI plan) and daily
+quota across every process sharing the same database file.
+
+Limits and paths are read from the environment when the governor is
+built, so values loaded from .env after this module is imported still apply.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from datetime import date
+from typing import Any, Dict, NamedTuple, Optional, Set, Tuple
+from urllib.parse import urlsplit
+
+
+class QuotaExceededError(Exception):
+    """Raised when a provider's daily request quota is used up."""
+
+
+class ProviderLimit(NamedTuple):
+    """Request limits for one API provider."""
+    requests_per_second: float
+    daily_quota: Optional[int] = None
+
+
+DEFAULT_RATE_GOVERNOR_PATH = os.path.join('api_cache', 'rate_governor.sqlite3')
+
+
+def _optional_int(value: Optional[str]) -> Optional[int]:
+    return int(value) if value else None
+
+
+def provider_limits() -> Dict[str, ProviderLimit]:
+    """
+    Get the limits shared by every process from the environment.
+
+    Daily quotas are unlimited unless set.
+
+    Returns:
+        Dictionary of provider -> ProviderLimit
+    """
+    return {
+        'rapidapi': ProviderLimit(float(os.getenv('RAPIDAPI_REQUESTS_PER_SECOND', '5')),
+                                  _optional_int(os.getenv('RAPIDAPI_DAILY_QUOTA'))),
+        'cfbd': ProviderLimit(float(os.getenv('CFB_REQUESTS_PER_SECOND', '5')),
+                              _optional_int(os.getenv('CFB_DAILY_QUOTA'))),
+        'prizepicks': ProviderLimit(float(os.getenv('PRIZEPICKS_REQUESTS_PER_SECOND', '2'))),
+        'underdog': ProviderLimit(float(os.getenv('UNDERDOG_REQUESTS_PER_SECOND', '2'))),
+    }
+
+
+# Hostname suffix -> provider
+PROVIDER_HOSTS = {
+    'rapidapi.com': 'rapidapi',
+    'api.collegefootballdata.com': 'cfbd',
+    'api.prizepicks.com': 'prizepicks',
+    'api.underdogfantasy.com': 'underdog',
+}
+
+
+# Endpoint path suffix -> provider, for requests sent to a base-URL override
+# (e.g. src/mock_api_server.py), where the host does not identify the provider
+PROVIDER_PATHS = {
+    '/projections': 'prizepicks',
+    '/nfl-weeks-events': 'rapidapi',
+    '/nfl-boxscore': 'rapidapi',
+    '/games/players': 'cfbd',
+    '/over_under_lines': 'underdog',
+}
+
+# Environment variables holding base-URL overrides; read per call so overrides
+# set after import (e.g. by a load test) still apply
+BASE_URL_OVERRIDE_VARS = ('PRIZEPICKS_BASE_URL', 'UNDERDOG_BASE_URL', 'RAPIDAPI_BASE_URL', 'CFB_API_BASE_URL')
+
+
+def _override_origins() -> Set[Tuple[str, str]]:
+    """Get the (scheme, host:port) of every configured base-URL override."""
+    origins = set()
+    for name in BASE_URL_OVERRIDE_VARS:
+        value = os.getenv(name)
+        if value:
+            parts = urlsplit(value)
+            origins.add((parts.scheme, parts.netloc))
+    return origins
+
+
+def provider_for_url(url: str) -> Optional[str]:
+    """
+    Map a request URL to its provider name.
+
+    Known provider hosts are matched by hostname. Requests to a base-URL
+    override are matched by endpoint path, so a mock server is paced like
+    the API it stands in for.
+
+    Args:
+        url: Request URL
+
+    Returns:
+        Provider name, or None for hosts without limits
+    """
+    parts = urlsplit(url)
+    host = parts.hostname or ''
+    for suffix, provider in PROVIDER_HOSTS.items():
+        if host.endswith(suffix):
+            return provider
+
+    if (parts.scheme, parts.netloc) in _override_origins():
+        for path, provider in PROVIDER_PATHS.items():
+            if parts.path.endswith(path):
+                return provider
+    return None
+
+
+class RateGovernor:
+    """Cross-process rate and daily quota limiter backed by a shared SQLite file."""
+
+    def __init__(self, db_path: Optional[str] = None,
+                 limits: Optional[Dict[str, ProviderLimit]] = None):
+        """
+        Initialize the governor, creating the database if needed.
+
+        Args:
+            db_path: SQLite file shared by all processes (defaults to RATE_GOVERNOR_PATH
+                or api_cache/rate_governor.sqlite3)
+            limits: Per-provider limits (defaults to provider_limits())
+        """
+        db_path = db_path or os.getenv('RATE_GOVERNOR_PATH', DEFAULT_RATE_GOVERNOR_PATH)
+        self.db_path = db_path
+        self.limits = provider_limits() if limits is None else limits
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # Autocommit mode so transactions are controlled with explicit BEGIN IMMEDIATE
+        self._conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False, isolation_level=None)
+        with self._lock:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS provider_buckets (
+                    provider TEXT PRIMARY KEY,
+                    tokens REAL NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+            """)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS provider_usage (
+                    provider TEXT NOT NULL,
+                    day TEXT NOT NULL,
+                    requests INTEGER NOT NULL,
+                    PRIMARY KEY (provider, day)
+                )
+            """)
+
+    def acquire(self, provider: str) -> float:
+        """
+        Block until the provider's shared bucket allows one request and record it.
+
+        Args:
+            provider: Provider name from the limits table; unknown providers pass through
+
+        Returns:
+            Seconds spent waiting
+
+        Raises:
+            QuotaExceededError: If the provider's daily quota is used up
+        """
+        limit = self.limits.get(provider)
+        if limit is None:
+            return 0.0
+
+        capacity = max(1.0, limit.requests_per_second)
+        waited = 0.0
+        while True:
+            with self._lock:
+                wait_time = self._try_acquire(provider, limit, capacity)
+            if wait_time == 0:
+                return waited
+            time.sleep(wait_time)
+            waited += wait_time
+
+    def _try_acquire(self, provider: str, limit: ProviderLimit, capacity: float) -> float:
+        """Take a token in one locked transaction; return 0 on success or the time to wait."""
+        today = date.today().isoformat()
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            if limit.daily_quota is not None:
+                row = self._conn.execute(
+                    "SELECT requests FROM provider_usage WHERE provider = ? AND day = ?", (provider, today)
+                ).fetchone()
+                if row and row[0] >= limit.daily_quota:
+                    raise QuotaExceededError(
+                        f"{provider} daily quota of {limit.daily_quota} requests used up for {today}"
+                    )
+
+            now = time.time()
+            row = self._conn.execute(
+                "SELECT tokens, updated_at FROM provider_buckets WHERE provider = ?", (provider,)
+            ).fetchone()
+            tokens = capacity if row is None else min(capacity, row[0] + max(0.0, now - row[1]) * limit.requests_per_second)
+
+            if tokens < 1:
+                self._conn.execute("ROLLBACK")
+                return (1 - tokens) / limit.requests_per_second
+
+            self._conn.execute(
+                "INSERT OR REPLACE INTO provider_buckets (provider, tokens, updated_at) VALUES (?, ?, ?)",
+                (provider, tokens - 1, now)
+            )
+            self._conn.execute(
+                "INSERT INTO provider_usage (provider, day, requests) VALUES (?, ?, 1) "
+                "ON CONFLICT (provider, day) DO UPDATE SET requests = requests + 1",
+                (provider, today)
+            )
+            self._conn.execute("COMMIT")
+            return 0.0
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+
+    def usage(self, day: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Get request counts for each provider.
+
+        Args:
+            day: ISO date (defaults to today)
+
+        Returns:
+            Dictionary of provider -> {'requests', 'daily_quota', 'remaining', 'requests_per_second'}
+        """
+        day = day or date.today().isoformat()
+        with self._lock:
+            counts = dict(self._conn.execute(
+                "SELECT provider, requests FROM provider_usage WHERE day = ?", (day,)
+            ).fetchall())
+
+        usage = {}
+        for provider in sorted(set(self.limits) | set(counts)):
+            limit = self.limits.get(provider)
+            requests = counts.get(provider, 0)
+            quota = limit.daily_quota if limit else None
+            usage[provider] = {
+                'requests': requests,
+                'daily_quota': quota,
+                'remaining': None if quota is None else max(0, quota - requests),
+                'requests_per_second': limit.requests_per_second if limit else None,
+            }
+        return usage
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+
+_default_governor: Optional[RateGovernor] = None
+_default_governor_lock = threading.Lock()
+
+
+def get_rate_governor() -> RateGovernor:
+    """
+    Get the process-wide rate governor, creating it on first use.
+
+    Returns:
+        Shared RateGovernor instance
+    """
+    global _default_governor
+    if _default_governor is None:
+        with _default_governor_lock:
+            if _default_governor is None:
+                _default_governor = RateGovernor()
+    return _default_governor
+
+
+def set_rate_governor(governor: Optional[RateGovernor]) -> None:
+    """
+    Replace the process-wide rate governor.
+
+    Args:
+        governor: Governor to use for subsequent fetches
+    """
+    global _default_governor
+    _default_governor = governor
+
+
+if __name__ == "__main__":
+    for name, stats in get_rate_governor().usage().items():
+        quota = stats['daily_quota'] if stats['daily_quota'] is not None else 'unlimited'
+        print(f"{name}: {stats['requests']} requests today (quota {quota}, {stats['requests_per_second']}/s)")
@@ -0,0 +1,236 @@
+"""
+Football Prop Insights - Retry Policy and Circuit Breaker
+
+Shared retry handling for every fetch in api_client. Transient failures
+(timeouts, connection errors, 429 and 5xx responses) are retried with
+exponential backoff and full jitter, honoring Retry-After when the server
+sends one. Other errors are returned to the caller immediately. A per-host
+circuit breaker stops hammering a provider that keeps failing, so the
+remaining games of a backfill fail fast until the cooldown passes.
+"""
+
+import os
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Optional
+
+import requests
+
+# Defaults for the HTTP_MAX_RETRIES, HTTP_BACKOFF_BASE and HTTP_BACKOFF_MAX settings
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_BASE = 1.0
+DEFAULT_BACKOFF_MAX = 60.0
+
+# Status codes worth retrying; anything else is returned as-is
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# Exceptions worth retrying; anything else propagates immediately
+RETRYABLE_EXCEPTIONS = (requests.exceptions.Timeout, requests.exceptions.ConnectionError)
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Raised instead of sending a request while a host's circuit is open."""
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header.
+
+    Args:
+        value: Header value, either delay seconds or an HTTP date
+
+    Returns:
+        Seconds to wait, or None if missing or malformed
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter."""
+
+    def __init__(self, max_retries: Optional[int] = None, backoff_base: Optional[float] = None,
+                 backoff_max: Optional[float] = None):
+        """
+        Initialize the policy; unset arguments are read from the environment.
+
+        Args:
+            max_retries: Retries after the first attempt (0 disables retrying; defaults to HTTP_MAX_RETRIES)
+            backoff_base: Upper bound of the first delay in seconds; doubles every retry
+                (defaults to HTTP_BACKOFF_BASE)
+            backoff_max: Cap on any single delay, including Retry-After (defaults to HTTP_BACKOFF_MAX)
+        """
+        self.max_retries = (int(os.getenv('HTTP_MAX_RETRIES', DEFAULT_MAX_RETRIES))
+                            if max_retries is None else max_retries)
+        self.backoff_base = (float(os.getenv('HTTP_BACKOFF_BASE', DEFAULT_BACKOFF_BASE))
+                             if backoff_base is None else backoff_base)
+        self.backoff_max = (float(os.getenv('HTTP_BACKOFF_MAX', DEFAULT_BACKOFF_MAX))
+                            if backoff_max is None else backoff_max)
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Get the delay before retry number attempt (starting at 1).
+
+        Args:
+            attempt: Retry number
+            retry_after: Server-requested delay, used instead of the computed backoff
+
+        Returns:
+            Seconds to sleep
+        """
+        if retry_after is not None:
+            return min(retry_after, self.backoff_max)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1)))
+
+    def call(self, send: Callable[[], requests.Response], description: str = 'request',
+             breaker: Optional['CircuitBreaker'] = None) -> requests.Response:
+        """
+        Send a request, retrying transient failures.
+
+        Args:
+            send: Performs one attempt
+            description: Label for retry log lines
+            breaker: Circuit breaker for the target host
+
+        Returns:
+            The first non-retryable response, or the last response once retries run out
+
+        Raises:
+            CircuitOpenError: If the breaker is open
+            requests.exceptions.RequestException: If the last attempt raised
+        """
+        attempt = 0
+        while True:
+            if breaker is not None:
+                breaker.before_request()
+
+            try:
+                response = send()
+            except RETRYABLE_EXCEPTIONS as e:
+                if breaker is not None:
+                    breaker.record_failure()
+                if attempt >= self.max_retries:
+                    raise
+                attempt += 1
+                delay = self.backoff(attempt)
+                print(f"🔄 {description} failed ({type(e).__name__}), retry {attempt}/{self.max_retries} in {delay:.1f}s")
+                time.sleep(delay)
+                continue
+            except Exception as e:
+                # Fatal request errors count against the host; local errors (e.g. quota) do not
+                if breaker is not None:
+                    if isinstance(e, requests.exceptions.RequestException):
+                        breaker.record_failure()
+                    else:
+                        breaker.cancel_trial()
+                raise
+
+            if response.status_code not in RETRYABLE_STATUS_CODES:
+                if breaker is not None:
+                    breaker.record_success()
+                return response
+
+            if breaker is not None:
+                breaker.record_failure()
+            if attempt >= self.max_retries:
+                return response
+
+            attempt += 1
+            delay = self.backoff(attempt, parse_retry_after(response.headers.get('Retry-After')))
+            print(f"🔄 {description} returned HTTP {response.status_code}, retry {attempt}/{self.max_retries} in {delay:.1f}s")
+            response.close()
+            time.sleep(delay)
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker for one host."""
+
+    def __init__(self, host: str, failure_threshold: int = 5, cooldown: float = 30.0):
+        """
+        Initialize the breaker closed.
+
+        Args:
+            host: Hostname, used in error messages
+            failure_threshold: Consecutive failed attempts that open the circuit
+            cooldown: Seconds to stay open before letting a trial request through
+        """
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        with self._lock:
+            return self._opened_at is not None
+
+    def before_request(self) -> None:
+        """
+        Check whether a request may be sent.
+
+        Raises:
+            CircuitOpenError: While open, or while a half-open trial request is in flight
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return
+            remaining = self._opened_at + self.cooldown - time.monotonic()
+            if remaining > 0 or self._trial_in_flight:
+                raise CircuitOpenError(
+                    f"Circuit open for {self.host} after {self._failures} consecutive failures"
+                    f" (retry in {max(remaining, 0):.0f}s)"
+                )
+            # Half-open: let one trial request through
+            self._trial_in_flight = True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def cancel_trial(self) -> None:
+        """Release a half-open trial slot without recording an outcome."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._trial_in_flight or self._failures >= self.failure_threshold:
+                if self._opened_at is None:
+                    print(f"⛔ Circuit opened for {self.host} after {self._failures} consecutive failures")
+                self._opened_at = time.monotonic()
+                self._trial_in_flight = False
+
+
+class CircuitBreakerRegistry:
+    """Lazily created circuit breakers keyed by host."""
+
+    def __init__(self, failure_threshold: int = 5, cooldown: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def for_host(self, host: str) -> CircuitBreaker:
+        """Get the breaker for host, creating it on first use."""
+        with self._lock:
+            breaker = self._breakers.get(host)
+            if breaker is None:
+                breaker = CircuitBreaker(host, self.failure_threshold, self.cooldown)
+                self._breakers[host] = breaker
+            return breaker
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Behavior checks for the shared HTTP layer: retry policy, circuit breaker
+and on-disk response cache.
+
+Runs without network access: requests are answered by local fakes and
+sleeps are recorded instead of waited out.
+
+Usage:
+    python3 src/test_http_layer.py
+"""
+
+import io
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+from unittest import mock
+
+import requests
+
+# Add the project root to Python path for imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.retry import CircuitBreaker, CircuitOpenError, RetryPolicy, parse_retry_after
+from src.http_cache import HttpCache
+
+failures: List[str] = []
+
+
+def check(condition: bool, description: str) -> None:
+    """Print one check result and remember failures."""
+    print(f"{'✅' if condition else '❌'} {description}")
+    if not condition:
+        failures.append(description)
+
+
+def make_response(status_code: int, body: bytes = b'{}', headers: Optional[Dict[str, str]] = None) -> requests.Response:
+    """Build a requests.Response without sending anything."""
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = body
+    response.raw = io.BytesIO(body)
+    response.headers.update(headers or {})
+    return response
+
+
+def test_retry_policy():
+    """Retry counts, non-retryable statuses and Retry-After handling."""
+    print("🔄 TESTING RETRY POLICY")
+    print("=" * 40)
+
+    # parse_retry_after: delay seconds, HTTP dates and junk
+    check(parse_retry_after('7') == 7.0, "Retry-After seconds are parsed")
+    check(parse_retry_after('-3') == 0.0, "Negative Retry-After is clamped to 0")
+    check(parse_retry_after('soon') is None and parse_retry_after(None) is None,
+          "Malformed or missing Retry-After gives None")
+    http_date = time.strftime('%a, %d %b %Y %H:%M:%S GMT', time.gmtime(time.time() + 30))
+    delay = parse_retry_after(http_date)
+    check(delay is not None and 25 <= delay <= 31, f"Retry-After HTTP date is converted to a delay ({delay})")
+
+    with mock.patch.dict(os.environ, {'HTTP_MAX_RETRIES': '5', 'HTTP_BACKOFF_MAX': '9'}):
+        from_env = RetryPolicy()
+    check(from_env.max_retries == 5 and from_env.backoff_max == 9.0,
+          "Unset arguments are read from the environment when the policy is built")
+
+    policy = RetryPolicy(max_retries=3, backoff_base=1.0, backoff_max=10.0)
+    check(policy.backoff(1, retry_after=4.0) == 4.0, "Retry-After replaces the computed backoff")
+    check(policy.backoff(1, retry_after=120.0) == 10.0, "Retry-After is capped at backoff_max")
+    check(all(0 <= policy.backoff(attempt) <= min(10.0, 2 ** (attempt - 1)) for attempt in range(1, 8)),
+          "Jittered backoff stays under the doubling cap")
+
+    with mock.patch('src.retry.time.sleep') as sleep:
+        # Retryable status every time: first attempt + max_retries retries
+        calls = []
+        response = policy.call(lambda: calls.append(1) or make_response(503), 'check')
+        check(len(calls) == 4 and response.status_code == 503,
+              f"503 is retried max_retries times ({len(calls)} attempts)")
+
+        # Non-retryable status is returned at once
+        calls = []
+        response = policy.call(lambda: calls.append(1) or make_response(404), 'check')
+        check(len(calls) == 1 and response.status_code == 404, "404 is not retried")
+
+        # 429 with Retry-After, then success
+        sleep.reset_mock()
+        answers = iter([make_response(429, headers={'Retry-After': '2'}), make_response(200)])
+        response = policy.call(lambda: next(answers), 'check')
+        check(response.status_code == 200 and sleep.call_args_list == [mock.call(2.0)],
+              "429 waits for Retry-After before retrying")
+
+        # Timeouts are retried, then re-raised
+        calls = []
+
+        def timeout():
+            calls.append(1)
+            raise requests.exceptions.Timeout('slow')
+
+        try:
+            policy.call(timeout, 'check')
+            raised = False
+        except requests.exceptions.Timeout:
+            raised = True
+        check(raised and len(calls) == 4, f"Timeouts are retried and then raised ({len(calls)} attempts)")
+
+
+def test_circuit_breaker():
+    """Opening, half-open trial requests and cancel_trial."""
+    print("\n\n⛔ TESTING CIRCUIT BREAKER")
+    print("=" * 40)
+
+    breaker = CircuitBreaker('example.test', failure_threshold=2, cooldown=0.05)
+    breaker.record_failure()
+    check(not breaker.is_open, "One failure below the threshold keeps the circuit closed")
+    breaker.record_failure()
+    check(breaker.is_open, "Reaching the failure threshold opens the circuit")
+
+    try:
+        breaker.before_request()
+        blocked = False
+    except CircuitOpenError:
+        blocked = True
+    check(blocked, "Requests are refused while open")
+
+    time.sleep(0.06)
+    breaker.before_request()
+    try:
+        breaker.before_request()
+        second_blocked = False
+    except CircuitOpenError:
+        second_blocked = True
+    check(second_blocked, "Half-open lets exactly one trial request through")
+
+    breaker.cancel_trial()
+    try:
+        breaker.before_request()
+        released = True
+    except CircuitOpenError:
+        released = False
+    check(released, "cancel_trial frees the trial slot without reopening")
+
+    breaker.record_failure()
+    try:
+        breaker.before_request()
+        reopened = False
+    except CircuitOpenError:
+        reopened = True
+    check(reopened, "A failed trial reopens the circuit for another cooldown")
+
+    time.sleep(0.06)
+    breaker.before_request()
+    breaker.record_success()
+    check(not breaker.is_open, "A successful trial closes the circuit")
+
+    # The policy refuses to send while the breaker is open
+    breaker = CircuitBreaker('example.test', failure_threshold=1, cooldown=60)
+    with mock.patch('src.retry.time.sleep'):
+        RetryPolicy(max_retries=0).call(lambda: make_response(500), 'check', breaker)
+    calls = []
+    try:
+        RetryPolicy(max_retries=0).call(lambda: calls.append(1) or make_response(200), 'check', breaker)
+    except CircuitOpenError:
+        pass
+    check(not calls, "RetryPolicy.call does not send while the circuit is open")
+
+
+def test_http_cache():
+    """TTL policies, expiry and 304 revalidation."""
+    print("\n\n💾 TESTING HTTP CACHE")
+    print("=" * 40)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = HttpCache(str(Path(tmp) / 'cache.sqlite3'),
+                          ttl_policies=[('/long', 3600), ('/short', 0.05), ('/never', 0)])
+        sent: List[Dict[str, str]] = []
+
+        def sender(status_code: int, body: bytes = b'{"v": 1}'):
+            def send(headers: Dict[str, str]) -> requests.Response:
+                sent.append(headers)
+                return make_response(status_code, body, {'ETag': '"v1"'})
+            return send
+
+        url = 'https://api.example.test'
+        first = cache.fetch(url + '/long', {'week': 1}, sender(200))
+        second = cache.fetch(url + '/long', {'week': 1}, sender(200))
+        check(not first.from_cache and second.from_cache and len(sent) == 1,
+              "Fresh entries are served without a request")
+        check(second.json() == {'v': 1}, "Cached body round-trips")
+
+        cache.fetch(url + '/long', {'week': 2}, sender(200))
+        check(len(sent) == 2, "Different query parameters are cached separately")
+
+        sent.clear()
+        cache.fetch(url + '/never', None, sender(200))
+        cache.fetch(url + '/never', None, sender(200))
+        check(len(sent) == 2, "TTL 0 endpoints are never cached")
+
+        sent.clear()
+        cache.fetch(url + '/short', None, sender(200))
+        time.sleep(0.06)
+        revalidated = cache.fetch(url + '/short', None, sender(304, b''))
+        check(sent[-1].get('If-None-Match') == '"v1"', "Expired entries are revalidated with their ETag")
+        check(revalidated.from_cache and revalidated.json() == {'v': 1},
+              "A 304 serves the cached body")
+        requests_before = len(sent)
+        cache.fetch(url + '/short', None, sender(200))
+        check(len(sent) == requests_before, "A 304 refreshes the entry's TTL")
+
+        time.sleep(0.06)
+        replaced = cache.fetch(url + '/short', None, sender(200, b'{"v": 2}'))
+        check(not replaced.from_cache and replaced.json() == {'v': 2}, "A 200 on revalidation replaces the entry")
+
+        cache.close()
+
+
+def run_all_tests():
+    """Run all HTTP layer checks."""
+    print("🌐 FOOTBALL PROP INSIGHTS - HTTP LAYER CHECKS")
+    print("=" * 60)
+
+    test_retry_policy()
+    test_circuit_breaker()
+    test_http_cache()
+
+    print("\n\n" + "=" * 60)
+    if failures:
+        print(f"❌ {len(failures)} check(s) failed")
+        sys.exit(1)
+    print("🎉 All HTTP layer checks passed")
+
+
+if __name__ == "__main__":
+    run_all_tests()